@@ -262,6 +262,7 @@ function renderNews(filter) {
         <a href="${item.链接}" target="_blank" class="news-card">
             <div class="card-source ${getSourceClass(item.来源)}">${item.来源}</div>
             <div class="card-title">${item.标题}</div>
+            ${item.同类报道 ? `<div class="card-meta">同类报道：${item.同类报道.map(other => other.来源).join('、')}</div>` : ''}
             <div class="card-meta">🕒 ${item.日期}</div>
         </a>
     `).join('');
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+关键词匹配基准测试
+对比预编译的 KeywordMatcher 与原来逐个关键词的循环在相同内容上的耗时，并校验结果一致
+
+用法:
+    # 默认使用 output/news.json 中的条目
+    python3 scripts/bench_keyword_matcher.py [news.json ...] [--repeat 200]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# 添加脚本目录到路径
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+import enrich
+import update_summary
+from chinese_youtube_monitor import ChineseYouTubeMonitor
+from translation_memory import SEED_TRANSLATIONS
+
+DEFAULT_SAMPLES = script_dir.parent / "output" / "news.json"
+
+
+# ---- 原来的实现 ----
+
+def legacy_topic_labels(text):
+    """逐个主题 re.search（原 YouTube 摘要 / generate_summary_html）"""
+    return [label for pattern, label in enrich.TOPICS.items() if re.search(pattern, text, re.IGNORECASE)]
+
+
+def legacy_entities(text):
+    """逐个实体各做一次整词 re.search（英文名称区分大小写，中文名和别名不区分）"""
+    boundary = r"(?<![A-Za-z0-9_])%s(?![A-Za-z0-9_])"
+    names = [name for name in enrich.ENTITY_NAMES if re.search(boundary % re.escape(name), text)]
+    aliases = [name for alias, name in enrich.ALIAS_MATCHER.keyword_labels.items()
+               if re.search(boundary % re.escape(alias), text.lower())]
+    return names + aliases
+
+
+def legacy_translate(title):
+    """每个关键词各编译一次正则并依次替换（translate_title）"""
+    result = title
+    for en, zh in update_summary.TITLE_KEYWORDS.items():
+        result = re.sub(r'\b' + en + r'\b', zh, result, flags=re.IGNORECASE)
+    return result
+
+
+def legacy_is_ai_related(text):
+    text = text.lower()
+    return any(keyword.lower() in text for keyword in ChineseYouTubeMonitor.AI_KEYWORDS)
+
+
+def legacy_should_exclude(text):
+    return any(pattern in text for pattern in ChineseYouTubeMonitor.EXCLUDE_PATTERNS)
+
+
+def load_texts(paths):
+    """条目的 "标题 内容" 文本和标题；没有样本时使用种子翻译的英文标题"""
+    texts, titles = [], []
+    for path in paths:
+        if not path.exists():
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                title = item.get("原标题") or item.get("标题", "")
+                titles.append(title)
+                texts.append(f"{title} {item.get('内容', '')}")
+    if not titles:
+        titles = list(SEED_TRANSLATIONS)
+        texts = list(titles)
+    return texts, titles
+
+
+def time_it(func, inputs, repeat: int) -> float:
+    """返回处理全部输入一遍的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in inputs:
+            func(value)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def bench(texts, titles, repeat: int):
+    cases = [
+        ("主题", texts, legacy_topic_labels, enrich.TOPIC_MATCHER.labels),
+        ("实体", texts,
+         lambda text: sorted(set(legacy_entities(text))),
+         lambda text: sorted(enrich.entity_labels(text))),
+        ("标题关键词翻译", titles, legacy_translate, update_summary.TITLE_KEYWORD_MATCHER.replace),
+        ("is_ai_related", texts, legacy_is_ai_related, ChineseYouTubeMonitor.AI_MATCHER.search),
+        ("should_exclude", texts, legacy_should_exclude, ChineseYouTubeMonitor.EXCLUDE_MATCHER.search),
+    ]
+
+    print(f"{len(titles)} 条样本，每项重复 {repeat} 次")
+    print(f"{'匹配':<16} {'循环(ms)':>10} {'matcher(ms)':>12} {'加速':>7}  结果")
+    total_slow = total_fast = 0.0
+    for name, inputs, slow, fast in cases:
+        mismatches = sum(slow(value) != fast(value) for value in inputs)
+        check = "一致" if not mismatches else f"{mismatches} 条不一致"
+
+        slow_ms = time_it(slow, inputs, repeat)
+        fast_ms = time_it(fast, inputs, repeat)
+        total_slow += slow_ms
+        total_fast += fast_ms
+        print(f"{name:<16} {slow_ms:>10.2f} {fast_ms:>12.2f} {slow_ms / max(fast_ms, 1e-9):>6.1f}x  {check}")
+
+    print(f"{'合计':<16} {total_slow:>10.2f} {total_fast:>12.2f} {total_slow / max(total_fast, 1e-9):>6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="关键词匹配基准测试")
+    parser.add_argument("files", nargs="*", help="news.json 格式的条目文件")
+    parser.add_argument("--repeat", type=int, default=200, help="每项重复次数")
+    args = parser.parse_args()
+
+    paths = [Path(f) for f in args.files] or [DEFAULT_SAMPLES]
+    texts, titles = load_texts(paths)
+    bench(texts, titles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+YouTube Atom 解析器基准测试
+对比 youtube_atom 快速解析器与 feedparser 在录制的 feed 上的耗时，并校验结果一致
+
+用法:
+    # 录制当前频道 feed 到 data/feed_samples/
+    python3 scripts/bench_youtube_atom.py --record
+
+    # 在录制的 feed 上跑基准（未指定文件时使用 data/feed_samples/*.xml，
+    # 目录为空时使用合成的示例 feed）
+    python3 scripts/bench_youtube_atom.py [feed.xml ...] [--hours 72] [--repeat 50]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 添加脚本目录到路径
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+import feedparser
+import youtube_atom
+from fetchers import _youtube_entries_from_feedparser
+from source_registry import BUILTIN_SOURCES, sources_of_type
+
+SAMPLES_DIR = script_dir.parent / "data" / "feed_samples"
+
+
+def synthetic_feed(entry_count: int = 15) -> bytes:
+    """生成与 YouTube videos.xml 结构一致的示例 feed（按发布时间倒序，每 12 小时一条）"""
+    now = datetime.now(timezone.utc)
+    entries = []
+    for i in range(entry_count):
+        published = (now - timedelta(hours=12 * i)).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        entries.append(f"""
+ <entry>
+  <id>yt:video:vid{i:08d}</id>
+  <yt:videoId>vid{i:08d}</yt:videoId>
+  <yt:channelId>UCsample</yt:channelId>
+  <title>Sample video {i}: building AI agents with Claude and GPT</title>
+  <link rel="alternate" href="https://www.youtube.com/watch?v=vid{i:08d}"/>
+  <author><name>Sample</name><uri>https://www.youtube.com/channel/UCsample</uri></author>
+  <published>{published}</published>
+  <updated>{published}</updated>
+  <media:group>
+   <media:title>Sample video {i}</media:title>
+   <media:content url="https://www.youtube.com/v/vid{i:08d}" type="application/x-shockwave-flash" width="640" height="390"/>
+   <media:thumbnail url="https://i.ytimg.com/vi/vid{i:08d}/hqdefault.jpg" width="480" height="360"/>
+   <media:description>{'In this video we walk through an end-to-end AI workflow. ' * 20}</media:description>
+   <media:community>
+    <media:starRating count="{100 + i}" average="5.00" min="1" max="5"/>
+    <media:statistics views="{1000 * (i + 1)}"/>
+   </media:community>
+  </media:group>
+ </entry>""")
+
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">
+ <link rel="self" href="http://www.youtube.com/feeds/videos.xml?channel_id=UCsample"/>
+ <id>yt:channel:UCsample</id>
+ <yt:channelId>UCsample</yt:channelId>
+ <title>Sample</title>
+ <published>2015-01-01T00:00:00+00:00</published>{''.join(entries)}
+</feed>""".encode("utf-8")
+
+
+def record_feeds(output_dir: Path):
+    """下载内置频道 feed 保存为样本"""
+    import http_client
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for spec in sources_of_type(BUILTIN_SOURCES, "youtube"):
+        name = spec.name
+        try:
+            response = http_client.get(spec.url)
+            response.raise_for_status()
+            path = output_dir / f"{''.join(c if c.isalnum() else '_' for c in name)}.xml"
+            path.write_bytes(response.content)
+            print(f"✅ {name} -> {path.name} ({len(response.content):,} bytes)")
+        except Exception as e:
+            print(f"❌ {name}: {e}")
+
+
+def time_it(func, repeat: int) -> float:
+    """返回单次调用的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def bench(samples, hours: int, repeat: int):
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).replace(microsecond=0)
+
+    print(f"{'feed':<30} {'feedparser(ms)':>15} {'fast(ms)':>10} {'加速':>7}  结果")
+    total_slow = total_fast = 0.0
+    for name, content in samples:
+        def slow():
+            return _youtube_entries_from_feedparser(feedparser.parse(content), cutoff)
+
+        def fast():
+            return youtube_atom.parse_youtube_feed(content, cutoff=cutoff, limit=10)
+
+        fast_result = fast()
+        if fast_result is None:
+            check = "回退 feedparser"
+        else:
+            same = [(e["link"], e["title"], e["published"], e["view_count"]) for e in slow()] == \
+                   [(e["link"], e["title"], e["published"], e["view_count"]) for e in fast_result]
+            check = "一致" if same else "不一致"
+
+        slow_ms = time_it(slow, repeat)
+        fast_ms = time_it(fast, repeat)
+        total_slow += slow_ms
+        total_fast += fast_ms
+        print(f"{name[:30]:<30} {slow_ms:>15.2f} {fast_ms:>10.2f} {slow_ms / max(fast_ms, 1e-9):>6.1f}x  {check}")
+
+    print(f"{'合计':<30} {total_slow:>15.2f} {total_fast:>10.2f} {total_slow / max(total_fast, 1e-9):>6.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube Atom 解析器基准测试")
+    parser.add_argument("files", nargs="*", help="录制的 feed 文件")
+    parser.add_argument("--record", action="store_true", help=f"录制当前频道 feed 到 {SAMPLES_DIR}")
+    parser.add_argument("--hours", type=int, default=72, help="时间窗口（小时）")
+    parser.add_argument("--repeat", type=int, default=50, help="每个 feed 重复解析次数")
+    args = parser.parse_args()
+
+    if args.record:
+        record_feeds(SAMPLES_DIR)
+        return
+
+    paths = [Path(f) for f in args.files] or sorted(SAMPLES_DIR.glob("*.xml"))
+    if paths:
+        samples = [(path.name, path.read_bytes()) for path in paths]
+    else:
+        print("未找到录制的 feed，使用合成示例（可先运行 --record 录制）\n")
+        samples = [("synthetic (15 entries)", synthetic_feed())]
+
+    bench(samples, args.hours, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+AI News Aggregator - 本地分类器
+用历史 LLM 分类结果训练的朴素贝叶斯分类器，置信度足够高时代替 LLM 分类
+
+每次 LLM 分类的结果（原始标题、描述、来源、分类）追加到 data/category_labels.jsonl，
+离线训练后模型保存在 data/category_model.json。
+
+用法:
+    python3 scripts/category_classifier.py train
+    python3 scripts/category_classifier.py evaluate [--min-confidence 0.9]
+"""
+
+import argparse
+import json
+import math
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from state_store import DATA_DIR
+from story_cluster import tokenize
+
+LABELS_PATH = DATA_DIR / "category_labels.jsonl"
+MODEL_PATH = DATA_DIR / "category_model.json"
+REPORT_PATH = Path(__file__).parent.parent / "output" / "run_report.json"
+
+DEFAULT_MIN_CONFIDENCE = 0.9   # 后验概率不低于该值时使用本地结果
+MIN_TRAINING_EXAMPLES = 50     # 样本太少时不训练
+DESCRIPTION_CHARS = 300
+EVAL_FOLDS = 5
+
+
+def _features(title: str, content: str = "", source: str = "") -> List[str]:
+    """标题词 + 描述开头的词（带前缀区分）+ 来源"""
+    features = sorted(tokenize(title))
+    features += sorted(f"d:{token}" for token in tokenize((content or "")[:DESCRIPTION_CHARS]))
+    if source:
+        features.append(f"s:{source}")
+    return features
+
+
+def item_features(item: Any) -> List[str]:
+    return _features(item.get("标题", ""), item.get("内容", ""), item.get("来源", ""))
+
+
+class CategoryClassifier:
+    """
+    多项式朴素贝叶斯，特征按 IDF 加权
+
+    每个词在一条样本中最多计一次，权重为 idf，高频的通用词影响较小。
+    """
+
+    def __init__(self):
+        self.labels: List[str] = []
+        self.priors: Dict[str, float] = {}
+        self.idf: Dict[str, float] = {}
+        self.weights: Dict[str, Dict[str, float]] = {}
+        self.totals: Dict[str, float] = {}
+        self.examples = 0
+
+    def train(self, examples: Sequence[Tuple[List[str], str]]) -> "CategoryClassifier":
+        """
+        Args:
+            examples: (特征列表, 分类) 列表
+        """
+        self.examples = len(examples)
+        document_frequency: Counter = Counter()
+        for features, _ in examples:
+            document_frequency.update(set(features))
+        self.idf = {token: math.log((1 + self.examples) / (1 + count)) + 1 for token, count in document_frequency.items()}
+
+        label_counts = Counter(label for _, label in examples)
+        self.labels = sorted(label_counts)
+        self.priors = {label: math.log(count / self.examples) for label, count in label_counts.items()}
+
+        self.weights = {label: {} for label in self.labels}
+        for features, label in examples:
+            weights = self.weights[label]
+            for token in set(features):
+                weights[token] = weights.get(token, 0.0) + self.idf[token]
+        self.totals = {label: sum(weights.values()) for label, weights in self.weights.items()}
+        return self
+
+    def predict(self, features: Iterable[str]) -> Tuple[Optional[str], float]:
+        """
+        Returns:
+            (分类, 后验概率)；模型为空时返回 (None, 0.0)
+        """
+        if not self.labels:
+            return None, 0.0
+
+        tokens = [token for token in set(features) if token in self.idf]
+        vocabulary = len(self.idf)
+        scores = {}
+        for label in self.labels:
+            weights = self.weights[label]
+            denominator = math.log(self.totals[label] + vocabulary)
+            score = self.priors[label]
+            for token in tokens:
+                score += self.idf[token] * (math.log(weights.get(token, 0.0) + 1.0) - denominator)
+            scores[label] = score
+
+        best = max(scores, key=scores.get)
+        top = scores[best]
+        normalizer = sum(math.exp(score - top) for score in scores.values())
+        return best, 1.0 / normalizer
+
+    def predict_item(self, item: Any) -> Tuple[Optional[str], float]:
+        return self.predict(item_features(item))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "examples": self.examples,
+            "labels": self.labels,
+            "priors": self.priors,
+            "idf": self.idf,
+            "weights": self.weights,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CategoryClassifier":
+        model = cls()
+        model.examples = data.get("examples", 0)
+        model.labels = data.get("labels", [])
+        model.priors = data.get("priors", {})
+        model.idf = data.get("idf", {})
+        model.weights = data.get("weights", {})
+        model.totals = {label: sum(weights.values()) for label, weights in model.weights.items()}
+        return model
+
+    def save(self, path: Path = MODEL_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path = MODEL_PATH) -> Optional["CategoryClassifier"]:
+        """读取模型，文件不存在或损坏时返回 None"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 无法加载分类模型 {path.name}: {e}")
+            return None
+
+
+def append_labels(records: Iterable[Dict[str, Any]], path: Path = LABELS_PATH) -> int:
+    """
+    追加 LLM 分类结果
+
+    Args:
+        records: {"标题", "内容", "来源", "链接", "分类"} 列表（标题为翻译前的原标题）
+
+    Returns:
+        写入条数
+    """
+    path = Path(path)
+    lines = []
+    for record in records:
+        if not record.get("分类") or not record.get("标题"):
+            continue
+        lines.append(json.dumps({
+            "标题": record["标题"],
+            "内容": (record.get("内容") or "")[:DESCRIPTION_CHARS],
+            "来源": record.get("来源", ""),
+            "链接": record.get("链接", ""),
+            "分类": record["分类"],
+        }, ensure_ascii=False))
+    if not lines:
+        return 0
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError as e:
+        print(f"⚠️ 分类样本写入失败: {e}")
+        return 0
+    return len(lines)
+
+
+def load_labels(path: Path = LABELS_PATH) -> List[Dict[str, Any]]:
+    """读取分类样本，同一链接只保留最后一次的结果"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    by_key: Dict[str, Dict[str, Any]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            by_key[record.get("链接") or record.get("标题", "")] = record
+    return list(by_key.values())
+
+
+def get_classifier(config: Dict[str, Any]) -> Optional[CategoryClassifier]:
+    """按 llm.local_classifier 配置加载模型（未启用或尚未训练时返回 None）"""
+    if not config.get("enabled", True):
+        return None
+    return CategoryClassifier.load(config.get("model_path") or MODEL_PATH)
+
+
+def train(labels_path: Path = LABELS_PATH, model_path: Path = MODEL_PATH) -> Optional[CategoryClassifier]:
+    """用分类样本训练并保存模型"""
+    records = load_labels(labels_path)
+    if len(records) < MIN_TRAINING_EXAMPLES:
+        print(f"⚠️ 分类样本只有 {len(records)} 条（至少需要 {MIN_TRAINING_EXAMPLES} 条），暂不训练")
+        return None
+
+    model = CategoryClassifier().train([(item_features(record), record["分类"]) for record in records])
+    model.save(model_path)
+    counts = Counter(record["分类"] for record in records)
+    print(f"✅ 已训练分类模型: {len(records)} 条样本，{len(model.idf)} 个特征 → {model_path}")
+    print("   " + "，".join(f"{label} {count}" for label, count in counts.most_common()))
+    return model
+
+
+def _llm_latency(report_path: Path = REPORT_PATH) -> Optional[Dict[str, Any]]:
+    """最近一次运行中 process_batch 阶段的 LLM 耗时"""
+    try:
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        return report["run_aggregator"]["llm"]["stages"]["process_batch"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def evaluate(labels_path: Path = LABELS_PATH, min_confidence: float = DEFAULT_MIN_CONFIDENCE) -> Dict[str, Any]:
+    """
+    交叉验证：与 LLM 分类结果的一致率、阈值下的本地覆盖率，以及两条路径的单条耗时
+
+    Returns:
+        评估结果
+    """
+    records = load_labels(labels_path)
+    if len(records) < EVAL_FOLDS * 2:
+        print(f"⚠️ 分类样本只有 {len(records)} 条，无法评估")
+        return {}
+
+    folds = [zlib.crc32((record.get("链接") or record["标题"]).encode("utf-8")) % EVAL_FOLDS for record in records]
+    features = [item_features(record) for record in records]
+
+    agree = confident = confident_agree = 0
+    per_label: Dict[str, Counter] = {}
+    elapsed = 0.0
+    for fold in range(EVAL_FOLDS):
+        model = CategoryClassifier().train(
+            [(features[i], records[i]["分类"]) for i in range(len(records)) if folds[i] != fold]
+        )
+        for i in (i for i in range(len(records)) if folds[i] == fold):
+            started = time.perf_counter()
+            label, confidence = model.predict(features[i])
+            elapsed += time.perf_counter() - started
+
+            expected = records[i]["分类"]
+            stats = per_label.setdefault(expected, Counter())
+            stats["total"] += 1
+            if label == expected:
+                agree += 1
+                stats["agree"] += 1
+            if confidence >= min_confidence:
+                confident += 1
+                confident_agree += label == expected
+
+    total = len(records)
+    result = {
+        "examples": total,
+        "agreement": agree / total,
+        "min_confidence": min_confidence,
+        "local_coverage": confident / total,
+        "local_agreement": confident_agree / confident if confident else None,
+        "local_ms_per_item": elapsed / total * 1000,
+        "per_label": {label: stats["agree"] / stats["total"] for label, stats in per_label.items()},
+    }
+
+    print(f"📊 分类器评估（{EVAL_FOLDS} 折交叉验证，{total} 条样本）")
+    print(f"   与 LLM 一致率: {result['agreement']:.1%}")
+    local_agreement = f"{result['local_agreement']:.1%}" if confident else "-"
+    print(f"   置信度 ≥ {min_confidence}: 本地处理 {result['local_coverage']:.1%}，其中一致率 {local_agreement}")
+    for label, rate in sorted(result["per_label"].items(), key=lambda pair: -pair[1]):
+        print(f"   - {label}: {rate:.1%}（{per_label[label]['total']} 条）")
+    print(f"   本地分类耗时: {result['local_ms_per_item']:.3f} ms/条")
+
+    llm = _llm_latency()
+    if llm and llm.get("requests"):
+        result["llm_seconds_per_request"] = llm["latency_avg"]
+        print(f"   LLM 耗时: {llm['latency_avg']:.2f} s/请求（最近一次运行的 process_batch 阶段，批量请求包含多条）")
+    else:
+        print("   LLM 耗时: 暂无运行报告（output/run_report.json）")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地分类器训练与评估")
+    parser.add_argument("command", choices=["train", "evaluate"], help="train: 训练模型；evaluate: 交叉验证")
+    parser.add_argument("--labels", default=str(LABELS_PATH), help="分类样本文件")
+    parser.add_argument("--model", default=str(MODEL_PATH), help="模型文件")
+    parser.add_argument("--min-confidence", type=float, default=DEFAULT_MIN_CONFIDENCE, help="使用本地结果的最低置信度")
+    args = parser.parse_args()
+
+    if args.command == "train":
+        train(Path(args.labels), Path(args.model))
+    else:
+        evaluate(Path(args.labels), args.min_confidence)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ AI 内容情报监测员 - YouTube 中文 AI 内容监测
 import os
 import requests
 import json
+import http_client
+from keyword_matcher import KeywordMatcher
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass
@@ -94,6 +96,10 @@ class ChineseYouTubeMonitor:
         "加群", "代写", "刷课", "薅羊毛"
     ]
 
+    # 关键词表在导入时编译
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
+    EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_PATTERNS)
+
     def __init__(self, api_key: Optional[str] = None, config: Optional[Dict] = None):
         """
         初始化监测器
@@ -146,7 +152,7 @@ class ChineseYouTubeMonitor:
         url = f"{self.base_url}/{endpoint}"
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -245,13 +251,11 @@ class ChineseYouTubeMonitor:
 
     def is_ai_related(self, title: str, description: str = "") -> bool:
         """判断视频是否与 AI 相关"""
-        text = f"{title} {description}".lower()
-        return any(keyword.lower() in text for keyword in self.AI_KEYWORDS)
+        return self.AI_MATCHER.search(f"{title} {description}")
 
     def should_exclude(self, title: str, description: str = "") -> bool:
         """判断是否应该排除此视频"""
-        text = f"{title} {description}"
-        return any(pattern in text for pattern in self.EXCLUDE_PATTERNS)
+        return self.EXCLUDE_MATCHER.search(f"{title} {description}")
 
     def check_real_engagement(self, video_id: str, comment_count: int) -> bool:
         """检查是否有真实互动（非机器人）"""
@@ -0,0 +1,172 @@
+"""
+AI News Aggregator - 去重
+抓取之后、LLM 处理之前按规范化链接合并重复内容
+
+同一条新闻常被多个 feed 收录（例如自定义 YouTube 频道与内置频道重叠），
+不去重会为重复内容多付 LLM 调用费用。
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 各站点通用的跟踪参数（不影响页面内容）
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid"}
+TRACKING_PREFIXES = ("utm_",)
+
+# 只在特定站点上是跟踪参数的名称；ref、source、partner 等在其他站点上可能决定页面内容
+HOST_TRACKING_PARAMS = {
+    "youtube.com": {"feature", "si", "pp"},
+    "nytimes.com": {"smid", "smtyp", "partner", "referringsource"},
+    "techcrunch.com": {"guccounter", "guce_referrer", "guce_referrer_sig"},
+    "theverge.com": {"ref"},
+    "reddit.com": {"ref", "ref_source", "share_id"},
+}
+
+# 视为同一站点的主机名
+HOST_ALIASES = {
+    "x.com": "twitter.com",
+    "mobile.twitter.com": "twitter.com",
+    "youtu.be": "youtube.com",
+    "m.youtube.com": "youtube.com",
+    "music.youtube.com": "youtube.com",
+    "old.reddit.com": "reddit.com",
+}
+
+_YOUTUBE_PATH = re.compile(r"^/(?:shorts|embed|live|v)/([\w-]{6,})")
+
+# 合并重复项时取较大值的数值字段
+_MAX_FIELDS = ("播放量", "互动量")
+
+
+def _is_tracking(name: str, host: str = "") -> bool:
+    name = name.lower()
+    return (
+        name in TRACKING_PARAMS
+        or name.startswith(TRACKING_PREFIXES)
+        or name in HOST_TRACKING_PARAMS.get(host, ())
+    )
+
+
+def _youtube_video_id(host: str, path: str, query: List[Tuple[str, str]]) -> Optional[str]:
+    """从各种 YouTube 链接形式中提取视频 ID"""
+    if host == "youtu.be":
+        video_id = path.strip("/").split("/")[0]
+        return video_id or None
+    if path == "/watch":
+        for name, value in query:
+            if name == "v" and value:
+                return value
+        return None
+    match = _YOUTUBE_PATH.match(path)
+    return match.group(1) if match else None
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    规范化链接，用作去重的键
+
+    - scheme 统一为 https，主机名小写并去掉 www. 和默认端口
+    - 去掉 fragment 和跟踪参数（通用跟踪参数，以及各站点已知的跟踪参数），其余参数排序
+    - YouTube 的 youtu.be / shorts / embed / watch?v= 统一为 youtube.com/watch?v=ID
+    - x.com / mobile.twitter.com 统一为 twitter.com，并去掉全部参数
+
+    Args:
+        url: 原始链接
+
+    Returns:
+        规范化后的链接；无法解析时返回去掉首尾空白的原链接
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+
+    host = (parts.hostname or "").lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    if host in ("youtube.com", "youtu.be") or host.endswith(".youtube.com"):
+        video_id = _youtube_video_id(host, parts.path, query)
+        if video_id:
+            return f"https://youtube.com/watch?v={video_id}"
+
+    host = HOST_ALIASES.get(host, host)
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    if host == "twitter.com":
+        # 推文链接的参数都是分享来源标记
+        query = []
+    query = sorted((name, value) for name, value in query if not _is_tracking(name, host))
+
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+class DedupeIndex:
+    """
+    按规范化链接索引内容项
+
+    第一次出现的条目保留，之后的重复项并入其中：缺失的字段从重复项补齐，
+    播放量 / 互动量取较大值；按重复项的来源统计被合并的数量。
+    """
+
+    def __init__(self):
+        self._index: Dict[str, Any] = {}
+        self.items: List[Any] = []
+        self.collapsed: Counter = Counter()
+
+    def add(self, item: Any) -> bool:
+        """加入一条内容，新条目返回 True，与已有条目重复时返回 False"""
+        link = item.get("链接")
+        if not link:
+            self.items.append(item)
+            return True
+
+        key = canonicalize_url(link)
+        kept = self._index.get(key)
+        if kept is None:
+            self._index[key] = item
+            self.items.append(item)
+            return True
+
+        self._merge(kept, item)
+        self.collapsed[item.get("来源", "未知")] += 1
+        return False
+
+    def __contains__(self, link: str) -> bool:
+        return canonicalize_url(link) in self._index
+
+    @staticmethod
+    def _merge(kept: Any, duplicate: Any):
+        for key, value in duplicate.items():
+            if key not in kept:
+                kept[key] = value
+            elif key in _MAX_FIELDS and isinstance(value, int) and value > (kept.get(key) or 0):
+                kept[key] = value
+
+
+def dedupe_items(items: List[Any]) -> Tuple[List[Any], Counter]:
+    """
+    合并重复内容
+
+    Args:
+        items: 内容项列表（NewsItem 或 dict）
+
+    Returns:
+        (去重后的列表（保持原顺序）, 各来源被合并的条数)
+    """
+    index = DedupeIndex()
+    for item in items:
+        index.add(item)
+    return index.items, index.collapsed
@@ -0,0 +1,190 @@
+"""
+AI News Aggregator - 实体与主题标注
+抓取去重后为每条内容识别一次提到的公司、产品、人物和内容主题，写入 "实体" / "主题" 字段
+
+摘要生成、导出和 LLM 预筛选直接读取这两个字段，不再各自扫描标题。
+字段格式为 {名称: 出现位置}（"标题" 或 "内容"，标题优先），可以直接用 in 判断、遍历取名称：
+
+    {"实体": {"OpenAI": "标题", "Claude": "内容"}, "主题": {"AI 编程与开发": "标题"}}
+
+标注在原标题上进行（翻译之前），news.json 中的旧条目缺少字段时按需补上。
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from keyword_matcher import KeywordMatcher
+
+ENTITIES_KEY = "实体"
+TOPICS_KEY = "主题"
+
+TITLE = "标题"
+CONTENT = "内容"
+CONTENT_CHARS = 1000  # 描述只取开头部分
+
+# 公司/组织：名称 → 中文名
+COMPANIES = {
+    "OpenAI": "OpenAI", "Anthropic": "Anthropic", "Google": "谷歌",
+    "Microsoft": "微软", "Apple": "苹果", "Meta": "Meta",
+    "xAI": "xAI", "SpaceX": "SpaceX", "NVIDIA": "英伟达",
+    "Intel": "英特尔", "AMD": "AMD", "Tesla": "特斯拉",
+    "DeepSeek": "DeepSeek", "DeepMind": "DeepMind", "Mistral": "Mistral",
+    "Hugging Face": "Hugging Face", "Perplexity": "Perplexity",
+}
+
+# 产品/模型/平台
+PRODUCTS = {
+    "Claude": "Claude", "ChatGPT": "ChatGPT", "Grok": "Grok",
+    "Gemini": "Gemini", "Copilot": "Copilot", "Llama": "Llama",
+    "Sora": "Sora", "Midjourney": "Midjourney",
+    "Xcode": "Xcode", "Firefox": "火狐浏览器", "Moltbook": "Moltbook",
+    "OpenClaw": "OpenClaw",
+}
+
+# 人物
+PEOPLE = {"Elon Musk": "马斯克", "Sam Altman": "奥特曼"}
+
+# 名称以外的写法，不区分大小写（中文名始终可用）
+ALIASES = {
+    "DeepSeek": ("deepseek",),
+    "DeepMind": ("deepmind",),
+    "Hugging Face": ("huggingface", "hugging face"),
+    "Elon Musk": ("musk",),
+    "Sam Altman": ("altman",),
+}
+
+# 内容主题（子串匹配，"code" 也匹配 "xcode"）
+TOPICS = {
+    # AI 编程/开发
+    "coding|programming|developer|code|xcode|python|javascript|编程": "AI 编程与开发",
+    "agentic|agent|workflow|automation|智能体": "AI 智能体与自动化",
+
+    # AI 工具/应用
+    "tool|app|software|platform|studio": "AI 工具与应用",
+    "tutorial|how to|guide|learn|course|教程": "AI 教程与学习",
+    "tips|tricks|hack|optimization": "AI 技巧与优化",
+
+    # AI 理论/研究
+    "paper|research|study|breakthrough|model|理论|研究": "AI 理论与研究",
+    "deep learning|neural|network|training": "深度学习技术",
+    "llm|language model|gpt|claude|gemini|大模型": "大语言模型",
+
+    # AI 行业/商业
+    "business|agency|entrepreneur|startup|scale|商业|创业": "AI 商业与创业",
+    "future|trend|prediction|roadmap|趋势|展望": "AI 趋势与展望",
+    "money|income|profit|salary|career": "AI 职业与变现",
+
+    # AI 产品/评测
+    "review|test|comparison|best|top": "AI 产品评测",
+    "news|update|release|launch": "AI 新闻动态",
+    "demo|showcase|example|project|演示": "AI 项目演示",
+}
+
+ENTITY_NAMES = {**COMPANIES, **PRODUCTS, **PEOPLE}
+
+
+def _alias_table() -> Dict[str, str]:
+    """{"中文名|别名": 名称}，中文名与名称相同时不重复列出"""
+    table = {}
+    for name, chinese in ENTITY_NAMES.items():
+        aliases = [alias for alias in (chinese,) + ALIASES.get(name, ()) if alias != name]
+        if aliases:
+            table["|".join(aliases)] = name
+    return table
+
+
+# 实体整词匹配（"Intel" 不会命中 "intelligence"）；
+# 英文名称区分大小写，避免 "apple"、"meta" 这类普通单词命中，中文名和别名不区分
+ENTITY_MATCHER = KeywordMatcher({name: name for name in ENTITY_NAMES}, word_boundary=True, case_sensitive=True)
+ALIAS_MATCHER = KeywordMatcher(_alias_table(), word_boundary=True)
+# 主题沿用子串匹配
+TOPIC_MATCHER = KeywordMatcher(TOPICS)
+
+_ENTITY_ORDER = {name: index for index, name in enumerate(ENTITY_NAMES)}
+
+
+def entity_labels(text: str) -> List[str]:
+    """文本中提到的实体名称，按 ENTITY_NAMES 的顺序排列"""
+    found = set(ENTITY_MATCHER.labels(text)).union(ALIAS_MATCHER.labels(text))
+    return sorted(found, key=_ENTITY_ORDER.__getitem__)
+
+
+def _locate(labels: Callable[[str], List[str]], title: str, content: str) -> Dict[str, str]:
+    """命中的标签 → 出现位置（标题中出现的排在前面）"""
+    found = dict.fromkeys(labels(title), TITLE)
+    for label in labels(content):
+        found.setdefault(label, CONTENT)
+    return found
+
+
+def enrich_item(item: Any) -> Any:
+    """
+    识别实体和主题并写入条目
+
+    Args:
+        item: 内容项（NewsItem 或 dict）
+
+    Returns:
+        同一个内容项
+    """
+    title = item.get("标题", "") or ""
+    content = (item.get("内容", "") or "")[:CONTENT_CHARS]
+    item[ENTITIES_KEY] = _locate(entity_labels, title, content)
+    item[TOPICS_KEY] = _locate(TOPIC_MATCHER.labels, title, content)
+    return item
+
+
+def enrich_items(items: Iterable[Any]) -> int:
+    """
+    为尚未标注的条目标注实体和主题
+
+    Returns:
+        本次标注的条数
+    """
+    count = 0
+    for item in items:
+        if ENTITIES_KEY not in item or TOPICS_KEY not in item:
+            enrich_item(item)
+            count += 1
+    return count
+
+
+def entities(item: Any) -> Dict[str, str]:
+    """条目的实体（缺少字段时先标注）"""
+    if ENTITIES_KEY not in item:
+        enrich_item(item)
+    return item[ENTITIES_KEY]
+
+
+def topics(item: Any) -> Dict[str, str]:
+    """条目的主题（缺少字段时先标注）"""
+    if TOPICS_KEY not in item:
+        enrich_item(item)
+    return item[TOPICS_KEY]
+
+
+def collect(items: Iterable[Any], field: str = ENTITIES_KEY, where: Optional[str] = None) -> List[str]:
+    """
+    多条内容的实体或主题，按首次出现的顺序去重
+
+    Args:
+        items: 内容项列表
+        field: "实体" 或 "主题"
+        where: 只取出现在该位置的（"标题" 或 "内容"），默认不限
+    """
+    getter = entities if field == ENTITIES_KEY else topics
+    return list(dict.fromkeys(
+        name for item in items for name, found in getter(item).items()
+        if where is None or found == where
+    ))
+
+
+def group_labels(names: Iterable[str], groups: Mapping[str, Sequence[str]]) -> List[str]:
+    """
+    把实体名称归并为展示用的分组，按 groups 的顺序返回
+
+    Args:
+        names: 实体名称
+        groups: {分组名: 包含的实体名称}，例如 {"Google/Gemini": ("Google", "Gemini")}
+    """
+    names = set(names)
+    return [label for label, members in groups.items() if names.intersection(members)]
@@ -4,9 +4,10 @@ AI News Aggregator - Feishu Output
 """
 
 import os
-import requests
+import http_client
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from news_item import to_dicts
 
 
 class FeishuBitableClient:
@@ -70,7 +71,7 @@ class FeishuBitableClient:
                 "Content-Type": "application/json"
             }
 
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             data = response.json()
 
             if data.get("code") == 0 and "data" in data:
@@ -113,7 +114,7 @@ class FeishuBitableClient:
             "app_secret": self.app_secret
         }
 
-        response = requests.post(url, json=payload)
+        response = http_client.post(url, json=payload)
         data = response.json()
 
         if data.get("code") != 0:
@@ -196,7 +197,7 @@ class FeishuBitableClient:
             }
 
             payload = {"fields": fields}
-            response = requests.post(url, headers=headers, json=payload)
+            response = http_client.post(url, headers=headers, json=payload)
 
             # 检查 HTTP 状态码和 API 响应码
             if response.status_code == 200:
@@ -241,7 +242,7 @@ class FeishuBitableClient:
                 if page_token:
                     params["page_token"] = page_token
 
-                response = requests.get(url, headers=headers, params=params)
+                response = http_client.get(url, headers=headers, params=params)
                 data = response.json()
 
                 items = data.get('data', {}).get('items', [])
@@ -326,7 +327,7 @@ class FeishuBitableClient:
                 "content": {"text": message}
             }
 
-            response = requests.post(url, headers=headers, json=payload)
+            response = http_client.post(url, headers=headers, json=payload)
             data = response.json()
 
             if data.get("code") == 0:
@@ -359,7 +360,7 @@ class FeishuBitableClient:
                 "content": {"text": message}
             }
 
-            response = requests.post(self.webhook_url, json=payload)
+            response = http_client.post(self.webhook_url, json=payload)
             data = response.json()
 
             if data.get("code") == 0 or response.status_code == 200:
@@ -446,7 +447,7 @@ def export_to_json(items: List[Dict[str, Any]], filepath: str) -> bool:
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
 
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+            json.dump(to_dicts(items), f, ensure_ascii=False, indent=2)
 
         print(f"✅ 已导出到 {filepath}")
         return True
@@ -498,6 +499,8 @@ def export_to_markdown(items: List[Dict[str, Any]], filepath: str) -> bool:
                     f.write(f"- **链接**: [{item.get('链接', '')}]({item.get('链接', '')})\n")
                     if "板块" in item:
                         f.write(f"- **板块**: {item['板块']}\n")
+                    if item.get("实体"):
+                        f.write(f"- **实体**: {'、'.join(item['实体'])}\n")
                     f.write("\n")
 
         print(f"✅ 已导出到 {filepath}")
@@ -608,6 +611,8 @@ def export_to_html(items: List[Dict[str, Any]], summary: str, filepath: str) ->
         .card-meta {{ display: flex; justify-content: space-between; align-items: center; font-size: 0.8rem; color: var(--text-muted); }}
         .card-date {{ display: flex; align-items: center; gap: 4px; }}
         .card-link {{ display: inline-flex; align-items: center; gap: 4px; color: var(--accent-blue); text-decoration: none; font-size: 0.8rem; }}
+        .card-also {{ font-size: 0.75rem; color: var(--text-muted); margin-bottom: 10px; }}
+        .card-also a {{ color: var(--accent-blue); text-decoration: none; }}
         @media (max-width: 768px) {{ .header h1 {{ font-size: 1.8rem; }} .news-grid {{ grid-template-columns: 1fr; }} .stats {{ gap: 20px; }} }}
     </style>
 </head>
@@ -648,7 +653,7 @@ def export_to_html(items: List[Dict[str, Any]], summary: str, filepath: str) ->
     </div>
 
     <script>
-        const newsData = {json.dumps(items, ensure_ascii=False)};
+        const newsData = {json.dumps(to_dicts(items), ensure_ascii=False)};
 
         function renderNewsCards(items) {{
             const container = document.getElementById('newsContainer');
@@ -670,9 +675,15 @@ def export_to_html(items: List[Dict[str, Any]], summary: str, filepath: str) ->
                     month: 'short', day: 'numeric', hour: '2-digit', minute: '2-digit'
                 }}) : '';
 
+                // 同一事件的其他来源报道
+                const alsoCovered = (item.同类报道 || []).map(other =>
+                    `<a href="${{other.链接}}" target="_blank" onclick="event.stopPropagation()">${{other.来源}}</a>`
+                ).join('、');
+
                 return `<div class="news-card" onclick="window.open('${{item.链接 || ''}}', '_blank')">
                     <div class="card-source ${{sourceClass}}">${{item.来源 || '未知'}}</div>
                     <div class="card-title">${{item.标题 || '无标题'}}</div>
+                    ${{alsoCovered ? `<div class="card-also">同类报道：${{alsoCovered}}</div>` : ''}}
                     <div class="card-meta">
                         <div class="card-date">🕒 ${{date}}</div>
                         <div class="card-link">阅读原文 →</div>
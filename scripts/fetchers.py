@@ -4,45 +4,311 @@ AI News Aggregator - Data Fetchers
 """
 
 import feedparser
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Callable, Set
 import re
 
+import http_client
+import youtube_atom
+from news_item import NewsItem
+from source_registry import SourceSpec, load_sources, sources_of_type, youtube_channel_source, BUILTIN_SOURCES
+from state_store import FeedValidatorCache, FeedHealthStore, WatermarkStore
+
+
+# 默认最大并发请求数
+DEFAULT_MAX_WORKERS = 8
+# 单个 feed（含重试）的默认截止时间（秒）
+DEFAULT_FEED_TIMEOUT = 20
+# 整个抓取阶段的默认时间预算（秒），需小于 web_server 的 120 秒超时
+DEFAULT_FETCH_BUDGET = 60
+
+
+@dataclass
+class FetchTask:
+    """单个抓取任务（一个 feed URL 或一个账户）"""
+    kind: str   # 日志前缀，如 "RSS"、"YouTube RSS"
+    name: str   # 源名称
+    key: str    # 状态存储使用的键（feed URL / 账户主页）
+    func: Callable[[], List[NewsItem]]
+    timeout: Optional[float] = None        # 覆盖默认的单源截止时间
+    concurrency_class: str = "default"
+    poll_interval: int = 0                 # 最短轮询间隔（分钟）
+
+    @classmethod
+    def for_source(cls, kind: str, spec: SourceSpec, func: Callable[[], List[NewsItem]]) -> "FetchTask":
+        """根据源声明生成任务"""
+        return cls(
+            kind, spec.name, spec.url, func,
+            timeout=spec.timeout,
+            concurrency_class=spec.concurrency_class,
+            poll_interval=spec.poll_interval
+        )
+
+    @property
+    def label(self) -> str:
+        return f"{self.kind} {self.name}"
+
+
+@dataclass
+class FetchStats:
+    """一次抓取的运行统计"""
+    elapsed: float = 0.0
+    completed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    partial: List[str] = field(default_factory=list)   # 超出时间预算未完成的源
+    skipped: List[str] = field(default_factory=list)   # 熔断冷却中跳过的源
+    not_due: List[str] = field(default_factory=list)   # 未到轮询间隔的源
+    incomplete_keys: Set[str] = field(default_factory=set)
+
+    def summary(self) -> str:
+        parts = [
+            f"完成 {len(self.completed)}", f"失败 {len(self.failed)}",
+            f"超时未完成 {len(self.partial)}", f"熔断跳过 {len(self.skipped)}",
+            f"未到轮询时间 {len(self.not_due)}"
+        ]
+        return f"{'，'.join(parts)}，耗时 {self.elapsed:.1f}s"
+
+
+def run_fetch_tasks(
+    tasks: List[FetchTask],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    budget: Optional[float] = None,
+    feed_timeout: Optional[float] = DEFAULT_FEED_TIMEOUT,
+    stats: Optional[FetchStats] = None,
+    health: Optional[FeedHealthStore] = None,
+    class_limits: Optional[Dict[str, int]] = None
+) -> List[NewsItem]:
+    """
+    并发执行抓取任务，按任务顺序合并结果
+
+    单个任务失败只打印错误，不影响其他任务；结果顺序与 tasks 顺序一致，
+    保证下游输出稳定。提交顺序按预估耗时从高到低（历史耗时中位数，
+    没有记录时用任务的截止时间），让慢源尽早开始。
+
+    Args:
+        budget: 整体时间预算（秒）。到期后直接返回已完成任务的结果，
+            未完成的任务记为 partial，后台线程会在各自的截止时间内结束
+        feed_timeout: 单个任务的截止时间（秒），任务内所有请求共享
+        stats: 可选的统计对象，用于记录完成 / 失败 / 超时 / 熔断跳过的源
+        health: 可选的健康记录，熔断中或未到轮询间隔的源直接跳过，其余源记录成败和耗时
+        class_limits: 按并发类别限制同时进行的任务数，如 {"slow": 2}
+    """
+    stats = stats if stats is not None else FetchStats()
+
+    if health is not None:
+        allowed = []
+        for task in tasks:
+            if not health.allow(task.key):
+                stats.skipped.append(task.label)
+            elif not health.is_due(task.key, task.poll_interval):
+                stats.not_due.append(task.label)
+            else:
+                allowed.append(task)
+        tasks = allowed
+
+    if not tasks:
+        return []
+
+    start = time.monotonic()
+    budget_deadline = start + budget if budget else None
+    class_semaphores = {
+        name: threading.BoundedSemaphore(limit) for name, limit in (class_limits or {}).items()
+    }
+
+    def _run(task: FetchTask):
+        semaphore = class_semaphores.get(task.concurrency_class)
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            task_start = time.monotonic()
+            timeout = task.timeout or feed_timeout
+            deadline = task_start + timeout if timeout else None
+            if budget_deadline is not None:
+                deadline = min(deadline, budget_deadline) if deadline is not None else budget_deadline
+            try:
+                with http_client.deadline_scope(deadline):
+                    return task.func(), None, time.monotonic() - task_start
+            except Exception as e:
+                print(f"{task.kind} 获取失败 {task.name}: {e}")
+                return [], e, time.monotonic() - task_start
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def _expected_cost(task: FetchTask) -> float:
+        latency = health.median_latency(task.key) if health is not None else None
+        if latency is not None:
+            return latency
+        return task.timeout or feed_timeout or 0
+
+    workers = max(1, min(max_workers, len(tasks)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [None] * len(tasks)
+    for index in sorted(range(len(tasks)), key=lambda i: _expected_cost(tasks[i]), reverse=True):
+        futures[index] = executor.submit(_run, tasks[index])
+    done, _ = wait(futures, timeout=budget)
+    # 不等待超时任务，尚未开始的任务直接取消
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for task, future in zip(tasks, futures):
+        if future not in done:
+            print(f"⏱️ {task.label} 超出抓取时间预算，本次跳过")
+            stats.partial.append(task.label)
+            stats.incomplete_keys.add(task.key)
+            # 尚未开始的任务不计入健康记录
+            if health is not None and future.running():
+                health.record_failure(task.key, task.label, time.monotonic() - start, "超出抓取时间预算")
+            continue
+
+        items, error, latency = future.result()
+        if error is not None:
+            stats.failed.append(task.label)
+            stats.incomplete_keys.add(task.key)
+            if health is not None:
+                health.record_failure(task.key, task.label, latency, str(error))
+        else:
+            stats.completed.append(task.label)
+            if health is not None:
+                health.record_success(task.key, task.label, latency)
+        results.extend(items)
+
+    stats.elapsed += time.monotonic() - start
+    return results
+
+
+def download_feed(url: str, validator_cache: Optional[FeedValidatorCache] = None):
+    """
+    通过共享 HTTP 会话下载 feed，提供 validator_cache 时使用条件请求
+
+    Returns:
+        Response；服务端返回 304（内容未变化）时返回 None
+    """
+    headers = {}
+    if validator_cache is not None:
+        etag, modified = validator_cache.validators(url)
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+    response = http_client.get(url, headers=headers)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    if validator_cache is not None:
+        validator_cache.update(url, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    return response
+
+
+def parse_feed(url: str, validator_cache: Optional[FeedValidatorCache] = None):
+    """
+    下载并用 feedparser 解析 feed
+
+    Returns:
+        feedparser 结果；服务端返回 304（内容未变化）时返回 None
+    """
+    response = download_feed(url, validator_cache)
+    if response is None:
+        return None
+    return feedparser.parse(response.content, response_headers=dict(response.headers))
+
+
+def recent_entries(entries, cutoff: datetime) -> List[tuple]:
+    """
+    筛选发布时间不早于 cutoff 的 feedparser 条目
+
+    published_parsed 是 UTC 的 struct_time，直接按元组与 cutoff 比较，
+    只为保留的条目构造 datetime。feed 按发布时间倒序时（绝大多数情况）
+    在第一条早于 cutoff 的条目处停止，否则逐条比较。
+
+    Args:
+        entries: feedparser 条目列表
+        cutoff: 带时区的截止时间
+
+    Returns:
+        [(UTC 发布时间, 条目), ...]，保持 feed 顺序
+    """
+    cutoff_stamp = cutoff.astimezone(timezone.utc).timetuple()[:6]
+
+    dated = []
+    for entry in entries:
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        if parsed:
+            dated.append((tuple(parsed[:6]), entry))
+
+    is_sorted = all(newer[0] >= older[0] for newer, older in zip(dated, dated[1:]))
+
+    results = []
+    for stamp, entry in dated:
+        if stamp < cutoff_stamp:
+            if is_sorted:
+                break
+            continue
+        results.append((datetime(*stamp, tzinfo=timezone.utc), entry))
+    return results
+
 
 class RSSFetcher:
     """RSS 订阅源获取器"""
 
-    def __init__(self):
-        self.ai_rss_sources = {
-            "The Verge AI": "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml",
-            "TechCrunch AI": "https://techcrunch.com/category/artificial-intelligence/feed/",
-            "NYT AI": "https://www.nytimes.com/svc/collections/v1/publish/https://www.nytimes.com/spotlight/artificial-intelligence/rss.xml",
-        }
-
-    def fetch(self, hours: int = 24) -> List[Dict[str, Any]]:
+    def __init__(
+        self,
+        validator_cache: Optional[FeedValidatorCache] = None,
+        watermarks: Optional[WatermarkStore] = None,
+        sources: Optional[List[SourceSpec]] = None
+    ):
+        self.validator_cache = validator_cache
+        self.watermarks = watermarks
+        self.sources = sources if sources is not None else sources_of_type(BUILTIN_SOURCES, "rss")
+
+    def fetch(self, hours: int = 24, max_workers: int = DEFAULT_MAX_WORKERS) -> List[NewsItem]:
         """获取最近 N 小时的 AI 新闻"""
-        results = []
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        return run_fetch_tasks(self.build_tasks(hours=hours), max_workers=max_workers)
+
+    def build_tasks(self, hours: int = 24) -> List[FetchTask]:
+        """为每个 RSS 源生成一个抓取任务"""
+        # 截止时间每次运行只计算一次（UTC）
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).replace(microsecond=0)
+        return [
+            FetchTask.for_source("RSS", spec, lambda spec=spec: self._fetch_feed(spec, cutoff))
+            for spec in self.sources
+        ]
 
-        for source, url in self.ai_rss_sources.items():
-            try:
-                feed = feedparser.parse(url)
-                for entry in feed.entries:
-                    # 解析发布时间
-                    pub_time = datetime(*entry.published_parsed[:6])
-                    if pub_time >= cutoff_time:
-                        results.append({
-                            "标题": entry.get('title', ''),
-                            "内容": entry.get('description', ''),
-                            "日期": pub_time.strftime("%Y-%m-%d %H:%M:%S"),
-                            "链接": entry.get('link', ''),
-                            "来源": source,
-                            "板块": "新闻",
-                            "分类": "AI"
-                        })
-            except Exception as e:
-                print(f"RSS 获取失败 {source}: {e}")
+    def _fetch_feed(self, spec: SourceSpec, cutoff: datetime) -> List[NewsItem]:
+        """获取单个 RSS 源"""
+        results = []
+        url = spec.url
+
+        feed = parse_feed(url, self.validator_cache)
+        if feed is None:
+            return results
+
+        for pub_time, entry in recent_entries(feed.entries, cutoff):
+            # 增量模式下跳过上次已处理的条目
+            entry_id = entry.get('id') or entry.get('link', '')
+            if self.watermarks is not None:
+                if not self.watermarks.is_new(url, pub_time, entry_id):
+                    continue
+                self.watermarks.observe(url, pub_time, entry_id)
+
+            results.append(NewsItem(
+                title=entry.get('title', ''),
+                content=entry.get('description', ''),
+                date=pub_time.strftime("%Y-%m-%d %H:%M:%S"),
+                link=entry.get('link', ''),
+                source=spec.name,
+                section="新闻",
+                category="AI"
+            ))
+            if spec.item_limit and len(results) >= spec.item_limit:
+                break
 
         return results
 
@@ -50,180 +316,251 @@ class RSSFetcher:
 class YouTubeFetcher:
     """YouTube 视频获取器（使用 RSS，无需 API Key）"""
 
-    def __init__(self, api_key: Optional[str] = None, custom_channels: Optional[List[str]] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        custom_channels: Optional[List[str]] = None,
+        validator_cache: Optional[FeedValidatorCache] = None,
+        watermarks: Optional[WatermarkStore] = None,
+        sources: Optional[List[SourceSpec]] = None
+    ):
         # 使用 YouTube RSS 订阅源，无需 API Key
         # 这里的 api_key 参数保留用于兼容性，但实际不使用
-
-        # AI 相关频道的 RSS 订阅（使用 user 参数或正确的 channel_id）
-        self.ai_channel_feeds = [
-            ("Google", "https://www.youtube.com/feeds/videos.xml?user=Google"),
-            ("Google for Developers", "https://www.youtube.com/feeds/videos.xml?user=GoogleDevelopers"),
-            ("MIT CSAIL", "https://www.youtube.com/feeds/videos.xml?user=mitcsail"),
-            ("TED", "https://www.youtube.com/feeds/videos.xml?user=TED"),
-        ]
-
-        # AI 博主频道（直接使用 RSS URL）
-        self.ai_blogger_feeds = [
-            ("Tina Huang", "https://www.youtube.com/feeds/videos.xml?channel_id=UC2UXDak6o7rBm23k3Vv5dww"),
-            ("The AI Advantage", "https://www.youtube.com/feeds/videos.xml?channel_id=UC98re_9VsuVfXisV_AnU6Sg"),
-            ("Liam Ottley", "https://www.youtube.com/feeds/videos.xml?channel_id=UCui4jxDaMb53Gdh-AZUTPAg"),
-            ("Andrej Karpathy", "https://www.youtube.com/feeds/videos.xml?channel_id=UCPk8m_nTeFiPrnve3_pS7sg"),
-            ("Dr Alex Young", "https://www.youtube.com/feeds/videos.xml?channel_id=UCf_o982iSIn6A0O8O3_u2-g"),
-            ("DeepLearningAI", "https://www.youtube.com/feeds/videos.xml?channel_id=UCcIXc5mJsHVYTZR1maL5l9w"),
-            ("Two Minute Papers", "https://www.youtube.com/feeds/videos.xml?channel_id=UCbfYPyITQ-7l4upoX8nvctg"),
-            ("AI Explained", "https://www.youtube.com/feeds/videos.xml?channel_id=UCN9v4QG3nuX6Gml406j_uYg"),
+        self.validator_cache = validator_cache
+        self.watermarks = watermarks
+
+        # 频道列表来自源注册表；未传入时使用内置频道
+        self.sources = sources if sources is not None else sources_of_type(BUILTIN_SOURCES, "youtube")
+
+        # 如果提供了自定义频道，转换为 RSS feed 源
+        # 支持用户名格式（如 "Google"）、频道 ID、handle 或完整 RSS URL
+        known_urls = {spec.url.lower() for spec in self.sources}
+        for channel in custom_channels or []:
+            spec = youtube_channel_source(channel, self.sources)
+            if spec.url.lower() not in known_urls:
+                known_urls.add(spec.url.lower())
+                self.sources.append(spec)
+
+    def fetch(self, hours: int = 72, min_views: int = 0, max_workers: int = DEFAULT_MAX_WORKERS) -> List[NewsItem]:
+        """获取最近 N 小时的 AI 视频（使用 RSS，无需 API Key）"""
+        return run_fetch_tasks(self.build_tasks(hours=hours, min_views=min_views), max_workers=max_workers)
+
+    def build_tasks(self, hours: int = 72, min_views: int = 0) -> List[FetchTask]:
+        """为每个频道 feed 生成一个抓取任务"""
+        # 截止时间每次运行只计算一次（UTC）
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).replace(microsecond=0)
+
+        return [
+            FetchTask.for_source(
+                "YouTube RSS", spec,
+                lambda spec=spec: self._fetch_feed(spec, cutoff, min_views)
+            )
+            for spec in self.sources
         ]
 
-        # 如果提供了自定义频道，转换为 RSS feed URL
-        # 支持用户名格式（如 "Google"）或频道 ID
-        if custom_channels:
-            for channel in custom_channels:
-                # 如果是完整的 RSS URL，直接添加
-                if channel.startswith('http'):
-                    # 从 URL 中提取频道 ID 或用户名
-                    if 'channel_id=' in channel:
-                        channel_id = channel.split('channel_id=')[-1]
-                        # 尝试从预定义列表中找到名称
-                        name = "Custom"
-                        for name_template, url in self.ai_blogger_feeds:
-                            if channel_id in url:
-                                name = name_template
-                                break
-                        self.ai_channel_feeds.append((name, channel))
-                    else:
-                        self.ai_channel_feeds.append(("Custom", channel))
-                elif channel.startswith('UC') or channel.startswith('@'):
-                    # 频道 ID 或 handle 格式
-                    param = 'channel_id' if channel.startswith('UC') else 'user'
-                    self.ai_channel_feeds.append(
-                        (f"Channel {channel}", f"https://www.youtube.com/feeds/videos.xml?{param}={channel}")
-                    )
-                else:
-                    # 用户名格式
-                    self.ai_channel_feeds.append(
-                        (f"Channel {channel}", f"https://www.youtube.com/feeds/videos.xml?user={channel}")
-                    )
-
-    def fetch(self, hours: int = 72, min_views: int = 0) -> List[Dict[str, Any]]:
-        """获取最近 N 小时的 AI 视频（使用 RSS，无需 API Key）"""
+    def _fetch_feed(self, spec: SourceSpec, cutoff: datetime, min_views: int) -> List[NewsItem]:
+        """获取单个频道的视频"""
         results = []
+        rss_url = spec.url
+        limit = spec.item_limit
+
+        response = download_feed(rss_url, self.validator_cache)
+        if response is None:
+            return results
+
+        # 优先使用快速解析器（解析到截止时间即停止）；feed 结构异常时回退到 feedparser
+        entries = youtube_atom.parse_youtube_feed(response.content, cutoff=cutoff, limit=limit)
+        if entries is None:
+            feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+            entries = _youtube_entries_from_feedparser(feed, cutoff, limit)
+
+        for entry in entries[:limit]:
+            # 发布时间为带时区的 UTC 时间
+            pub_time = entry["published"]
+
+            # 增量模式下跳过上次已处理的视频
+            entry_id = entry["id"]
+            if self.watermarks is not None and not self.watermarks.is_new(rss_url, pub_time, entry_id):
+                continue
+
+            # YouTube 媒体扩展中的播放量（media:statistics）
+            view_count = entry["view_count"]
+
+            # 只返回播放量达到阈值的视频；未达到的视频不记录，之后播放量上涨时仍可入选
+            if view_count >= min_views or min_views == 0:
+                if self.watermarks is not None:
+                    self.watermarks.observe(rss_url, pub_time, entry_id)
+                results.append(NewsItem(
+                    title=entry["title"],
+                    content=entry["description"][:200] if entry["description"] else '',
+                    date=pub_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    link=entry["link"],
+                    source=f"YouTube - {spec.name}",
+                    section="视频",
+                    views=view_count
+                ))
 
-        # 合并所有频道
-        all_feeds = self.ai_channel_feeds + self.ai_blogger_feeds
+        return results
 
-        for channel_name, rss_url in all_feeds:
-            try:
-                feed = feedparser.parse(rss_url)
-                for entry in feed.entries[:10]:  # 每个频道取最近10条
-                    # YouTube RSS 的 published 时间格式（UTC）
-                    pub_time = datetime(*entry.published_parsed[:6])
-
-                    # 计算时间差（考虑时区）
-                    time_diff = datetime.now() - pub_time
-                    hours_diff = time_diff.total_seconds() / 3600
-
-                    if hours_diff <= hours:
-                        # YouTube 媒体扩展中可能包含播放量信息
-                        view_count = 0
-                        if hasattr(entry, 'yt_statistics'):
-                            yt_stats = entry.get('yt_statistics', {})
-                            view_count = int(yt_stats.get('view_count', 0))
-
-                        # 只返回播放量达到阈值的视频
-                        if view_count >= min_views or min_views == 0:
-                            results.append({
-                                "标题": entry.get('title', ''),
-                                "内容": entry.get('description', '')[:200] if entry.get('description') else '',
-                                "日期": pub_time.strftime("%Y-%m-%d %H:%M:%S"),
-                                "链接": entry.get('link', ''),
-                                "来源": f"YouTube - {channel_name}",
-                                "板块": "视频",
-                                "播放量": view_count
-                            })
 
-            except Exception as e:
-                print(f"YouTube RSS 获取失败 {channel_name}: {e}")
+def _youtube_entries_from_feedparser(feed, cutoff: datetime, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+    """将 feedparser 结果转换为与 youtube_atom 相同的条目格式（只保留截止时间之后的前 limit 条）"""
+    entries = []
+    for pub_time, entry in recent_entries(feed.entries[:limit], cutoff):
+        stats = entry.get('media_statistics') or entry.get('yt_statistics') or {}
+        try:
+            view_count = int(stats.get('views') or stats.get('view_count') or 0)
+        except (TypeError, ValueError):
+            view_count = 0
 
-        return results
+        entries.append({
+            "id": entry.get('id') or entry.get('link', ''),
+            "title": entry.get('title', ''),
+            "link": entry.get('link', ''),
+            "published": pub_time,
+            "description": entry.get('description', ''),
+            "view_count": view_count,
+        })
+    return entries
 
 
 class RedditFetcher:
     """Reddit 帖子获取器"""
 
-    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        sources: Optional[List[SourceSpec]] = None
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
-        self.ai_subreddits = [
-            "artificial",
-            "MachineLearning",
-            "singularity",
-        ]
+        self.sources = sources if sources is not None else sources_of_type(BUILTIN_SOURCES, "reddit")
+        self.ai_subreddits = [spec.handle for spec in self.sources]
 
-    def fetch(self, hours: int = 24, min_upvotes: int = 50) -> List[Dict[str, Any]]:
+    def fetch(self, hours: int = 24, min_upvotes: int = 50) -> List[NewsItem]:
         """获取最近 N 小时且点赞 > N 的 AI 帖子"""
         # 注意: 需要 Reddit API 认证
         # 这里提供简化实现，实际需要完整的 OAuth 流程
         print("Reddit API 需要完整认证，建议使用 PRAW 库")
         return []
 
+    def build_tasks(self, hours: int = 24, min_upvotes: int = 50) -> List[FetchTask]:
+        """Reddit 尚未实现分源抓取，整体作为一个任务"""
+        return [FetchTask("Reddit", "Reddit", "reddit", lambda: self.fetch(hours=hours, min_upvotes=min_upvotes))]
+
 
 class TwitterFetcher:
     """Twitter/X 推文获取器"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        watermarks: Optional[WatermarkStore] = None,
+        sources: Optional[List[SourceSpec]] = None
+    ):
         self.api_key = api_key
+        self.watermarks = watermarks
         self.base_url = "https://api.twitterapi.io/twitter"
 
-        # AI 相关账户
-        self.ai_accounts = [
-            "OpenAI",
-            "GoogleAI",
-            # 可以添加更多账户
-        ]
+        # AI 相关账户（来自源注册表）
+        self.sources = sources if sources is not None else sources_of_type(BUILTIN_SOURCES, "twitter")
 
-    def fetch(self, hours: int = 24) -> List[Dict[str, Any]]:
+    def fetch(self, hours: int = 24, max_workers: int = DEFAULT_MAX_WORKERS) -> List[NewsItem]:
         """获取最近 N 小时的 AI 推文"""
         if not self.api_key:
             print("Twitter API key 未配置，跳过")
             return []
 
+        return run_fetch_tasks(self.build_tasks(hours=hours), max_workers=max_workers)
+
+    def build_tasks(self, hours: int = 24) -> List[FetchTask]:
+        """为每个账户生成一个抓取任务"""
+        if not self.api_key:
+            print("Twitter API key 未配置，跳过")
+            return []
+
+        # 截止时间每次运行只计算一次（UTC）
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).replace(microsecond=0)
+        return [
+            FetchTask.for_source("Twitter", spec, lambda spec=spec: self._fetch_account(spec, cutoff))
+            for spec in self.sources
+        ]
+
+    def _fetch_account(self, spec: SourceSpec, cutoff: datetime) -> List[NewsItem]:
+        """获取单个账户的推文"""
         results = []
+        account = spec.handle
         headers = {"Authorization": f"Bearer {self.api_key}"}
 
-        for account in self.ai_accounts:
-            try:
-                url = f"{self.base_url}/user/last_tweets"
-                params = {"username": account, "limit": 10}
-
-                response = requests.get(url, headers=headers, params=params)
-                data = response.json()
-
-                for tweet in data:
-                    # 解析时间并过滤
-                    tweet_time = datetime.fromisoformat(tweet["created_at"].replace("Z", "+00:00"))
-                    cutoff_time = datetime.now() - timedelta(hours=hours)
-
-                    if tweet_time >= cutoff_time:
-                        results.append({
-                            "标题": tweet["text"],
-                            "日期": tweet["created_at"],
-                            "链接": f"https://twitter.com/{account}/status/{tweet['id']}",
-                            "来源": "Twitter",
-                            "板块": "社交媒体",
-                            "互动量": tweet.get("public_metrics", {}).get("like_count", 0)
-                        })
-            except Exception as e:
-                print(f"Twitter 获取失败 {account}: {e}")
+        url = f"{self.base_url}/user/last_tweets"
+        params = {"username": account, "limit": spec.item_limit or 10}
+
+        response = http_client.get(url, headers=headers, params=params)
+        data = response.json()
+
+        for tweet in data:
+            # 解析时间并过滤（均为带时区时间）
+            tweet_time = datetime.fromisoformat(tweet["created_at"].replace("Z", "+00:00"))
+
+            if tweet_time >= cutoff:
+                # 增量模式下跳过上次已处理的推文（按账户主页记录水位）
+                if self.watermarks is not None:
+                    if not self.watermarks.is_new(spec.url, tweet_time, str(tweet["id"])):
+                        continue
+                    self.watermarks.observe(spec.url, tweet_time, str(tweet["id"]))
+
+                results.append(NewsItem(
+                    title=tweet["text"],
+                    date=tweet["created_at"],
+                    link=f"https://twitter.com/{account}/status/{tweet['id']}",
+                    source="Twitter",
+                    section="社交媒体",
+                    engagement=tweet.get("public_metrics", {}).get("like_count", 0)
+                ))
 
         return results
 
 
-def fetch_all_sources(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def fetch_all_sources(
+    config: Dict[str, Any],
+    validator_cache: Optional[FeedValidatorCache] = None,
+    watermarks: Optional[WatermarkStore] = None,
+    stats: Optional[FetchStats] = None,
+    health: Optional[FeedHealthStore] = None,
+    sources: Optional[List[SourceSpec]] = None
+) -> List[NewsItem]:
     """
     从所有配置的数据源获取内容
 
+    数据源由 source_registry 统一声明（内置源 + custom_* + sources.feeds），
+    调用方通常传入 source_registry.load_config_sources(config) 的结果；
+    未传入 sources 时按 config 加载（custom 段以 "custom" 键传入）。
+    所有 feed 作为独立任务放入同一个线程池并发抓取，最大并发数由 max_workers
+    控制，concurrency_classes 可再限制某一类源的并发；结果按 RSS、YouTube、
+    Twitter、Reddit 及各自源的声明顺序返回。
+
+    单个 feed 最多用 feed_timeout 秒（源声明了 timeout 时以其为准），
+    整个抓取阶段最多用 fetch_budget 秒；预算用完时返回已完成的结果，
+    未完成的源记入 stats.partial。
+
+    传入 health 时，连续失败的源在冷却期内直接跳过（记入 stats.skipped），
+    声明了 poll_interval 且未到时间的源也跳过（记入 stats.not_due），
+    其余源记录成败和耗时；调用方负责 commit()。
+
+    传入 validator_cache 时 RSS / YouTube feed 使用条件请求，
+    未变化的 feed 不返回任何条目；调用方负责在处理完成后 commit()。
+
+    传入 watermarks 时 RSS / YouTube / Twitter 只返回上次成功运行之后的新条目；
+    调用方负责在处理完成后 commit()。
+
     config 格式:
     {
+        "max_workers": 8,
+        "feed_timeout": 20,
+        "fetch_budget": 60,
+        "concurrency_classes": {"slow": 2},
+        "feeds": [{"name": "...", "type": "rss", "url": "...", "poll_interval": 60}],
         "rss": {"enabled": true, "hours": 24},
         "youtube": {"enabled": false, "api_key": "", "min_views": 10000},
         "reddit": {"enabled": false, "min_upvotes": 50},
@@ -231,36 +568,65 @@ def fetch_all_sources(config: Dict[str, Any]) -> List[Dict[str, Any]]:
         "custom": {"custom_youtube_channels": [...]}
     }
     """
-    all_results = []
+    tasks: List[FetchTask] = []
+    if sources is None:
+        sources = load_sources(config)
 
     # RSS
     if config.get("rss", {}).get("enabled", True):
-        rss_fetcher = RSSFetcher()
-        all_results.extend(rss_fetcher.fetch(hours=config["rss"]["hours"]))
+        rss_fetcher = RSSFetcher(
+            validator_cache=validator_cache,
+            watermarks=watermarks,
+            sources=sources_of_type(sources, "rss")
+        )
+        tasks.extend(rss_fetcher.build_tasks(hours=config["rss"]["hours"]))
 
     # YouTube
     if config.get("youtube", {}).get("enabled", False):
-        custom_channels = config.get("custom", {}).get("custom_youtube_channels", [])
         yt_fetcher = YouTubeFetcher(
             api_key=config["youtube"].get("api_key"),
-            custom_channels=custom_channels
+            validator_cache=validator_cache,
+            watermarks=watermarks,
+            sources=sources_of_type(sources, "youtube")
         )
-        all_results.extend(yt_fetcher.fetch(
+        tasks.extend(yt_fetcher.build_tasks(
             hours=config["youtube"].get("hours", 24),
             min_views=config["youtube"].get("min_views", 10000)
         ))
 
     # Twitter
     if config.get("twitter", {}).get("enabled", False):
-        tw_fetcher = TwitterFetcher(api_key=config["twitter"].get("api_key"))
-        all_results.extend(tw_fetcher.fetch(hours=config["twitter"].get("hours", 24)))
+        tw_fetcher = TwitterFetcher(
+            api_key=config["twitter"].get("api_key"),
+            watermarks=watermarks,
+            sources=sources_of_type(sources, "twitter")
+        )
+        tasks.extend(tw_fetcher.build_tasks(hours=config["twitter"].get("hours", 24)))
 
     # Reddit (需要完整认证，默认禁用)
     if config.get("reddit", {}).get("enabled", False):
-        rd_fetcher = RedditFetcher()
-        all_results.extend(rd_fetcher.fetch(
+        rd_fetcher = RedditFetcher(sources=sources_of_type(sources, "reddit"))
+        tasks.extend(rd_fetcher.build_tasks(
             hours=config["reddit"].get("hours", 24),
             min_upvotes=config["reddit"].get("min_upvotes", 50)
         ))
 
-    return all_results
+    stats = stats if stats is not None else FetchStats()
+    results = run_fetch_tasks(
+        tasks,
+        max_workers=config.get("max_workers", DEFAULT_MAX_WORKERS),
+        budget=config.get("fetch_budget", DEFAULT_FETCH_BUDGET),
+        feed_timeout=config.get("feed_timeout", DEFAULT_FEED_TIMEOUT),
+        stats=stats,
+        health=health,
+        class_limits=config.get("concurrency_classes")
+    )
+
+    # 失败或超时的源可能已暂存了部分状态，丢弃以便下次完整重试
+    for key in stats.incomplete_keys:
+        if validator_cache is not None:
+            validator_cache.discard(key)
+        if watermarks is not None:
+            watermarks.discard(key)
+
+    return results
@@ -15,8 +15,10 @@ sys.path.insert(0, str(script_dir))
 
 from run_aggregator import load_config, main as run_aggregator_main
 from fetchers import fetch_all_sources
+from source_registry import load_config_sources
 from llm_processor import generate_daily_summary
 from feishu_output import export_to_json
+from news_item import to_dicts
 
 
 def generate_static_site(output_dir: str = "./static-site"):
@@ -33,7 +35,7 @@ def generate_static_site(output_dir: str = "./static-site"):
 
     # 运行聚合器
     config = load_config()
-    raw_items = fetch_all_sources(config["sources"])
+    raw_items = fetch_all_sources(config["sources"], sources=load_config_sources(config))
     print(f"✅ 获取到 {len(raw_items)} 条内容")
 
     # 生成摘要
@@ -42,7 +44,7 @@ def generate_static_site(output_dir: str = "./static-site"):
     # 导出 JSON 数据
     json_file = output_path / "data.json"
     with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(raw_items, f, ensure_ascii=False, indent=2)
+        json.dump(to_dicts(raw_items), f, ensure_ascii=False, indent=2)
 
     # 读取 HTML 模板并注入数据
     source_dir = script_dir.parent / "output"
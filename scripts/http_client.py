@@ -0,0 +1,204 @@
+"""
+AI News Aggregator - HTTP Client
+全项目共享的 HTTP 会话：按主机复用连接池、统一超时、429/5xx 退避重试、按主机限制并发
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 默认配置
+DEFAULT_TIMEOUT = 15          # 单次请求超时（秒）
+DEFAULT_MAX_RETRIES = 3       # 最多重试次数（不含首次请求）
+DEFAULT_BACKOFF_BASE = 0.5    # 退避基数（秒）
+DEFAULT_BACKOFF_MAX = 20      # 单次退避上限（秒）
+DEFAULT_HOST_LIMIT = 6        # 每个主机的最大并发请求数
+POOL_MAXSIZE = 16             # 每个主机连接池保持的连接数
+
+USER_AGENT = "Mozilla/5.0 (compatible; AI-News-Aggregator/1.0)"
+
+# 需要重试的状态码
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_settings: Dict[str, Any] = {
+    "timeout": DEFAULT_TIMEOUT,
+    "max_retries": DEFAULT_MAX_RETRIES,
+    "host_limits": {},
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_lock = threading.Lock()
+
+# 线程内的请求截止时间（time.monotonic() 时间点）
+_local = threading.local()
+
+
+def configure(
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    host_limits: Optional[Dict[str, int]] = None
+):
+    """
+    调整全局 HTTP 配置（需在首次请求前调用）
+
+    Args:
+        timeout: 默认超时（秒）
+        max_retries: 默认最多重试次数
+        host_limits: 按主机名设置最大并发数，如 {"open.feishu.cn": 4}
+    """
+    if timeout is not None:
+        _settings["timeout"] = timeout
+    if max_retries is not None:
+        _settings["max_retries"] = max_retries
+    if host_limits:
+        _settings["host_limits"].update(host_limits)
+
+
+def configure_from_config(config: Dict[str, Any]):
+    """读取 config.yaml 中的 http 段"""
+    http_config = config.get("http", {}) or {}
+    configure(
+        timeout=http_config.get("timeout"),
+        max_retries=http_config.get("max_retries"),
+        host_limits=http_config.get("host_limits")
+    )
+
+
+def get_session() -> requests.Session:
+    """获取共享的 Session（keep-alive，按主机维护连接池）"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # 重试由 request() 统一处理，这里不让 urllib3 再重试
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = USER_AGENT
+                _session = session
+    return _session
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]):
+    """
+    为当前线程内的所有请求设置截止时间
+
+    范围内每次请求的超时不超过剩余时间，重试退避也不会越过截止时间；
+    到期后再发请求直接抛出 Timeout。
+
+    Args:
+        deadline: time.monotonic() 时间点，None 表示不限制
+    """
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = deadline
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """距截止时间的剩余秒数"""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """获取主机对应的并发信号量"""
+    host = urlparse(url).netloc
+    with _host_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            limit = _settings["host_limits"].get(host, DEFAULT_HOST_LIMIT)
+            semaphore = threading.BoundedSemaphore(limit)
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """计算第 attempt 次重试前的等待时间（指数退避 + 全抖动）"""
+    if retry_after:
+        try:
+            return min(float(retry_after), DEFAULT_BACKOFF_MAX)
+        except ValueError:
+            pass
+    cap = min(DEFAULT_BACKOFF_MAX, DEFAULT_BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+def request(method: str, url: str, timeout: Optional[float] = None,
+            max_retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    发起 HTTP 请求
+
+    GET 请求在 429/5xx 和连接错误时重试；其他方法（如 POST 写入记录）
+    只在 429 时重试，避免服务端已处理的请求被重复提交。
+
+    Returns:
+        最后一次请求的 Response（重试耗尽时返回最后的错误响应）
+
+    Raises:
+        requests.exceptions.RequestException: 重试耗尽后仍无法连接
+    """
+    timeout = timeout if timeout is not None else _settings["timeout"]
+    max_retries = max_retries if max_retries is not None else _settings["max_retries"]
+    idempotent = method.upper() in ("GET", "HEAD")
+    retry_statuses = RETRY_STATUSES if idempotent else {429}
+    deadline = getattr(_local, "deadline", None)
+
+    session = get_session()
+    semaphore = _host_semaphore(url)
+
+    attempt = 0
+    while True:
+        request_timeout = timeout
+        remaining = _remaining(deadline)
+        if remaining is not None:
+            if remaining <= 0:
+                raise requests.exceptions.Timeout(f"超出截止时间: {url}")
+            request_timeout = min(timeout, remaining)
+
+        try:
+            with semaphore:
+                response = session.request(method, url, timeout=request_timeout, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if not idempotent or attempt >= max_retries:
+                raise
+            delay = _backoff_delay(attempt)
+            remaining = _remaining(deadline)
+            if remaining is not None and delay >= remaining:
+                raise
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        if response.status_code in retry_statuses and attempt < max_retries:
+            delay = _backoff_delay(attempt, response.headers.get("Retry-After"))
+            remaining = _remaining(deadline)
+            if remaining is None or delay < remaining:
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+        return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET 请求"""
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """POST 请求"""
+    return request("POST", url, **kwargs)
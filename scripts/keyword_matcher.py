@@ -0,0 +1,156 @@
+"""
+AI News Aggregator - 关键词匹配
+把一张关键词表编译成一个正则（按前缀合并成字典树），一次扫描找出文本中出现的所有关键词
+
+摘要、翻译、YouTube 监测中的关键词表都在模块导入时各建一个匹配器，
+调用时只需把文本转小写一次。
+
+    matcher = KeywordMatcher({"openai|chatgpt": "OpenAI", "deepseek": "DeepSeek"})
+    matcher.labels("ChatGPT 与 DeepSeek 对比")   # ["OpenAI", "DeepSeek"]
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Mapping, Set, Union
+
+Keywords = Union[Mapping[str, str], Iterable[str]]
+
+# 整词匹配的边界只看英文字母和数字，中文与英文之间没有空格时（"谷歌发布 AI工具"）也能命中
+_WORD_CHAR = r"[A-Za-z0-9_]"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    把关键词合并成字典树形式的正则
+
+    正则引擎按字符逐层分支，不必在每个位置依次尝试所有关键词；
+    较长的关键词优先（可选分支是贪婪的）。
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if terminal else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    预编译的多关键词匹配器（默认不区分大小写）
+
+    关键词表可以是关键词列表，也可以是 {关键词: 标签} 映射；映射的键可以用 "|" 列出多个同义关键词。
+    """
+
+    def __init__(self, keywords: Keywords, word_boundary: bool = False, case_sensitive: bool = False):
+        """
+        Args:
+            keywords: 关键词列表或 {关键词: 标签} 映射（键可写成 "a|b|c"）
+            word_boundary: 是否要求整词匹配（前后不能紧邻英文字母、数字；中文关键词不受影响）
+            case_sensitive: 是否区分大小写（区分时关键词和文本都保持原样，lowered 参数不起作用）
+        """
+        table = keywords if isinstance(keywords, Mapping) else {keyword: keyword for keyword in keywords}
+        self.case_sensitive = case_sensitive
+
+        # 关键词（不区分大小写时为小写）→ 标签；同一关键词出现多次时以第一次为准
+        self.keyword_labels: Dict[str, str] = {}
+        # 标签按关键词表的顺序排列
+        self.label_order: Dict[str, int] = {}
+        for key, label in table.items():
+            self.label_order.setdefault(label, len(self.label_order))
+            for keyword in key.split("|") if isinstance(keywords, Mapping) else [key]:
+                if keyword:
+                    self.keyword_labels.setdefault(self._normalize(keyword), label)
+
+        self.word_boundary = word_boundary
+        words = self.keyword_labels.keys()
+        alternation = _trie_pattern(words) if words else r"(?!)"
+        if word_boundary:
+            prefix, suffix = rf"(?<!{_WORD_CHAR})", rf"(?!{_WORD_CHAR})"
+        else:
+            prefix = suffix = ""
+        # 零宽先行断言：每个位置都尝试匹配，重叠的关键词也能找到
+        self._pattern = re.compile(rf"{prefix}(?=({alternation}){suffix})")
+        self._any = re.compile(rf"{prefix}(?:{alternation}){suffix}")
+        self._ignore_case = re.compile(rf"{prefix}(?:{alternation}){suffix}", 0 if case_sensitive else re.IGNORECASE)
+
+        # 同一位置只会匹配到最长的关键词，被它包含的较短关键词在这里补上
+        self._implied: Dict[str, Set[str]] = {}
+        for word in words:
+            contained = {
+                other for other in words
+                if other != word and other in word
+                and (not word_boundary or re.search(rf"(?<!{_WORD_CHAR}){re.escape(other)}(?!{_WORD_CHAR})", word))
+            }
+            if contained:
+                self._implied[word] = contained
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def find(self, text: str, lowered: bool = False) -> Set[str]:
+        """
+        一次扫描找出文本中出现的所有关键词
+
+        Args:
+            text: 文本
+            lowered: 文本是否已经转为小写
+
+        Returns:
+            命中的关键词（不区分大小写时为小写）
+        """
+        if not lowered:
+            text = self._normalize(text or "")
+        hits = set()
+        for match in self._pattern.finditer(text):
+            word = match.group(1)
+            if word not in hits:
+                hits.add(word)
+                hits.update(self._implied.get(word, ()))
+        return hits
+
+    def search(self, text: str, lowered: bool = False) -> bool:
+        """文本中是否出现任一关键词（命中第一个即返回）"""
+        if not lowered:
+            text = self._normalize(text or "")
+        return self._any.search(text) is not None
+
+    def labels(self, text: str, lowered: bool = False) -> List[str]:
+        """
+        命中关键词对应的标签，按关键词表的顺序排列、去重
+
+        Args:
+            text: 文本
+            lowered: 文本是否已经转为小写
+        """
+        found = {self.keyword_labels[word] for word in self.find(text, lowered)}
+        return sorted(found, key=self.label_order.__getitem__)
+
+    def replace(self, text: str, repl: Union[Mapping[str, str], Callable[[str], str], None] = None) -> str:
+        """
+        一次扫描替换文本中的关键词（保留未命中部分的原文）
+
+        Args:
+            text: 文本
+            repl: {关键词: 替换文本} 映射或函数（不区分大小写时以小写关键词为键）；默认替换为关键词的标签
+
+        Returns:
+            替换后的文本
+        """
+        if repl is None:
+            repl = self.keyword_labels
+
+        def substitute(match: re.Match) -> str:
+            word = match.group(0)
+            key = self._normalize(word)
+            return repl(key) if callable(repl) else repl.get(key, word)
+
+        return self._ignore_case.sub(substitute, text)
@@ -0,0 +1,81 @@
+"""
+AI News Aggregator - 语言检测
+按 Unicode 字符类别判断标题是否已经是中文，中文标题不再送去翻译
+"""
+
+import unicodedata
+from typing import Optional
+
+DEFAULT_CHINESE_RATIO = 0.5   # 汉字在文字中的占比不低于该值视为中文（见 chinese_ratio）
+MIN_HAN_CHARS = 2             # 至少包含的汉字数
+
+
+def _script(char: str) -> Optional[str]:
+    """字母类字符的文字系统：han / kana / hangul / other；非字母返回 None"""
+    if not char.isalpha():
+        return None
+    code = ord(char)
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF or 0xF900 <= code <= 0xFAFF or 0x20000 <= code <= 0x2FFFF:
+        return "han"
+    if 0x3040 <= code <= 0x30FF or 0x31F0 <= code <= 0x31FF:
+        return "kana"
+    if 0xAC00 <= code <= 0xD7AF or 0x1100 <= code <= 0x11FF:
+        return "hangul"
+    if code > 0x2E80 and unicodedata.name(char, "").startswith("CJK"):
+        return "han"
+    return "other"
+
+
+def chinese_ratio(text: str) -> float:
+    """
+    汉字数 / (汉字数 + 其他文字的单词数)
+
+    一个汉字和一个英文单词的信息量相当，所以其他文字按单词计数；
+    含假名或谚文的日文 / 韩文返回 0。
+    """
+    han = other_words = 0
+    in_word = False
+    for char in unicodedata.normalize("NFKC", text or ""):
+        script = _script(char)
+        if script in ("kana", "hangul"):
+            return 0.0
+        if script == "han":
+            han += 1
+        elif script == "other" and not in_word:
+            other_words += 1
+        in_word = script == "other" or (in_word and char.isdigit())
+    if han < MIN_HAN_CHARS:
+        return 0.0
+    return han / (han + other_words)
+
+
+def is_chinese(text: str, threshold: float = DEFAULT_CHINESE_RATIO) -> bool:
+    """
+    判断文本是否为中文
+
+    英文品牌名夹杂在中文标题中很常见（"OpenAI 发布 GPT-5"），按汉字的占比判断。
+
+    Args:
+        text: 标题等短文本
+        threshold: 汉字占比阈值
+    """
+    return chinese_ratio(text) >= threshold
+
+
+class TranslationGate:
+    """翻译前的语言检查，统计跳过的中文标题"""
+
+    def __init__(self, threshold: float = DEFAULT_CHINESE_RATIO):
+        self.threshold = threshold
+        self.checked = 0
+        self.skipped = 0
+
+    def needs_translation(self, title: str) -> bool:
+        self.checked += 1
+        if is_chinese(title, self.threshold):
+            self.skipped += 1
+            return False
+        return True
+
+    def summary(self) -> str:
+        return f"{self.skipped}/{self.checked} 条标题已是中文，跳过翻译"
@@ -0,0 +1,179 @@
+"""
+AI News Aggregator - LLM 响应缓存
+按请求指纹（模型、提示词模板版本、温度、提示词 / 输入字段）缓存 LLM 输出
+
+上一次运行 24 小时窗口内已经翻译、分类过的内容，下次运行直接复用结果。
+缓存保存在 data/llm_cache.sqlite3，超过 TTL 的记录视为失效，
+条目数超过上限时按最近访问时间淘汰（LRU）。
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from state_store import DATA_DIR
+
+# 修改提示词模板或输出格式时递增，使旧缓存失效
+PROMPT_VERSION = 1
+
+DEFAULT_PATH = DATA_DIR / "llm_cache.sqlite3"
+DEFAULT_TTL_HOURS = 72
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def fingerprint(model: str, temperature: float, prompt: str, **params: Any) -> str:
+    """
+    请求指纹
+
+    Args:
+        model: 模型名称
+        temperature: 采样温度
+        prompt: 完整提示词（已包含输入字段）
+        params: 其他影响输出的参数（response_format、max_tokens 等）
+    """
+    payload = json.dumps(
+        [PROMPT_VERSION, model, temperature, prompt, params],
+        ensure_ascii=False, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """SQLite 存储的 LLM 响应缓存，线程安全，记录本次运行的命中 / 未命中次数"""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True
+    ):
+        self.path = Path(path or DEFAULT_PATH)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.enabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                    "created REAL NOT NULL, accessed REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed)")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ 无法打开 LLM 缓存 {self.path.name}，本次不使用缓存: {e}")
+                self.enabled = False
+                self._conn = None
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """读取未过期的缓存，命中时刷新访问时间"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            now = time.time()
+            try:
+                row = conn.execute("SELECT value, created FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is None or now - row[1] > self.ttl_seconds:
+                    if row is not None:
+                        conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                        conn.commit()
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE llm_cache SET accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ 读取 LLM 缓存失败: {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str):
+        """写入缓存，超出条目上限时淘汰最久未访问的记录"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            now = time.time()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now)
+                )
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ 写入 LLM 缓存失败: {e}")
+
+    def discard(self, key: str):
+        """删除一条缓存（例如缓存的响应无法解析）"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ 删除 LLM 缓存失败: {e}")
+
+    def summary(self) -> str:
+        """本次运行的命中统计"""
+        if not self.enabled:
+            return "未启用"
+        total = self.hits + self.misses
+        rate = f"{self.hits / total:.0%}" if total else "-"
+        return f"命中 {self.hits}，未命中 {self.misses}，命中率 {rate}"
+
+
+_cache: Optional[LLMCache] = None
+
+
+def configure(
+    enabled: bool = True,
+    ttl_hours: float = DEFAULT_TTL_HOURS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    path: Optional[str] = None
+) -> LLMCache:
+    """替换进程内共享的缓存实例"""
+    global _cache
+    _cache = LLMCache(path=path, ttl_hours=ttl_hours, max_entries=max_entries, enabled=enabled)
+    return _cache
+
+
+def configure_from_config(config: Dict[str, Any]) -> LLMCache:
+    """按 config.yaml 中的 llm.cache 段配置缓存"""
+    cache_config = (config.get("llm") or {}).get("cache") or {}
+    return configure(
+        enabled=cache_config.get("enabled", True),
+        ttl_hours=cache_config.get("ttl_hours", DEFAULT_TTL_HOURS),
+        max_entries=cache_config.get("max_entries", DEFAULT_MAX_ENTRIES),
+        path=cache_config.get("path")
+    )
+
+
+def get_cache() -> LLMCache:
+    """进程内共享的缓存实例（未配置时使用默认设置）"""
+    global _cache
+    if _cache is None:
+        _cache = LLMCache()
+    return _cache
@@ -0,0 +1,443 @@
+"""
+AI News Aggregator - LLM Gateway
+全项目共享的 LLM 调用入口：长期复用的客户端（连接池）、统一的模型 / 地址 / 超时配置、
+失败重试、请求速率限制、响应缓存，以及 token 和耗时统计
+
+每次调用都记录所属阶段（stage_scope 设置）、提示词类型、token、耗时和缓存状态，
+运行结束时用 write_report() 写入 output/run_report.json。
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import llm_cache
+
+try:
+    from openai import OpenAI, AsyncOpenAI
+    HAS_OPENAI = True
+except ImportError:
+    HAS_OPENAI = False
+
+# 默认配置
+DEFAULT_BASE_URL = "https://api.deepseek.com"
+DEFAULT_MODEL = "deepseek-chat"
+DEFAULT_TEMPERATURE = 0.3
+DEFAULT_TIMEOUT = 60          # 单次请求超时（秒）
+DEFAULT_MAX_RETRIES = 3       # 429 / 5xx / 连接错误时的最多重试次数（SDK 内部指数退避）
+DEFAULT_RATE_LIMIT = 0        # 每分钟最多发出的请求数，0 表示不限制
+
+DEFAULT_STAGE = "other"
+REPORT_SLOWEST = 5            # 报告中列出的最慢请求数
+
+_settings: Dict[str, Any] = {
+    "api_key": None,
+    "base_url": None,
+    "model": DEFAULT_MODEL,
+    "temperature": DEFAULT_TEMPERATURE,
+    "timeout": DEFAULT_TIMEOUT,
+    "max_retries": DEFAULT_MAX_RETRIES,
+    "rate_limit": DEFAULT_RATE_LIMIT,
+}
+
+_client = None
+_client_lock = threading.Lock()
+_async_client = None
+_async_loop = None
+
+
+class _RateLimiter:
+    """按固定间隔放行请求（每分钟 rate_limit 个），线程和协程共用"""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """预约下一个发送时间点，返回需要等待的秒数"""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+            return start - now
+
+
+@dataclass
+class CallRecord:
+    """一次 LLM 调用"""
+    stage: str                  # 调用阶段，如 process_batch、daily_summary
+    prompt: str                 # 提示词类型（结构化输出的 schema 名，纯文本为 text）
+    latency: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached: bool = False
+    error: bool = False
+
+
+def _aggregate(records: List[CallRecord]) -> Dict[str, Any]:
+    requests = [record for record in records if not record.cached]
+    latency = sum(record.latency for record in requests)
+    return {
+        "calls": len(records),
+        "requests": len(requests),
+        "cache_hits": len(records) - len(requests),
+        "errors": sum(1 for record in requests if record.error),
+        "prompt_tokens": sum(record.prompt_tokens for record in requests),
+        "completion_tokens": sum(record.completion_tokens for record in requests),
+        "latency_total": round(latency, 3),
+        "latency_avg": round(latency / len(requests), 3) if requests else 0.0,
+        "latency_max": round(max((record.latency for record in requests), default=0.0), 3),
+    }
+
+
+class LLMStats:
+    """本次运行的 LLM 调用记录（线程安全）"""
+
+    def __init__(self):
+        self.records: List[CallRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: CallRecord):
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> str:
+        totals = _aggregate(self.records)
+        parts = [f"{totals['requests']} 次请求"]
+        if totals["cache_hits"]:
+            parts.append(f"缓存命中 {totals['cache_hits']}")
+        if totals["errors"]:
+            parts.append(f"失败 {totals['errors']}")
+        parts.append(f"tokens 输入 {totals['prompt_tokens']} / 输出 {totals['completion_tokens']}")
+        parts.append(f"耗时 {totals['latency_total']:.1f}s（平均 {totals['latency_avg']:.1f}s）")
+        return "，".join(parts)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        按阶段汇总的调用统计
+
+        Returns:
+            {"totals": {...}, "stages": {阶段: {...汇总, "prompts": {提示词类型: {...}}}},
+             "slowest": [最慢的几次请求]}
+        """
+        with self._lock:
+            records = list(self.records)
+
+        by_stage: Dict[str, List[CallRecord]] = {}
+        for record in records:
+            by_stage.setdefault(record.stage, []).append(record)
+
+        stages = {}
+        for stage, stage_records in by_stage.items():
+            by_prompt: Dict[str, List[CallRecord]] = {}
+            for record in stage_records:
+                by_prompt.setdefault(record.prompt, []).append(record)
+            stages[stage] = _aggregate(stage_records)
+            stages[stage]["prompts"] = {name: _aggregate(group) for name, group in by_prompt.items()}
+
+        slowest = sorted((record for record in records if not record.cached), key=lambda r: r.latency, reverse=True)
+        return {
+            "totals": _aggregate(records),
+            "stages": stages,
+            "slowest": [asdict(record) for record in slowest[:REPORT_SLOWEST]],
+        }
+
+
+_limiter = _RateLimiter(DEFAULT_RATE_LIMIT)
+_stats = LLMStats()
+_stage: contextvars.ContextVar = contextvars.ContextVar("llm_stage", default=DEFAULT_STAGE)
+
+
+@contextmanager
+def stage_scope(stage: str):
+    """
+    标记范围内 LLM 调用所属的阶段
+
+    阶段保存在 contextvars 中，范围内创建的 asyncio 任务会继承。
+
+    Args:
+        stage: 阶段名称，如 "process_batch"
+    """
+    token = _stage.set(stage)
+    try:
+        yield
+    finally:
+        _stage.reset(token)
+
+
+def configure(
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    rate_limit: Optional[float] = None
+):
+    """
+    调整全局 LLM 配置（已创建的客户端会在下次调用时按新配置重建）
+
+    Args:
+        api_key: API Key，默认读取环境变量 DEEPSEEK_API_KEY
+        base_url: API 地址，默认读取环境变量 DEEPSEEK_BASE_URL，再默认 DeepSeek
+        model: 模型名称
+        temperature: 采样温度
+        timeout: 单次请求超时（秒）
+        max_retries: 最多重试次数
+        rate_limit: 每分钟最多请求数，0 表示不限制
+    """
+    global _client, _async_client, _limiter
+    updates = {
+        "api_key": api_key,
+        "base_url": base_url,
+        "model": model,
+        "temperature": temperature,
+        "timeout": timeout,
+        "max_retries": max_retries,
+        "rate_limit": rate_limit,
+    }
+    for key, value in updates.items():
+        if value is not None and value != "":
+            _settings[key] = value
+    if rate_limit is not None:
+        _limiter = _RateLimiter(_settings["rate_limit"])
+    with _client_lock:
+        _client = None
+    # 异步客户端绑定在事件循环上，由 aclose() 关闭，这里只丢弃引用
+    _async_client = None
+
+
+def configure_from_config(config: Dict[str, Any]):
+    """读取 config.yaml 中的 llm 段"""
+    llm_config = config.get("llm", {}) or {}
+    configure(
+        api_key=llm_config.get("api_key"),
+        base_url=llm_config.get("base_url"),
+        model=llm_config.get("model"),
+        temperature=llm_config.get("temperature"),
+        timeout=llm_config.get("timeout"),
+        max_retries=llm_config.get("max_retries"),
+        rate_limit=llm_config.get("rate_limit")
+    )
+
+
+def get_api_key() -> Optional[str]:
+    return _settings["api_key"] or os.getenv("DEEPSEEK_API_KEY") or None
+
+
+def get_base_url() -> str:
+    return _settings["base_url"] or os.getenv("DEEPSEEK_BASE_URL") or DEFAULT_BASE_URL
+
+
+def available() -> bool:
+    """是否可以调用 LLM（已安装 openai 且配置了 API Key）"""
+    return HAS_OPENAI and bool(get_api_key())
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    return {
+        "api_key": get_api_key(),
+        "base_url": get_base_url(),
+        "timeout": _settings["timeout"],
+        "max_retries": _settings["max_retries"],
+    }
+
+
+def get_client():
+    """获取共享的同步客户端（内部 httpx 连接池在整个进程内复用）"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(**_client_kwargs())
+    return _client
+
+
+def _get_async_client():
+    """获取当前事件循环的异步客户端"""
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_loop is not loop:
+        _async_client = AsyncOpenAI(**_client_kwargs())
+        _async_loop = loop
+    return _async_client
+
+
+async def aclose():
+    """关闭异步客户端（事件循环结束前调用）"""
+    global _async_client, _async_loop
+    if _async_client is not None:
+        client, _async_client, _async_loop = _async_client, None, None
+        await client.close()
+
+
+def cache_key(prompt: str, **params: Any) -> str:
+    """按当前模型和温度计算请求指纹"""
+    return llm_cache.fingerprint(_settings["model"], _settings["temperature"], prompt, **params)
+
+
+def _request_kwargs(prompt: str, response_format: Optional[Dict], max_tokens: Optional[int]) -> Dict[str, Any]:
+    kwargs = {
+        "model": _settings["model"],
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": _settings["temperature"],
+    }
+    if response_format:
+        kwargs["response_format"] = response_format
+    if max_tokens:
+        kwargs["max_tokens"] = max_tokens
+    return kwargs
+
+
+def _prompt_name(response_format: Optional[Dict]) -> str:
+    if response_format and response_format.get("type") == "json_schema":
+        return response_format.get("json_schema", {}).get("name", "json")
+    return "text" if not response_format else response_format.get("type", "json")
+
+
+def _record_response(record: CallRecord, latency: float, response: Any):
+    record.latency = latency
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        record.prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        record.completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    _stats.add(record)
+
+
+def _require_client():
+    if not available():
+        raise RuntimeError("需要 openai 库和 API Key")
+
+
+def complete(prompt: str, response_format: Optional[Dict] = None, max_tokens: Optional[int] = None) -> str:
+    """
+    发送单轮对话请求，返回回复文本（先查缓存）
+
+    Args:
+        prompt: 用户提示词
+        response_format: 结构化输出格式（json_schema）
+        max_tokens: 输出 token 上限
+
+    Raises:
+        RuntimeError: 未安装 openai 或未配置 API Key
+        openai.OpenAIError: 重试耗尽后仍失败
+    """
+    _require_client()
+    cache = llm_cache.get_cache()
+    key = cache_key(prompt, response_format=response_format, max_tokens=max_tokens)
+    record = CallRecord(stage=_stage.get(), prompt=_prompt_name(response_format))
+    cached = cache.get(key)
+    if cached is not None:
+        record.cached = True
+        _stats.add(record)
+        return cached
+
+    time.sleep(_limiter.reserve())
+    started = time.monotonic()
+    try:
+        response = get_client().chat.completions.create(**_request_kwargs(prompt, response_format, max_tokens))
+    except Exception:
+        record.latency = time.monotonic() - started
+        record.error = True
+        _stats.add(record)
+        raise
+    _record_response(record, time.monotonic() - started, response)
+
+    content = response.choices[0].message.content or ""
+    if content:
+        cache.set(key, content)
+    return content
+
+
+async def acomplete(prompt: str, response_format: Optional[Dict] = None, max_tokens: Optional[int] = None) -> str:
+    """complete 的异步版本"""
+    _require_client()
+    cache = llm_cache.get_cache()
+    key = cache_key(prompt, response_format=response_format, max_tokens=max_tokens)
+    record = CallRecord(stage=_stage.get(), prompt=_prompt_name(response_format))
+    cached = cache.get(key)
+    if cached is not None:
+        record.cached = True
+        _stats.add(record)
+        return cached
+
+    await asyncio.sleep(_limiter.reserve())
+    started = time.monotonic()
+    try:
+        response = await _get_async_client().chat.completions.create(
+            **_request_kwargs(prompt, response_format, max_tokens)
+        )
+    except Exception:
+        record.latency = time.monotonic() - started
+        record.error = True
+        _stats.add(record)
+        raise
+    _record_response(record, time.monotonic() - started, response)
+
+    content = response.choices[0].message.content or ""
+    if content:
+        cache.set(key, content)
+    return content
+
+
+def discard(prompt: str, response_format: Optional[Dict] = None, max_tokens: Optional[int] = None):
+    """丢弃一条缓存的回复（例如回复无法解析）"""
+    llm_cache.get_cache().discard(cache_key(prompt, response_format=response_format, max_tokens=max_tokens))
+
+
+def get_stats() -> LLMStats:
+    """本次运行的调用统计"""
+    return _stats
+
+
+def write_report(path: str, section: str, replace: bool = False) -> bool:
+    """
+    把本次运行的调用统计写入运行报告（JSON）
+
+    报告按运行脚本分段，如 {"run_aggregator": {...}, "update_summary": {...}}；
+    默认只替换自己的段，保留其他脚本写入的内容。
+
+    Args:
+        path: 报告路径，通常为 output/run_report.json
+        section: 段名（运行脚本）
+        replace: 为 True 时丢弃已有内容（新一轮运行开始）
+
+    Returns:
+        是否成功
+    """
+    report_path = Path(path)
+    report: Dict[str, Any] = {}
+    if not replace and report_path.exists():
+        try:
+            with open(report_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            report = {}
+
+    report[section] = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "model": _settings["model"],
+        "llm": _stats.report(),
+        # 包括批量处理中按条目复用的结果，这些条目不产生调用记录
+        "cache": {"hits": llm_cache.get_cache().hits, "misses": llm_cache.get_cache().misses},
+    }
+
+    try:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        print(f"⚠️ 运行报告写入失败: {e}")
+        return False
+    return True
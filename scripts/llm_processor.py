@@ -3,15 +3,81 @@ AI News Aggregator - LLM Processor
 使用 DeepSeek 或其他 LLM 进行翻译、摘要和分类
 """
 
-import os
-from typing import List, Dict, Any, Optional
+import json
+import asyncio
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
 from datetime import datetime
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+import llm_cache
+import category_classifier
+import lang_detect
+import llm_gateway
+import prefilter
+import translation_memory
+import enrich
+from keyword_matcher import KeywordMatcher
+from news_item import NewsItem
+
+# 分类选项
+VALID_CATEGORIES = ["产品发布", "研究突破", "教程分享", "观点评论", "行业动态"]
+DEFAULT_CATEGORY = "行业动态"
+
+# 异步处理时同时进行的请求数
+DEFAULT_CONCURRENCY = 8
+
+# 批量处理：每个请求的 token 预算（输入 + 预计输出）和条目上限
+DEFAULT_BATCH_TOKEN_BUDGET = 6000
+DEFAULT_BATCH_MAX_ITEMS = 20
+# 批量请求中每条结果预计占用的输出 token
+OUTPUT_TOKENS_PER_ITEM = 150
+
+# YouTube 摘要中展示的公司和产品（分组名 → 实体名称，见 enrich.py）
+YOUTUBE_COMPANIES = {
+    "OpenAI": ("OpenAI",),
+    "Anthropic/Claude": ("Anthropic", "Claude"),
+    "Google/Gemini": ("Google", "Gemini"),
+    "Microsoft/Copilot": ("Microsoft", "Copilot"),
+    "Midjourney": ("Midjourney",),
+    "ChatGPT": ("ChatGPT",),
+}
+
+# 新闻摘要中的概念和行业动态（英文 → 中文，子串匹配）；公司、产品、人物读取标注结果
+NEWS_TOPICS = {
+    # 技术/概念
+    "GPU": "显卡", "LLM": "大语言模型", "AI Agent": "AI 智能体",
+    "coding": "AI 编程", "agentic": "智能代理", "data center": "数据中心",
+
+    # 行业动态
+    "merger": "并购", "acquires": "收购", "investment": "投资",
+    "funding": "融资", "launch": "发布", "update": "更新",
+    "ban": "禁令", "regulation": "监管",
+}
+
+# 动作词汇映射（词干，子串匹配）
+ACTION_KEYWORDS = {
+    "merg": "合并", "acquir": "收购", "launch": "发布", "releas": "推出",
+    "updat": "更新", "ban": "被禁", "invest": "投资", "fund": "融资",
+    "build": "开发", "add": "新增", "integrat": "集成",
+}
+
+NEWS_TOPIC_MATCHER = KeywordMatcher(NEWS_TOPICS)
+ACTION_MATCHER = KeywordMatcher(ACTION_KEYWORDS)
+
+
+def estimate_tokens(text: str) -> int:
+    """粗略估算 token 数：ASCII 约 4 字符一个 token，其他字符（中文等）约一字一个"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+@dataclass
+class LLMRequest:
+    """一次 LLM 调用：提示词、输出格式、结果解析和失败时的兜底值"""
+    prompt: str
+    response_format: Optional[Dict]
+    parse: Callable[[Any], Any]
+    on_error: Callable[[Exception], Any]
 
 
 class LLMProcessor:
@@ -25,32 +91,69 @@ class LLMProcessor:
             api_key: API Key，默认从环境变量 DEEPSEEK_API_KEY 读取
             base_url: API Base URL，默认 DeepSeek
         """
-        self.api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
-        self.base_url = base_url or "https://api.deepseek.com"
+        if api_key or base_url:
+            llm_gateway.configure(api_key=api_key, base_url=base_url)
+        self.api_key = llm_gateway.get_api_key()
+
+        # 本次运行中 LLM 调用失败、使用了兜底值的条目链接
+        self.failed: Set[str] = set()
+        # 分类不是来自有效 LLM 回答（调用失败或回答不在分类选项中）的条目链接
+        self.fallback_categories: Set[str] = set()
 
         if not self.api_key:
             print("警告: 未设置 API Key，LLM 处理功能将不可用")
 
-    def _call_llm(self, prompt: str, response_format: Optional[Dict] = None) -> Dict[str, Any]:
-        """调用 LLM API"""
-        if not self.api_key or not HAS_OPENAI:
-            raise RuntimeError("需要 openai 库和 API Key")
-
-        client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+    def _call_llm(self, prompt: str, response_format: Optional[Dict] = None) -> str:
+        """调用 LLM API，返回回复文本"""
+        return llm_gateway.complete(prompt, response_format)
 
-        kwargs = {
-            "model": "deepseek-chat",
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.3,
-        }
+    async def _acall_llm(self, prompt: str, response_format: Optional[Dict] = None) -> str:
+        """异步调用 LLM API，返回回复文本"""
+        return await llm_gateway.acomplete(prompt, response_format)
 
-        if response_format:
-            kwargs["response_format"] = response_format
+    def _run(self, request: LLMRequest) -> Any:
+        try:
+            result = request.parse(self._call_llm(request.prompt, request.response_format))
+        except Exception as e:
+            # 无法解析的回复不再从缓存返回
+            llm_gateway.discard(request.prompt, request.response_format)
+            return request.on_error(e)
+        if result is None:
+            llm_gateway.discard(request.prompt, request.response_format)
+        return result
+
+    async def _arun(self, request: LLMRequest) -> Any:
+        try:
+            result = request.parse(await self._acall_llm(request.prompt, request.response_format))
+        except Exception as e:
+            llm_gateway.discard(request.prompt, request.response_format)
+            return request.on_error(e)
+        if result is None:
+            llm_gateway.discard(request.prompt, request.response_format)
+        return result
+
+    def _answer_key(self, item: Dict[str, Any], config: Dict[str, Any]) -> str:
+        """单条内容处理结果的缓存键（与批次组成无关）"""
+        return llm_gateway.cache_key(
+            "news_answer",
+            fields=list(self._task_properties(config)),
+            item=[item.get("标题", ""), item.get("内容", ""), item.get("来源", ""), item.get("板块", "")]
+        )
+
+    def cached_answer(self, item: Dict[str, Any], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """之前运行中批量处理得到的单条结果"""
+        cached = llm_cache.get_cache().get(self._answer_key(item, config))
+        if cached is None:
+            return None
+        try:
+            return json.loads(cached)
+        except ValueError:
+            return None
 
-        response = client.chat.completions.create(**kwargs)
-        return response.choices[0].message
+    def store_answer(self, item: Dict[str, Any], config: Dict[str, Any], answer: Dict[str, Any]):
+        llm_cache.get_cache().set(self._answer_key(item, config), json.dumps(answer, ensure_ascii=False))
 
-    def translate_and_summarize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def translate_and_summarize(self, item: NewsItem) -> NewsItem:
         """
         翻译标题并生成摘要（如需要）
 
@@ -65,6 +168,13 @@ class LLMProcessor:
         Returns:
             处理后的内容项
         """
+        return self._run(self._translate_request(item))
+
+    async def atranslate_and_summarize(self, item: NewsItem) -> NewsItem:
+        """translate_and_summarize 的异步版本"""
+        return await self._arun(self._translate_request(item))
+
+    def _translate_request(self, item: NewsItem) -> LLMRequest:
         prompt = f"""你是一名新闻编辑，任务是将不同来源的标题翻译成中文，要求简洁、准确、有逻辑。请确保输出全是中文。若只有一条链接，保留链接即可。
 
 输入信息：
@@ -90,37 +200,36 @@ class LLMProcessor:
 
 注意：除了"标题"字段可以修改，其他字段的内容严格保持和输入一致。"""
 
-        try:
-            response = self._call_llm(
-                prompt,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "news_item",
-                        "strict": True,
-                        "schema": {
-                            "type": "object",
-                            "properties": {
-                                "标题": {"type": "string"},
-                                "日期": {"type": "string"},
-                                "链接": {"type": "string"},
-                                "来源": {"type": "string"},
-                                "板块": {"type": "string"}
-                            },
-                            "required": ["标题", "日期", "链接", "来源", "板块"]
-                        }
-                    }
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "news_item",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "标题": {"type": "string"},
+                        "日期": {"type": "string"},
+                        "链接": {"type": "string"},
+                        "来源": {"type": "string"},
+                        "板块": {"type": "string"}
+                    },
+                    "required": ["标题", "日期", "链接", "来源", "板块"]
                 }
-            )
-
-            import json
-            result = json.loads(response.content)
-            return result
+            }
+        }
 
-        except Exception as e:
+        def on_error(e: Exception) -> NewsItem:
             print(f"LLM 处理失败: {e}")
+            self.failed.add(item.get("链接", ""))
             return item
 
+        return LLMRequest(
+            prompt, response_format,
+            parse=lambda content: NewsItem.from_dict(json.loads(content)),
+            on_error=on_error
+        )
+
     def categorize(self, item: Dict[str, Any]) -> str:
         """
         对内容进行分类
@@ -138,6 +247,13 @@ class LLMProcessor:
         Returns:
             分类标签
         """
+        return self._run(self._categorize_request(item))
+
+    async def acategorize(self, item: Dict[str, Any]) -> str:
+        """categorize 的异步版本"""
+        return await self._arun(self._categorize_request(item))
+
+    def _categorize_request(self, item: Dict[str, Any]) -> LLMRequest:
         prompt = f"""请对以下 AI 新闻进行分类，只返回分类名称。
 
 标题：{item.get('标题', '')}
@@ -152,19 +268,22 @@ class LLMProcessor:
 
 只返回分类名称，不要其他内容。"""
 
-        try:
-            response = self._call_llm(prompt)
-            category = response.content.strip()
+        def parse(content) -> str:
+            category = content.strip()
 
             # 验证分类是否有效
-            valid_categories = ["产品发布", "研究突破", "教程分享", "观点评论", "行业动态"]
-            if category in valid_categories:
+            if category in VALID_CATEGORIES:
                 return category
-            return "行业动态"  # 默认分类
+            self.fallback_categories.add(item.get("链接", ""))
+            return DEFAULT_CATEGORY  # 默认分类
 
-        except Exception as e:
+        def on_error(e: Exception) -> str:
             print(f"分类失败: {e}")
-            return "行业动态"
+            self.failed.add(item.get("链接", ""))
+            self.fallback_categories.add(item.get("链接", ""))
+            return DEFAULT_CATEGORY
+
+        return LLMRequest(prompt, None, parse=parse, on_error=on_error)
 
     def filter_by_value(self, item: Dict[str, Any]) -> tuple[bool, str]:
         """
@@ -176,6 +295,13 @@ class LLMProcessor:
         Returns:
             (是否有价值, 理由)
         """
+        return self._run(self._value_request(item))
+
+    async def afilter_by_value(self, item: Dict[str, Any]) -> tuple[bool, str]:
+        """filter_by_value 的异步版本"""
+        return await self._arun(self._value_request(item))
+
+    def _value_request(self, item: Dict[str, Any]) -> LLMRequest:
         prompt = f"""评估以下 AI 新闻是否具有信息价值，对 AI 内容创作者是否有参考意义。
 
 标题：{item.get('标题', '')}
@@ -187,34 +313,212 @@ class LLMProcessor:
   "理由": "简短理由"
 }}"""
 
-        try:
-            response = self._call_llm(
-                prompt,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "value_assessment",
-                        "strict": True,
-                        "schema": {
-                            "type": "object",
-                            "properties": {
-                                "有无信息价值": {"type": "boolean"},
-                                "理由": {"type": "string"}
-                            },
-                            "required": ["有无信息价值", "理由"]
-                        }
-                    }
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "value_assessment",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "有无信息价值": {"type": "boolean"},
+                        "理由": {"type": "string"}
+                    },
+                    "required": ["有无信息价值", "理由"]
                 }
-            )
+            }
+        }
 
-            import json
-            result = json.loads(response.content)
+        def parse(content) -> tuple[bool, str]:
+            result = json.loads(content)
             return result.get("有无信息价值", False), result.get("理由", "")
 
-        except Exception as e:
+        def on_error(e: Exception) -> tuple[bool, str]:
             print(f"价值评估失败: {e}")
+            self.failed.add(item.get("链接", ""))
             return True, "默认保留"
 
+        return LLMRequest(prompt, response_format, parse=parse, on_error=on_error)
+
+    @staticmethod
+    def _task_instructions(config: Dict[str, Any]) -> List[str]:
+        """启用的任务对应的输出字段说明"""
+        tasks = []
+        if config.get("translate", True) or config.get("summarize", True):
+            tasks.append('- 标题：将标题翻译成简洁、准确的中文；若原标题超过三句话，改为以"摘要："开头的 60–80 字中文摘要')
+        if config.get("categorize", True):
+            tasks.append(f"- 分类：从 {'、'.join(VALID_CATEGORIES)} 中选择一个")
+        if config.get("filter_by_value", True):
+            tasks.append("- 有无信息价值：对 AI 内容创作者是否有参考意义（true/false）；理由：简短理由")
+        return tasks
+
+    @staticmethod
+    def _task_properties(config: Dict[str, Any]) -> Dict[str, Any]:
+        """启用的任务对应的 JSON Schema 字段，未启用的任务不出现在 schema 中"""
+        properties: Dict[str, Any] = {}
+        if config.get("translate", True) or config.get("summarize", True):
+            properties["标题"] = {"type": "string"}
+        if config.get("categorize", True):
+            properties["分类"] = {"type": "string", "enum": VALID_CATEGORIES}
+        if config.get("filter_by_value", True):
+            properties["有无信息价值"] = {"type": "boolean"}
+            properties["理由"] = {"type": "string"}
+        return properties
+
+    def process_item(self, item: Dict[str, Any], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        一次调用完成翻译、分类和价值评估
+
+        Args:
+            item: 内容项
+            config: llm 配置（translate / summarize / categorize / filter_by_value）
+
+        Returns:
+            结果字段（标题、分类、有无信息价值、理由 中启用的部分）；
+            调用失败或结果不完整时返回 None，由调用方回退到逐项调用
+        """
+        request = self._item_request(item, config)
+        return self._run(request) if request is not None else {}
+
+    async def aprocess_item(self, item: Dict[str, Any], config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """process_item 的异步版本"""
+        request = self._item_request(item, config)
+        return await self._arun(request) if request is not None else {}
+
+    def _item_request(self, item: Dict[str, Any], config: Dict[str, Any]) -> Optional[LLMRequest]:
+        """没有启用任何任务时返回 None"""
+        properties = self._task_properties(config)
+        if not properties:
+            return None
+
+        prompt = f"""你是一名 AI 新闻编辑，请处理下面这条新闻：
+{chr(10).join(self._task_instructions(config))}
+
+标题：{item.get('标题', '')}
+来源：{item.get('来源', '')}
+板块：{item.get('板块', '')}
+
+以 JSON 返回。"""
+
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "news_item_fused",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": list(properties)
+                }
+            }
+        }
+
+        def parse(content) -> Optional[Dict[str, Any]]:
+            result = json.loads(content)
+            if not isinstance(result, dict) or not all(key in result for key in properties):
+                return None
+            return result
+
+        def on_error(e: Exception) -> None:
+            print(f"合并处理失败: {e}")
+            return None
+
+        return LLMRequest(prompt, response_format, parse=parse, on_error=on_error)
+
+    def batch_prompt(self, batch: List[Tuple[str, Dict[str, Any]]], config: Dict[str, Any]) -> str:
+        """多条内容合并为一个请求的提示词"""
+        tasks = self._task_instructions(config)
+
+        lines = [
+            f"id: {item_id}\n标题：{item.get('标题', '')}\n来源：{item.get('来源', '')}\n板块：{item.get('板块', '')}"
+            for item_id, item in batch
+        ]
+        return f"""你是一名 AI 新闻编辑。下面有 {len(batch)} 条新闻，请逐条处理：
+{chr(10).join(tasks)}
+
+以 JSON 返回，items 数组中每条新闻一个对象，用输入的 id 标识，不要遗漏或合并条目。
+
+{chr(10).join(lines)}"""
+
+    def batch_schema(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """批量请求的 JSON Schema（只包含启用的任务字段）"""
+        properties: Dict[str, Any] = {"id": {"type": "string"}}
+        properties.update(self._task_properties(config))
+
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "news_batch",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "items": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": properties,
+                                "required": list(properties)
+                            }
+                        }
+                    },
+                    "required": ["items"]
+                }
+            }
+        }
+
+    def process_items(
+        self,
+        batch: List[Tuple[str, Dict[str, Any]]],
+        config: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        一个请求处理多条内容
+
+        Args:
+            batch: [(id, 内容项), ...]
+            config: llm 配置（translate / summarize / categorize / filter_by_value）
+
+        Returns:
+            id -> 结果字段；请求失败或结果不完整时只包含有效的条目
+        """
+        return self._run(self._items_request(batch, config))
+
+    async def aprocess_items(
+        self,
+        batch: List[Tuple[str, Dict[str, Any]]],
+        config: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """process_items 的异步版本"""
+        return await self._arun(self._items_request(batch, config))
+
+    def _items_request(self, batch: List[Tuple[str, Dict[str, Any]]], config: Dict[str, Any]) -> LLMRequest:
+        schema = self.batch_schema(config)
+        required = schema["json_schema"]["schema"]["properties"]["items"]["items"]["required"]
+        expected_ids = {item_id for item_id, _ in batch}
+        prompt = self.batch_prompt(batch, config)
+
+        def parse(content) -> Dict[str, Dict[str, Any]]:
+            entries = json.loads(content).get("items", [])
+            answers = {}
+            for entry in entries if isinstance(entries, list) else []:
+                if not isinstance(entry, dict) or not all(key in entry for key in required):
+                    continue
+                item_id = str(entry["id"])
+                if item_id in expected_ids and item_id not in answers:
+                    answers[item_id] = entry
+            if answers.keys() != expected_ids:
+                # 不完整的回复不留在缓存中，否则之后的运行会一直拿到同样缺条目的结果；
+                # 已有的有效条目照常返回（逐条结果另有缓存）
+                llm_gateway.discard(prompt, schema)
+            return answers
+
+        def on_error(e: Exception) -> Dict[str, Dict[str, Any]]:
+            print(f"批量处理失败（{len(batch)} 条）: {e}")
+            return {}
+
+        return LLMRequest(prompt, schema, parse=parse, on_error=on_error)
+
 
 def generate_daily_summary(items: List[Dict[str, Any]]) -> str:
     """
@@ -226,8 +530,6 @@ def generate_daily_summary(items: List[Dict[str, Any]]) -> str:
     Returns:
         中文摘要文本（不包含标题，HTML模板中已有）
     """
-    processor = LLMProcessor()
-
     # 按来源分组（YouTube 单独处理）
     by_source = {}
     youtube_items = []
@@ -240,127 +542,97 @@ def generate_daily_summary(items: List[Dict[str, Any]]) -> str:
                 by_source[source] = []
             by_source[source].append(item)
 
-    # 生成摘要
-    summary_lines = []
-
-    # 为每个非 YouTube 来源生成一句话中文摘要
-    source_summaries = {}
+    # 每个摘要的 (名称, 提示词, 降级摘要)；提示词只由输入标题决定，
+    # 输入不变时命中 LLM 缓存，不产生调用
+    requests = []
     for source, source_items in by_source.items():
         # 取前3条标题作为该来源的代表性内容
         top_titles = [item.get("标题", "") for item in source_items[:3]]
         titles_text = "；".join(top_titles)
-
-        if processor.api_key:
-            # 使用 LLM 生成中文摘要
-            prompt = f"""请用一句话（30字以内）概括以下 AI 新闻的核心内容，用中文输出：
+        prompt = f"""请用一句话（30字以内）概括以下 AI 新闻的核心内容，用中文输出：
 
 {titles_text}
 
 只返回一句话概括，不要其他内容。"""
+        requests.append((source, prompt, _simple_chinese_summary(source, source_items[:3])))
 
-            try:
-                response = processor._call_llm(prompt)
-                source_summaries[source] = response.content.strip()
-            except:
-                # 降级：使用简单翻译
-                source_summaries[source] = _simple_chinese_summary(source, top_titles)
-        else:
-            # 无 API Key 时的智能处理
-            source_summaries[source] = _simple_chinese_summary(source, top_titles)
-
-    # 输出非 YouTube 摘要
-    for source, summary in source_summaries.items():
-        summary_lines.append(f"**{source}**: {summary}")
-
-    # 生成 YouTube 综合摘要
     if youtube_items:
-        youtube_summary = _generate_youtube_summary(youtube_items, processor.api_key)
-        summary_lines.append(f"**YouTube**: {youtube_summary}")
+        requests.append(("YouTube", *_youtube_summary_prompt(youtube_items)))
 
-    return "\n\n".join(summary_lines)
+    summaries = _run_summaries(requests)
+    return "\n\n".join(f"**{name}**: {summary}" for (name, _, _), summary in zip(requests, summaries))
 
 
-def _generate_youtube_summary(youtube_items: List[Dict[str, Any]], api_key: Optional[str]) -> str:
+def _run_summaries(requests: List[Tuple[str, str, str]], stage: str = "daily_summary") -> List[str]:
     """
-    生成 YouTube 博主内容的综合摘要
+    并发生成全部摘要（一轮并行请求），失败或无 API Key 时使用降级摘要
 
     Args:
-        youtube_items: YouTube 内容项列表
-        api_key: LLM API Key
+        requests: (名称, 提示词, 降级摘要) 列表
+        stage: 调用统计中的阶段名
 
     Returns:
-        YouTube 综合中文摘要
+        与 requests 顺序一致的摘要
+    """
+    if not requests or not llm_gateway.available():
+        return [fallback for _, _, fallback in requests]
+
+    async def summarize(prompt: str, fallback: str, semaphore: asyncio.Semaphore) -> str:
+        async with semaphore:
+            try:
+                return (await llm_gateway.acomplete(prompt)).strip() or fallback
+            except Exception:
+                return fallback
+
+    async def summarize_all() -> List[str]:
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+        try:
+            return await asyncio.gather(*(summarize(prompt, fallback, semaphore) for _, prompt, fallback in requests))
+        finally:
+            await llm_gateway.aclose()
+
+    with llm_gateway.stage_scope(stage):
+        if not _in_event_loop():
+            return asyncio.run(summarize_all())
+
+        # 已在事件循环中时逐个同步请求
+        results = []
+        for _, prompt, fallback in requests:
+            try:
+                results.append(llm_gateway.complete(prompt).strip() or fallback)
+            except Exception:
+                results.append(fallback)
+        return results
+
+
+def _youtube_summary_prompt(youtube_items: List[Dict[str, Any]]) -> Tuple[str, str]:
     """
-    if not youtube_items:
-        return "暂无新视频"
+    YouTube 综合摘要的提示词和降级摘要
+
+    提示词中的频道和主题按出现顺序排列（不经过 set），相同输入得到相同提示词，
+    才能命中 LLM 缓存。
 
-    # 收集所有视频标题和内容
+    Returns:
+        (提示词, 无 API Key 或调用失败时的默认摘要)
+    """
+    # 收集所有视频标题
     video_titles = [item.get("标题", "") for item in youtube_items]
-    video_descriptions = [item.get("内容", "") for item in youtube_items]
-    channels = list(set([item.get("来源", "").replace("YouTube - ", "") for item in youtube_items]))
-
-    # 提取内容主题关键词
-    all_text = " ".join(video_titles + video_descriptions)
-
-    # YouTube 内容主题分类
-    youtube_topics = {
-        # AI 编程/开发
-        "coding|programming|developer|code|xcode|python|javascript": "AI 编程与开发",
-        "agentic|agent|workflow|automation": "AI 智能体与自动化",
-
-        # AI 工具/应用
-        "tool|app|software|platform|studio": "AI 工具与应用",
-        "tutorial|how to|guide|learn|course": "AI 教程与学习",
-        "tips|tricks|hack|optimization": "AI 技巧与优化",
-
-        # AI 理论/研究
-        "paper|research|study|breakthrough|model": "AI 理论与研究",
-        "deep learning|neural|network|training": "深度学习技术",
-        "llm|language model|gpt|claude|gemini": "大语言模型",
-
-        # AI 行业/商业
-        "business|agency|entrepreneur|startup|scale": "AI 商业与创业",
-        "future|trend|prediction|roadmap": "AI 趋势与展望",
-        "money|income|profit|salary|career": "AI 职业与变现",
-
-        # AI 产品/评测
-        "review|test|comparison|best|top": "AI 产品评测",
-        "news|update|release|launch": "AI 新闻动态",
-        "demo|showcase|example|project": "AI 项目演示",
-    }
+    channels = list(dict.fromkeys(item.get("来源", "").replace("YouTube - ", "") for item in youtube_items))
 
-    # 检测主题
-    detected_topics = []
-    for pattern, topic in youtube_topics.items():
-        import re
-        if re.search(pattern, all_text.lower()):
-            detected_topics.append(topic)
-
-    # 检测提到的公司和产品
-    companies_products = []
-    if "openai" in all_text.lower():
-        companies_products.append("OpenAI")
-    if "anthropic" in all_text.lower() or "claude" in all_text.lower():
-        companies_products.append("Anthropic/Claude")
-    if "google" in all_text.lower() or "gemini" in all_text.lower():
-        companies_products.append("Google/Gemini")
-    if "microsoft" in all_text.lower() or "copilot" in all_text.lower():
-        companies_products.append("Microsoft/Copilot")
-    if "midjourney" in all_text.lower():
-        companies_products.append("Midjourney")
-    if "chatgpt" in all_text.lower():
-        companies_products.append("ChatGPT")
+    # 主题和提到的公司、产品（标注阶段的结果）
+    topics = enrich.collect(youtube_items, enrich.TOPICS_KEY)
+    detected_topics = [topic for topic in enrich.TOPICS.values() if topic in topics]
+    companies_products = enrich.group_labels(enrich.collect(youtube_items), YOUTUBE_COMPANIES)
 
     # 生成摘要
-    topic_str = "、".join(list(set(detected_topics))[:4]) if detected_topics else "AI 相关内容"
+    topic_str = "、".join(detected_topics[:4]) if detected_topics else "AI 相关内容"
     company_str = "、".join(companies_products[:3]) if companies_products else ""
 
     channel_count = len(channels)
     video_count = len(youtube_items)
 
-    if api_key:
-        # 使用 LLM 生成更自然的摘要
-        prompt = f"""请根据以下 YouTube 视频信息，生成一段 50-80 字的中文摘要，说明这些视频主要讲了哪些方面的内容：
+    # 使用 LLM 生成更自然的摘要
+    prompt = f"""请根据以下 YouTube 视频信息，生成一段 50-80 字的中文摘要，说明这些视频主要讲了哪些方面的内容：
 
 视频数量：{video_count} 个
 涉及频道：{', '.join(channels[:5])}
@@ -377,97 +649,41 @@ def _generate_youtube_summary(youtube_items: List[Dict[str, Any]], api_key: Opti
 4. 不要逐条列举视频
 5. 直接返回摘要文本，不要其他内容"""
 
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
-            response = client.chat.completions.create(
-                model="deepseek-chat",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
-            )
-            return response.choices[0].message.content.strip()
-        except:
-            pass
-
     # 无 API Key 时的默认摘要
     if detected_topics:
         if company_str:
-            return f"{channel_count}位博主发布{video_count}个视频，涵盖{topic_str}等内容，涉及{company_str}等主流 AI 公司产品"
+            fallback = f"{channel_count}位博主发布{video_count}个视频，涵盖{topic_str}等内容，涉及{company_str}等主流 AI 公司产品"
         else:
-            return f"{channel_count}位博主发布{video_count}个视频，涵盖{topic_str}等内容"
+            fallback = f"{channel_count}位博主发布{video_count}个视频，涵盖{topic_str}等内容"
     else:
-        return f"{channel_count}位博主发布{video_count}个视频，分享 AI 相关内容与见解"
+        fallback = f"{channel_count}位博主发布{video_count}个视频，分享 AI 相关内容与见解"
+    return prompt, fallback
 
 
-def _simple_chinese_summary(source: str, titles: List[str]) -> str:
+def _simple_chinese_summary(source: str, items: List[Dict[str, Any]]) -> str:
     """
     无 API Key 时生成智能中文摘要
 
     Args:
         source: 来源名称
-        titles: 标题列表
+        items: 代表性内容项
 
     Returns:
         中文摘要
     """
-    # 扩展的 AI 关键词映射表（主题分类）
-    ai_topics = {
-        # 公司/组织
-        "OpenAI": "OpenAI", "Anthropic": "Anthropic", "Google": "谷歌",
-        "Microsoft": "微软", "Apple": "苹果", "Meta": "Meta",
-        "xAI": "xAI", "SpaceX": "SpaceX", "NVIDIA": "英伟达",
-        "Intel": "英特尔", "AMD": "AMD", "Tesla": "特斯拉",
-
-        # 人物
-        "Elon Musk": "马斯克", "Sam Altman": "奥特曼",
-
-        # 产品/模型
-        "Claude": "Claude", "ChatGPT": "ChatGPT", "Grok": "Grok",
-        "Gemini": "Gemini", "Copilot": "Copilot",
-        "Sora": "Sora", "Midjourney": "Midjourney",
-
-        # 技术/概念
-        "GPU": "显卡", "LLM": "大语言模型", "AI Agent": "AI 智能体",
-        "coding": "AI 编程", "agentic": "智能代理", "data center": "数据中心",
-
-        # 平台/应用
-        "Xcode": "Xcode", "Firefox": "火狐浏览器", "Moltbook": "Moltbook",
-        "OpenClaw": "OpenClaw",
-
-        # 行业动态
-        "merger": "并购", "acquires": "收购", "investment": "投资",
-        "funding": "融资", "launch": "发布", "update": "更新",
-        "ban": "禁令", "regulation": "监管",
-    }
-
-    # 动作词汇映射
-    action_keywords = {
-        "merg": "合并", "acquir": "收购", "launch": "发布", "releas": "推出",
-        "updat": "更新", "ban": "被禁", "invest": "投资", "fund": "融资",
-        "build": "开发", "add": "新增", "integrat": "集成",
-    }
-
-    # 提取所有标题中的关键信息
-    all_titles = " ".join(titles[:3])  # 取前3个标题综合分析
-    detected_companies = []
-    detected_products = []
-    detected_actions = []
-    detected_topics = []
-
-    for keyword, chinese in ai_topics.items():
-        if keyword.lower() in all_titles.lower():
-            if keyword in ["OpenAI", "Anthropic", "Google", "Microsoft", "Apple", "Meta", "xAI", "SpaceX", "NVIDIA", "Intel"]:
-                detected_companies.append(chinese)
-            elif keyword in ["Claude", "ChatGPT", "Grok", "Gemini", "Sora", "Midjourney"]:
-                detected_products.append(chinese)
-            else:
-                detected_topics.append(chinese)
-
-    # 检测动作
-    for keyword, chinese in action_keywords.items():
-        if keyword.lower() in all_titles.lower():
-            detected_actions.append(chinese)
-            break  # 只取第一个动作
+    # 取前3条内容综合分析，只看标题中出现的实体（标注阶段的结果）
+    items = items[:3]
+    titles = [item.get("标题", "") for item in items]
+    all_titles = " ".join(titles).lower()
+    entities = {name for item in items for name, where in enrich.entities(item).items() if where == enrich.TITLE}
+    detected_companies = [chinese for name, chinese in enrich.COMPANIES.items() if name in entities]
+    detected_products = [chinese for name, chinese in enrich.PRODUCTS.items() if name in entities]
+    # 人物和新闻概念词作为主题（enrich.TOPICS 是视频题材分类，不用于新闻）
+    detected_topics = [chinese for name, chinese in enrich.PEOPLE.items() if name in entities]
+    detected_topics += NEWS_TOPIC_MATCHER.labels(all_titles, lowered=True)
+
+    # 检测动作（只取第一个动作）
+    detected_actions = ACTION_MATCHER.labels(all_titles, lowered=True)[:1]
 
     # 简化来源名称
     source_short = source.replace("The ", "").replace(" AI", "").replace(" - ", " ").replace("YouTube - ", "")
@@ -490,7 +706,7 @@ def _simple_chinese_summary(source: str, titles: List[str]) -> str:
         return f"{source_short} 报道了关于{products_str}的消息"
 
     elif detected_topics:
-        topics_str = "、".join(list(set(detected_topics))[:3])
+        topics_str = "、".join(detected_topics[:3])
         return f"{source_short} 报道了关于{topics_str}的最新动态"
 
     else:
@@ -501,17 +717,308 @@ def _simple_chinese_summary(source: str, titles: List[str]) -> str:
         return f"{source_short}: {first_title}"
 
 
-def process_batch(items: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+def plan_batches(
+    items: List[Dict[str, Any]],
+    token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+    max_items: int = DEFAULT_BATCH_MAX_ITEMS
+) -> List[List[int]]:
+    """
+    按 token 预算把条目分组
+
+    每组的预估输入（标题 + 来源 + 板块）加预计输出不超过 token_budget，
+    且不超过 max_items 条；单条超出预算时自成一组。
+
+    Returns:
+        每组条目在 items 中的下标
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for index, item in enumerate(items):
+        cost = estimate_tokens(
+            f"{item.get('标题', '')}{item.get('来源', '')}{item.get('板块', '')}"
+        ) + OUTPUT_TOKENS_PER_ITEM
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(index)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _process_item(processor: LLMProcessor, item: NewsItem, config: Dict[str, Any]) -> Optional[NewsItem]:
+    """
+    处理单条内容，低价值内容返回 None
+
+    默认一次调用返回全部结果（fused_mode）；失败时回退到分别调用翻译、分类和价值评估。
+    """
+    if config.get("fused_mode", True):
+        answer = processor.process_item(item, config)
+        if answer is not None:
+            return _apply_answer(processor, item, answer, config)
+
+    processed = item.copy()
+
+    # 翻译和摘要
+    if config.get("translate", True) or config.get("summarize", True):
+        processed = _merge_translation(processed, processor.translate_and_summarize(processed))
+
+    # 分类
+    if config.get("categorize", True):
+        processed["分类"] = processor.categorize(processed)
+
+    # 价值过滤
+    if config.get("filter_by_value", True):
+        has_value, reason = processor.filter_by_value(processed)
+        if not has_value:
+            return None  # 跳过低价值内容
+        processed["价值评估"] = reason
+
+    return processed
+
+
+def _merge_translation(processed: NewsItem, translated: NewsItem) -> NewsItem:
+    """LLM 只返回部分字段，其余字段（内容、播放量、聚类等）沿用原值"""
+    for key, value in processed.items():
+        if key not in translated:
+            translated[key] = value
+    return translated
+
+
+async def _aprocess_item(
+    processor: LLMProcessor,
+    item: NewsItem,
+    config: Dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> Optional[NewsItem]:
+    """_process_item 的异步版本，每次调用都占用一个 semaphore 名额"""
+    if config.get("fused_mode", True):
+        async with semaphore:
+            answer = await processor.aprocess_item(item, config)
+        if answer is not None:
+            return _apply_answer(processor, item, answer, config)
+
+    processed = item.copy()
+
+    if config.get("translate", True) or config.get("summarize", True):
+        async with semaphore:
+            translated = await processor.atranslate_and_summarize(processed)
+        processed = _merge_translation(processed, translated)
+
+    # 分类和价值评估互不依赖，并发进行
+    categorize = config.get("categorize", True)
+    filter_by_value = config.get("filter_by_value", True)
+
+    async def limited(coro):
+        async with semaphore:
+            return await coro
+
+    category, verdict = await asyncio.gather(
+        limited(processor.acategorize(processed)) if categorize else asyncio.sleep(0),
+        limited(processor.afilter_by_value(processed)) if filter_by_value else asyncio.sleep(0)
+    )
+
+    if categorize:
+        processed["分类"] = category
+    if filter_by_value:
+        has_value, reason = verdict
+        if not has_value:
+            return None  # 跳过低价值内容
+        processed["价值评估"] = reason
+
+    return processed
+
+
+def _apply_answer(
+    processor: LLMProcessor,
+    item: NewsItem,
+    answer: Dict[str, Any],
+    config: Dict[str, Any]
+) -> Optional[NewsItem]:
+    """把批量结果写回内容项，低价值内容返回 None"""
+    processed = item.copy()
+
+    if config.get("translate", True) or config.get("summarize", True):
+        if answer.get("标题"):
+            processed["标题"] = answer["标题"]
+
+    if config.get("categorize", True):
+        category = answer.get("分类")
+        if category not in VALID_CATEGORIES:
+            processor.fallback_categories.add(item.get("链接", ""))
+            category = DEFAULT_CATEGORY
+        processed["分类"] = category
+
+    if config.get("filter_by_value", True):
+        if not answer.get("有无信息价值", True):
+            return None
+        processed["价值评估"] = answer.get("理由", "")
+
+    return processed
+
+
+def _plan_uncached(
+    processor: LLMProcessor,
+    items: List[NewsItem],
+    config: Dict[str, Any],
+    outcomes: Dict[int, Optional[NewsItem]]
+) -> List[List[int]]:
+    """已有缓存结果的条目直接写入 outcomes，其余条目按 token 预算分组"""
+    pending = []
+    for index, item in enumerate(items):
+        answer = processor.cached_answer(item, config)
+        if answer is not None:
+            outcomes[index] = _apply_answer(processor, item, answer, config)
+        else:
+            pending.append(index)
+
+    batches = plan_batches(
+        [items[index] for index in pending],
+        token_budget=config.get("batch_token_budget", DEFAULT_BATCH_TOKEN_BUDGET),
+        max_items=config.get("batch_max_items", DEFAULT_BATCH_MAX_ITEMS)
+    )
+    return [[pending[position] for position in batch] for batch in batches]
+
+
+def _collect_answers(
+    processor: LLMProcessor,
+    items: List[NewsItem],
+    config: Dict[str, Any],
+    batch: List[int],
+    answers: Dict[str, Dict[str, Any]],
+    outcomes: Dict[int, Optional[NewsItem]]
+):
+    """把一个批次的结果写入 outcomes，并按条目缓存"""
+    for index in batch:
+        answer = answers.get(str(index))
+        if answer is not None:
+            processor.store_answer(items[index], config, answer)
+            outcomes[index] = _apply_answer(processor, items[index], answer, config)
+
+
+def _process_batched(
+    processor: LLMProcessor,
+    items: List[NewsItem],
+    config: Dict[str, Any]
+) -> List[Optional[NewsItem]]:
+    """多条内容合并为一个请求处理，批量结果缺失的条目再逐条处理（结果与 items 一一对应，低价值内容为 None）"""
+    outcomes: Dict[int, Optional[NewsItem]] = {}
+    batches = _plan_uncached(processor, items, config, outcomes)
+
+    for batch in batches:
+        answers = processor.process_items([(str(index), items[index]) for index in batch], config)
+        _collect_answers(processor, items, config, batch, answers, outcomes)
+
+    missing = [index for index in range(len(items)) if index not in outcomes]
+    print(f"   批量处理: {len(batches)} 个请求，{len(missing)} 条逐条重试")
+    for index in missing:
+        outcomes[index] = _process_item(processor, items[index], config)
+
+    return [outcomes[index] for index in range(len(items))]
+
+
+async def _aprocess_batched(
+    processor: LLMProcessor,
+    items: List[NewsItem],
+    config: Dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> List[Optional[NewsItem]]:
+    """_process_batched 的异步版本：各批次并发请求，缺失的条目再并发逐条处理"""
+    outcomes: Dict[int, Optional[NewsItem]] = {}
+    batches = _plan_uncached(processor, items, config, outcomes)
+
+    async def run_batch(batch: List[int]) -> Dict[str, Dict[str, Any]]:
+        async with semaphore:
+            return await processor.aprocess_items([(str(index), items[index]) for index in batch], config)
+
+    for batch, answers in zip(batches, await asyncio.gather(*(run_batch(batch) for batch in batches))):
+        _collect_answers(processor, items, config, batch, answers, outcomes)
+
+    missing = [index for index in range(len(items)) if index not in outcomes]
+    print(f"   批量处理: {len(batches)} 个请求，{len(missing)} 条逐条重试")
+    retried = await asyncio.gather(*(_aprocess_item(processor, items[index], config, semaphore) for index in missing))
+    outcomes.update(zip(missing, retried))
+
+    return [outcomes[index] for index in range(len(items))]
+
+
+async def process_batch_async(
+    items: List[NewsItem],
+    config: Dict[str, Any],
+    processor: Optional[LLMProcessor] = None
+) -> List[NewsItem]:
+    """
+    并发处理内容列表，同时进行的请求数不超过 config["concurrency"]
+
+    结果顺序与输入一致；单条失败时沿用同步版本的兜底（保留原内容、
+    分类默认为行业动态、价值评估失败时保留）。
+    """
+    results = await _aprocess_aligned(items, config, processor or LLMProcessor())
+    return [processed for processed in results if processed is not None]
+
+
+async def _aprocess_aligned(
+    items: List[NewsItem],
+    config: Dict[str, Any],
+    processor: LLMProcessor
+) -> List[Optional[NewsItem]]:
+    """并发处理，结果与 items 一一对应（低价值内容为 None）"""
+    semaphore = asyncio.Semaphore(max(1, config.get("concurrency", DEFAULT_CONCURRENCY)))
+
+    try:
+        if config.get("batch_mode", True):
+            return await _aprocess_batched(processor, items, config, semaphore)
+
+        return list(await asyncio.gather(*(_aprocess_item(processor, item, config, semaphore) for item in items)))
+    finally:
+        await llm_gateway.aclose()
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def process_batch(
+    items: List[NewsItem],
+    config: Dict[str, Any],
+    failed: Optional[Set[str]] = None
+) -> List[NewsItem]:
     """
     批量处理内容列表
 
+    默认把多条内容合并到一个请求（按 token 预算分组），结果无效或缺失的条目
+    再逐条处理；batch_mode 为 false 时直接逐条处理。逐条处理时每条内容
+    一次调用完成全部任务，fused_mode 为 false 或调用失败时分别调用
+    翻译、分类和价值评估。
+
+    默认使用异步客户端并发请求（async_mode），最多 concurrency 个请求同时进行；
+    已在事件循环中调用时使用同步实现。
+
     config 格式:
     {
         "translate": true,           # 是否翻译
         "summarize": true,           # 是否生成摘要
         "categorize": true,          # 是否分类
         "filter_by_value": true,     # 是否过滤低价值内容
+        "batch_mode": true,          # 是否合并请求
+        "batch_token_budget": 6000,  # 每个合并请求的 token 预算
+        "batch_max_items": 20,       # 每个合并请求最多条目数
+        "fused_mode": true,          # 逐条处理时是否一次调用完成全部任务
+        "async_mode": true,          # 是否并发请求
+        "concurrency": 8,            # 同时进行的请求数
+        "prefilter": {...},          # 本地预筛选（见 prefilter.py）
+        "local_classifier": {...},   # 本地分类器（见 category_classifier.py）
+        "skip_chinese": true,        # 已是中文的标题不翻译
     }
+
+    传入 failed 时，LLM 调用失败、结果使用了兜底值的条目链接写入其中，
+    调用方可以据此不推进这些条目的增量状态，下次运行重新处理。
     """
     processor = LLMProcessor()
 
@@ -519,26 +1026,131 @@ def process_batch(items: List[Dict[str, Any]], config: Dict[str, Any]) -> List[D
         print("未配置 API Key，跳过 LLM 处理")
         return items
 
-    results = []
+    # 每条内容需要 LLM 完成的任务：(翻译, 价值评估, 分类) → 条目在 candidates 中的位置
+    groups: Dict[Tuple[bool, bool, bool], List[int]] = {}
+    translate = config.get("translate", True) or config.get("summarize", True)
+    filter_by_value = config.get("filter_by_value", True)
+    categorize = config.get("categorize", True)
+
+    # 预筛选：丢弃明显无关的内容，明显相关的内容跳过 LLM 价值评估
+    prefilter_config = config.get("prefilter") or {}
+    if filter_by_value and prefilter_config.get("enabled", True):
+        result = prefilter.prefilter_items(items, prefilter_config)
+        print(f"   预筛选: {result.summary()}")
+        candidates = [(item, False) for item in result.accepted] + [(item, True) for item in result.ambiguous]
+    else:
+        candidates = [(item, filter_by_value) for item in items]
+
+    # 本地分类器置信度足够高时不再调用 LLM 分类
+    classifier_config = config.get("local_classifier") or {}
+    classifier = category_classifier.get_classifier(classifier_config) if categorize else None
+    min_confidence = classifier_config.get("min_confidence", category_classifier.DEFAULT_MIN_CONFIDENCE)
+    # 处理前的原内容和待处理的副本，按位置对应（链接可能为空或重复）；
+    # 翻译记忆和分类样本都以原标题为键
+    originals = [item.copy() for item, _ in candidates]
+    working: List[NewsItem] = []
+
+    memory = translation_memory.get_memory()
+    gate = lang_detect.TranslationGate() if translate and config.get("skip_chinese", True) else None
+    local_count = remembered_count = 0
+    for position, (item, needs_value) in enumerate(candidates):
+        # 结果写在副本上，不修改调用方的条目；判断都基于原内容
+        original = originals[position]
+        item = item.copy()
+        working.append(item)
+
+        needs_translation = translate
+        if gate is not None and not gate.needs_translation(original.get("标题", "")):
+            # 已是中文的标题不翻译，仍然分类和评估
+            needs_translation = False
+        elif translate:
+            # 翻译记忆中已有的标题不再翻译
+            remembered = memory.lookup(original.get("标题", ""))
+            if remembered:
+                item["标题"] = remembered
+                needs_translation = False
+                remembered_count += 1
+
+        needs_category = categorize
+        if classifier is not None:
+            # 分类器用原标题训练
+            label, confidence = classifier.predict_item(original)
+            if label in VALID_CATEGORIES and confidence >= min_confidence:
+                item["分类"] = label
+                needs_category = False
+                local_count += 1
+        groups.setdefault((needs_translation, needs_value, needs_category), []).append(position)
+    if classifier is not None:
+        print(f"   本地分类: {local_count}/{len(candidates)} 条")
+    if gate is not None:
+        print(f"   语言检测: {gate.summary()}")
+    if translate:
+        print(f"   翻译记忆: {remembered_count}/{len(candidates)} 条标题已有翻译")
+
+    outcomes: Dict[int, NewsItem] = {}
+    for (needs_translation, needs_value, needs_category), positions in groups.items():
+        group = [working[position] for position in positions]
+        group_config = dict(
+            config,
+            translate=needs_translation,
+            summarize=needs_translation and config.get("summarize", True),
+            filter_by_value=needs_value,
+            categorize=needs_category
+        )
+        if not (needs_translation or needs_value or needs_category):
+            outcomes.update(zip(positions, group))
+            continue
+        results = _process_all(processor, group, group_config)
+        pairs = [(originals[position], result) for position, result in zip(positions, results) if result is not None]
+        if needs_translation:
+            _remember_translations(pairs)
+        if needs_category and classifier_config.get("log_labels", True):
+            _log_category_labels(pairs, processor.fallback_categories, classifier_config)
+        outcomes.update((position, result) for position, result in zip(positions, results) if result is not None)
+    memory.save()
+    if failed is not None:
+        failed.update(processor.failed)
+
+    # 恢复输入顺序
+    order = {id(item): index for index, item in enumerate(items)}
+    return [outcomes[position] for position in sorted(outcomes, key=lambda position: order[id(candidates[position][0])])]
+
+
+def _remember_translations(pairs: List[Tuple[NewsItem, NewsItem]]):
+    """把 LLM 翻译的标题写入翻译记忆（pairs 为 (原内容, 处理结果) 列表）"""
+    memory = translation_memory.get_memory()
+    for original, item in pairs:
+        if item.get("标题") != original.get("标题"):
+            memory.store(original.get("标题", ""), item.get("标题", ""))
+
+
+def _log_category_labels(
+    pairs: List[Tuple[NewsItem, NewsItem]],
+    fallbacks: Set[str],
+    config: Dict[str, Any]
+):
+    """
+    记录 LLM 分类结果（配原标题），供本地分类器训练
 
-    for item in items:
-        processed = item.copy()
+    分类为兜底值（调用失败或回答无效）的条目不记录，避免模型偏向默认分类。
+    """
+    records = []
+    for original, item in pairs:
+        if item.get("链接") not in fallbacks:
+            records.append(dict(original.to_dict(), 分类=item.get("分类")))
+    category_classifier.append_labels(records, config.get("label_path") or category_classifier.LABELS_PATH)
 
-        # 翻译和摘要
-        if config.get("translate", True) or config.get("summarize", True):
-            processed = processor.translate_and_summarize(processed)
 
-        # 分类
-        if config.get("categorize", True):
-            processed["分类"] = processor.categorize(processed)
+def _process_all(processor: LLMProcessor, items: List[NewsItem], config: Dict[str, Any]) -> List[Optional[NewsItem]]:
+    """按 config 选择批量 / 逐条、同步 / 异步方式处理，结果与 items 一一对应（低价值内容为 None）"""
+    if not items:
+        return []
 
-        # 价值过滤
-        if config.get("filter_by_value", True):
-            has_value, reason = processor.filter_by_value(processed)
-            if not has_value:
-                continue  # 跳过低价值内容
-            processed["价值评估"] = reason
+    with llm_gateway.stage_scope("process_batch"):
+        if config.get("async_mode", True) and not _in_event_loop():
+            return asyncio.run(_aprocess_aligned(items, config, processor))
 
-        results.append(processed)
+        if config.get("batch_mode", True):
+            return _process_batched(processor, items, config)
 
-    return results
+        return [_process_item(processor, item, config) for item in items]
@@ -0,0 +1,207 @@
+"""
+AI News Aggregator - News Item
+抓取、处理、输出各阶段共用的内容记录
+
+NewsItem 使用 __slots__ 存储常用字段，来源 / 板块 / 分类这类重复出现的
+取值会被驻留（sys.intern），多条记录共享同一个字符串对象。
+记录同时提供 dict 风格的读写接口（item["标题"]、item.get("来源")、
+item.items() 等），与 news.json 的中文键格式可以无损互转。
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 中文键 → 属性名（顺序即 to_dict() 输出的键顺序）
+FIELD_KEYS: Tuple[Tuple[str, str], ...] = (
+    ("标题", "title"),
+    ("内容", "content"),
+    ("日期", "date"),
+    ("链接", "link"),
+    ("来源", "source"),
+    ("板块", "section"),
+    ("分类", "category"),
+    ("播放量", "views"),
+    ("互动量", "engagement"),
+    ("价值评估", "assessment"),
+)
+
+_ATTRS = dict(FIELD_KEYS)
+
+# 取值重复度高、需要驻留的字段
+_INTERNED = {"source", "section", "category"}
+
+
+class _Missing:
+    """字段缺失标记（与 None 区分，保证 to_dict() 不多出键）"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<missing>"
+
+
+MISSING = _Missing()
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class NewsItem:
+    """单条内容记录"""
+
+    __slots__ = (
+        "title", "content", "date", "link", "source", "section", "category",
+        "views", "engagement", "assessment", "extra"
+    )
+
+    def __init__(
+        self,
+        title: Any = MISSING,
+        content: Any = MISSING,
+        date: Any = MISSING,
+        link: Any = MISSING,
+        source: Any = MISSING,
+        section: Any = MISSING,
+        category: Any = MISSING,
+        views: Any = MISSING,
+        engagement: Any = MISSING,
+        assessment: Any = MISSING,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            title/content/date/link: 标题、内容、日期、链接
+            source/section/category: 来源、板块、分类（会被驻留）
+            views/engagement/assessment: 播放量、互动量、价值评估
+            extra: 其他字段，保持原有中文键
+        """
+        self.title = title
+        self.content = content
+        self.date = date
+        self.link = link
+        self.source = _intern(source)
+        self.section = _intern(section)
+        self.category = _intern(category)
+        self.views = views
+        self.engagement = engagement
+        self.assessment = assessment
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NewsItem":
+        """从 news.json 格式的 dict 构造"""
+        item = cls()
+        for key, value in data.items():
+            item[key] = value
+        return item
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换回 news.json 格式的 dict"""
+        return dict(self.items())
+
+    def copy(self) -> "NewsItem":
+        item = NewsItem.__new__(NewsItem)
+        for attr in NewsItem.__slots__:
+            setattr(item, attr, getattr(self, attr))
+        if self.extra is not None:
+            item.extra = dict(self.extra)
+        return item
+
+    # dict 风格接口，供导出器和飞书字段映射使用
+
+    def __getitem__(self, key: str) -> Any:
+        attr = _ATTRS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not MISSING:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        attr = _ATTRS.get(key)
+        if attr is not None:
+            setattr(self, attr, _intern(value) if attr in _INTERNED else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        self[key]  # 不存在时抛出 KeyError
+        attr = _ATTRS.get(key)
+        if attr is not None:
+            setattr(self, attr, MISSING)
+        else:
+            del self.extra[key]
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key: str, default: Any = MISSING) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            if default is MISSING:
+                raise
+            return default
+        del self[key]
+        return value
+
+    def update(self, other: Dict[str, Any]):
+        for key, value in other.items():
+            self[key] = value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key, attr in FIELD_KEYS:
+            value = getattr(self, attr)
+            if value is not MISSING:
+                yield key, value
+        if self.extra:
+            yield from self.extra.items()
+
+    def keys(self) -> Iterator[str]:
+        return (key for key, _ in self.items())
+
+    def values(self) -> Iterator[Any]:
+        return (value for _, value in self.items())
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, NewsItem):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.to_dict()!r})"
+
+
+def from_dicts(items: Iterable[Dict[str, Any]]) -> List[NewsItem]:
+    """批量从 dict 构造（已是 NewsItem 的保持不变）"""
+    return [item if isinstance(item, NewsItem) else NewsItem.from_dict(item) for item in items]
+
+
+def to_dicts(items: Iterable[Any]) -> List[Dict[str, Any]]:
+    """批量转换为可 JSON 序列化的 dict（已是 dict 的保持不变）"""
+    return [item.to_dict() if isinstance(item, NewsItem) else item for item in items]
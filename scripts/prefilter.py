@@ -0,0 +1,171 @@
+"""
+AI News Aggregator - 本地预筛选
+在 LLM 价值评估之前用关键词 / 实体特征给内容打分
+
+明显与 AI 无关的内容（例如 NYT 合集 feed 中的文化类文章）直接丢弃，
+明显有价值的内容直接通过，只有中间的内容交给 LLM 评估。
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, List, Sequence, Tuple
+
+import enrich
+
+# 公司、产品、人物在标注阶段识别（enrich.py，条目的 "实体" 字段），这里只列概念词
+AI_CONCEPTS = ("GPU", "LLM", "AI Agent", "coding", "agentic", "data center")
+
+# 行业动态词本身不说明与 AI 相关，只作为弱信号
+INDUSTRY_TERMS = ("merger", "acquires", "investment", "funding", "launch", "update", "ban", "regulation")
+
+# AI 领域词汇（正则，不区分大小写）
+AI_TERMS = (
+    r"artificial intelligence", r"machine learning", r"deep learning", r"neural net(?:work)?s?",
+    r"large language models?", r"language models?", r"LLMs", r"generative", r"gen ?AI",
+    r"chat ?bots?", r"GPT[-\w.]*", r"AGI", r"agents?", r"fine[- ]tun\w*", r"prompts?",
+    r"inference", r"reinforcement learning", r"diffusion", r"robot(?:s|ics)?", r"autonomous",
+    r"人工智能", r"大模型", r"机器学习", r"深度学习", r"智能体", r"生成式", r"神经网络",
+)
+
+# 与 AI 无关的常见题材（负分）
+OFF_TOPIC_TERMS = (
+    r"recipes?", r"cooking", r"restaurants?", r"wedding", r"fashion", r"runway",
+    r"football", r"basketball", r"soccer", r"tennis", r"NBA", r"NFL", r"Olympics?",
+    r"horoscope", r"celebrit(?:y|ies)", r"movie review", r"album", r"concert", r"theater",
+    r"novel", r"poetry", r"obituary", r"travel", r"real estate",
+)
+
+# "AI" / "A.I." 需要区分大小写单独匹配，避免命中普通单词
+_AI_ACRONYM = re.compile(r"(?<![\w.])A\.?I\.?(?!\w)")
+
+# 特征权重
+ENTITY_WEIGHT = 1.5        # AI 相关公司、人物、产品，以及 AI_CONCEPTS
+AI_TERM_WEIGHT = 2.0       # AI 领域词汇
+INDUSTRY_WEIGHT = 0.5      # 行业动态词
+OFF_TOPIC_WEIGHT = -2.0    # 无关题材
+TRUSTED_SOURCE_WEIGHT = 2.0  # AI 专门来源（config 中的 trusted_sources）
+CONTENT_FACTOR = 0.5       # 只出现在描述中的特征按一半计分
+CONTENT_CHARS = 500        # 描述只取开头部分
+
+# 默认阈值：低于 reject_below 丢弃，不低于 accept_at 直接通过
+DEFAULT_REJECT_BELOW = 1.0
+DEFAULT_ACCEPT_AT = 4.0
+
+PREFILTER_ACCEPT_REASON = "本地预筛选通过"
+
+
+def _term_pattern(term: str, ignore_case: bool = True) -> re.Pattern:
+    return re.compile(rf"(?<!\w){term}(?!\w)", re.IGNORECASE if ignore_case else 0)
+
+
+def _build_features() -> List[Tuple[str, float, re.Pattern]]:
+    features = []
+    for term in AI_CONCEPTS + INDUSTRY_TERMS:
+        weight = INDUSTRY_WEIGHT if term in INDUSTRY_TERMS else ENTITY_WEIGHT
+        if term.islower():
+            # 普通词允许常见词尾变化（launches、funded）
+            pattern = _term_pattern(re.escape(term) + r"(?:s|es|d|ed|ing)?")
+        else:
+            # 缩写和专有名词区分大小写，避免普通单词命中
+            pattern = _term_pattern(re.escape(term), ignore_case=False)
+        features.append((term, weight, pattern))
+    features.extend((term, AI_TERM_WEIGHT, _term_pattern(term)) for term in AI_TERMS)
+    features.extend((term, OFF_TOPIC_WEIGHT, _term_pattern(term)) for term in OFF_TOPIC_TERMS)
+    return features
+
+
+FEATURES = _build_features()
+
+
+def score_item(item: Any, trusted_sources: Collection[str] = ()) -> Tuple[float, List[str]]:
+    """
+    计算条目与 AI 的相关度
+
+    实体读取标注阶段的结果，其余特征在标题和描述开头中查找。
+
+    Args:
+        item: 内容项
+        trusted_sources: AI 专门来源名称（与来源名完全一致）
+
+    Returns:
+        (分数, 命中的词)
+    """
+    title = item.get("标题", "") or ""
+    content = (item.get("内容", "") or "")[:CONTENT_CHARS]
+
+    score = 0.0
+    hits = []
+    for name, where in enrich.entities(item).items():
+        score += ENTITY_WEIGHT if where == enrich.TITLE else ENTITY_WEIGHT * CONTENT_FACTOR
+        hits.append(name)
+
+    features = FEATURES + [("AI", AI_TERM_WEIGHT, _AI_ACRONYM)]
+    for _, weight, pattern in features:
+        match = pattern.search(title)
+        if match:
+            score += weight
+        else:
+            match = pattern.search(content)
+            if not match:
+                continue
+            score += weight * CONTENT_FACTOR
+        hits.append(match.group(0))
+
+    source = item.get("来源", "") or ""
+    if source in trusted_sources:
+        score += TRUSTED_SOURCE_WEIGHT
+        hits.append(f"来源:{source}")
+
+    return score, hits
+
+
+@dataclass
+class PrefilterResult:
+    """预筛选结果：直接通过、需要 LLM 评估、丢弃的条目"""
+    accepted: List[Any] = field(default_factory=list)
+    ambiguous: List[Any] = field(default_factory=list)
+    rejected: List[Any] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.accepted) + len(self.ambiguous) + len(self.rejected)
+
+    def summary(self) -> str:
+        if not self.total:
+            return "无内容"
+        decided = len(self.accepted) + len(self.rejected)
+        return (
+            f"丢弃 {len(self.rejected)} 条，直接通过 {len(self.accepted)} 条，"
+            f"{len(self.ambiguous)} 条交给 LLM 评估；"
+            f"省去 {decided / self.total:.0%} 的价值评估调用"
+        )
+
+
+def prefilter_items(items: Sequence[Any], config: Dict[str, Any]) -> PrefilterResult:
+    """
+    按分数把条目分为三组
+
+    直接通过的条目写入 "价值评估"（命中的特征），后续不再调用 LLM 评估。
+
+    Args:
+        items: 内容项列表
+        config: llm.prefilter 配置段（reject_below、accept_at、trusted_sources）
+
+    Returns:
+        PrefilterResult，各组保持输入顺序
+    """
+    reject_below = config.get("reject_below", DEFAULT_REJECT_BELOW)
+    accept_at = config.get("accept_at", DEFAULT_ACCEPT_AT)
+    trusted_sources = set(config.get("trusted_sources") or ())
+
+    result = PrefilterResult()
+    for item in items:
+        score, hits = score_item(item, trusted_sources)
+        if score < reject_below:
+            result.rejected.append(item)
+        elif score >= accept_at:
+            item["价值评估"] = f"{PREFILTER_ACCEPT_REASON}（{'、'.join(hits[:5])}）"
+            result.accepted.append(item)
+        else:
+            result.ambiguous.append(item)
+    return result
@@ -5,16 +5,29 @@ AI News Aggregator - 主运行脚本
 
 import os
 import sys
+import json
+import argparse
 import yaml
 import subprocess
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
 
 # 添加脚本目录到路径
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-from fetchers import fetch_all_sources
+import enrich
+import http_client
+import llm_cache
+import llm_gateway
+import translation_memory
+from fetchers import fetch_all_sources, FetchStats
+from source_registry import load_config_sources
+from news_item import from_dicts
+from dedupe import dedupe_items, canonicalize_url
+from story_cluster import cluster_stories, expand_clusters
+from state_store import FeedValidatorCache, FeedHealthStore, WatermarkStore
 from llm_processor import process_batch, generate_daily_summary
 from feishu_output import export_to_json, export_to_markdown, export_to_feishu, export_to_html, FeishuBitableClient
 
@@ -95,8 +108,98 @@ def load_config(config_path: str = None) -> dict:
     }
 
 
+# 板块 → 数据源类型（各抓取器写入的板块）
+SECTION_SOURCE_TYPES = {"新闻": "rss", "视频": "youtube", "社交媒体": "twitter"}
+
+# 抓取器输出的日期格式：RSS / YouTube 为 UTC 时间，Twitter 为 created_at 原值
+ITEM_DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%a %b %d %H:%M:%S %z %Y")
+
+
+def parse_item_date(value: str) -> Optional[datetime]:
+    """解析内容项的日期，返回 UTC 时间（不带时区）；无法解析时返回 None"""
+    value = (value or "").strip()
+    parsed = None
+    for fmt in ITEM_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+            break
+        except ValueError:
+            continue
+    if parsed is None:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def source_windows(sources_config: Dict[str, Any]) -> Dict[str, int]:
+    """已启用数据源的时间窗口（小时）：类型 → 窗口"""
+    return {
+        source_type: source.get("hours", 24)
+        for source_type, source in sources_config.items()
+        if isinstance(source, dict) and source.get("enabled")
+    }
+
+
+def merge_previous_items(new_items: list, previous_path: str, windows: Dict[str, int]) -> list:
+    """
+    合并上次输出中仍在时间窗口内的内容
+
+    条件请求命中 304 的 feed、以及增量水位之前的条目不会再次返回，
+    这些条目已在上次运行中处理过，直接沿用上次 news.json 中的结果；
+    同一链接（按规范化链接比较）以本次结果为准。
+
+    Args:
+        new_items: 本次处理结果
+        previous_path: 上次的 news.json
+        windows: 数据源类型 → 时间窗口（小时），按条目的板块判断类型；
+            板块未知的条目使用最大的窗口，类型未启用的条目不再保留
+    """
+    path = Path(previous_path)
+    if not path.exists():
+        return new_items
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            previous_items = from_dicts(json.load(f))
+    except Exception as e:
+        print(f"   ⚠️ 无法读取上次结果: {e}")
+        return new_items
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    default_hours = max(windows.values() or [24])
+    new_links = {canonicalize_url(item.get("链接", "")) for item in new_items}
+
+    kept = []
+    for item in previous_items:
+        if canonicalize_url(item.get("链接", "")) in new_links:
+            continue
+        source_type = SECTION_SOURCE_TYPES.get(item.get("板块", ""))
+        if source_type is None:
+            hours = default_hours
+        elif source_type in windows:
+            hours = windows[source_type]
+        else:
+            continue
+        pub_time = parse_item_date(item.get("日期", ""))
+        if pub_time is not None and pub_time >= now - timedelta(hours=hours):
+            kept.append(item)
+
+    return new_items + kept
+
+
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="AI News Aggregator")
+    parser.add_argument(
+        "--full-window", action="store_true",
+        help="忽略增量水位和条件请求，重新获取并处理整个时间窗口内的内容（用于重建输出）"
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("🤖 AI News Aggregator")
     print("=" * 60)
@@ -104,45 +207,101 @@ def main():
     # 1. 加载配置
     print("\n📋 加载配置...")
     config = load_config()
+    http_client.configure_from_config(config)
+    llm_cache.configure_from_config(config)
+    llm_gateway.configure_from_config(config)
+    translation_memory.configure_from_config(config)
     print(f"   RSS: {'✅' if config['sources']['rss']['enabled'] else '❌'}")
     print(f"   YouTube: {'✅' if config['sources'].get('youtube', {}).get('enabled') else '❌'}")
     print(f"   Twitter: {'✅' if config['sources'].get('twitter', {}).get('enabled') else '❌'}")
 
     # 2. 获取数据
     print("\n🔍 获取数据...")
-    raw_items = fetch_all_sources(config["sources"])
-    print(f"   获取到 {len(raw_items)} 条原始内容")
+    if args.full_window:
+        print("   全窗口模式：重新获取时间窗口内的全部内容")
+    # 全窗口模式下不发条件请求，否则未变化的 feed 会返回 304
+    validator_cache = None if args.full_window else FeedValidatorCache()
+    windows = source_windows(config["sources"])
+    watermarks = WatermarkStore(full_window=args.full_window, retention_hours=max(windows.values() or [24]))
+    feed_health = FeedHealthStore()
+    fetch_stats = FetchStats()
+    raw_items = fetch_all_sources(
+        config["sources"], validator_cache=validator_cache, watermarks=watermarks,
+        stats=fetch_stats, health=feed_health, sources=load_config_sources(config)
+    )
+    # 健康记录与本次处理结果无关，抓取结束即保存
+    feed_health.commit()
+    print(f"   获取到 {len(raw_items)} 条新内容")
+    print(f"   抓取统计: {fetch_stats.summary()}")
+    if fetch_stats.partial:
+        print(f"   ⚠️ 部分来源超时（结果不完整）: {', '.join(fetch_stats.partial)}")
+    if fetch_stats.skipped:
+        print(f"   ⏸️ 熔断冷却中，已跳过: {', '.join(fetch_stats.skipped)}")
 
     if not raw_items:
-        print("   ⚠️  未获取到任何内容")
+        print("   ⚠️  未获取到任何新内容，保留上次结果")
+        if validator_cache is not None:
+            validator_cache.commit()
+        watermarks.commit()
         return
 
-    # 3. LLM 处理
+    # 合并多个来源中的重复内容，避免为重复项调用 LLM
+    raw_items, collapsed = dedupe_items(raw_items)
+    if collapsed:
+        details = ", ".join(f"{source} {count}" for source, count in collapsed.most_common())
+        print(f"   去重: 合并 {sum(collapsed.values())} 条重复内容（{details}），剩余 {len(raw_items)} 条")
+
+    # 每条内容标注一次实体和主题（基于原标题），预筛选、摘要和导出直接读取
+    enrich.enrich_items(raw_items)
+    entity_count = sum(1 for item in raw_items if item[enrich.ENTITIES_KEY])
+    print(f"   标注: {entity_count}/{len(raw_items)} 条内容识别出公司/产品/人物")
+
+    # 不同来源对同一事件的报道聚为一簇，每簇只处理代表条目
     llm_config = config.get("llm", {})
-    if llm_config.get("api_key") or os.getenv("DEEPSEEK_API_KEY"):
+    clusters = []
+    representatives = raw_items
+    if llm_config.get("cluster_stories", True):
+        clusters = cluster_stories(raw_items, llm_config.get("cluster_threshold", 0.5))
+        representatives = [cluster.representative for cluster in clusters]
+        clustered = len(raw_items) - len(representatives)
+        if clustered:
+            print(f"   聚类: {clustered} 条内容并入 {sum(1 for c in clusters if c.members)} 个故事簇")
+
+    # 3. LLM 处理
+    failed_links = set()
+    if llm_gateway.available():
         print("\n🧠 LLM 处理中...")
         print("   - 翻译: ✅" if llm_config.get("translate") else "   - 翻译: ❌")
         print("   - 摘要: ✅" if llm_config.get("summarize") else "   - 摘要: ❌")
         print("   - 分类: ✅" if llm_config.get("categorize") else "   - 分类: ❌")
 
-        processed_items = process_batch(raw_items, llm_config)
+        processed_items = expand_clusters(process_batch(representatives, llm_config, failed_links), clusters)
         print(f"   处理后 {len(processed_items)} 条内容")
+        if failed_links:
+            print(f"   ⚠️ {len(failed_links)} 条内容 LLM 处理失败，本次不推进增量状态，下次运行重新处理")
     else:
         print("\n⚠️  未配置 DeepSeek API Key，跳过 LLM 处理")
-        processed_items = raw_items
+        # 未经 LLM 处理时成员保留自己的标题
+        processed_items = expand_clusters(representatives, clusters, inherit=())
 
     # 4. 输出结果
     print("\n📤 输出结果...")
 
     output_config = config.get("output", {})
 
+    # 合并上次结果中已处理过的内容（未变化的 feed、水位之前的条目）
+    new_items = processed_items
+    json_path = output_config.get("json", {}).get("path", "./output/news.json")
+    processed_items = merge_previous_items(processed_items, json_path, windows)
+    # 旧版 news.json 中的条目没有标注字段
+    enrich.enrich_items(processed_items)
+
     # 生成中文摘要
     print("\n📝 生成中文摘要...")
     daily_summary = generate_daily_summary(processed_items)
 
     # JSON
     if output_config.get("json", {}).get("enabled", True):
-        json_path = output_config["json"].get("path", "./output/news.json")
         export_to_json(processed_items, json_path)
 
     # Markdown
@@ -158,12 +317,26 @@ def main():
     feishu_count = 0
     if output_config.get("feishu", {}).get("enabled", False):
         feishu_config = output_config["feishu"]
-        feishu_count = export_to_feishu(processed_items, feishu_config, send_notification=True)
+        # 只写入本次新增的内容
+        feishu_count = export_to_feishu(new_items, feishu_config, send_notification=True)
         print(f"   飞书: {feishu_count} 条记录")
 
+    # 输出完成后再保存校验值和水位，避免中途失败导致下次丢失内容；
+    # LLM 处理有失败时不保存，下次重新抓取这些条目（成功的条目命中 LLM 缓存）
+    if not failed_links:
+        if validator_cache is not None:
+            validator_cache.commit()
+        watermarks.commit()
+
     print("\n✅ 完成!")
     print(f"   共处理 {len(processed_items)} 条内容")
     print(f"   HTML 报告: {html_path}")
+    print(f"   LLM 调用: {llm_gateway.get_stats().summary()}")
+    print(f"   LLM 缓存: {llm_cache.get_cache().summary()}")
+    print(f"   翻译记忆: {translation_memory.get_memory().summary()}")
+    report_path = Path(json_path).parent / "run_report.json"
+    if llm_gateway.write_report(report_path, "run_aggregator", replace=True):
+        print(f"   运行报告: {report_path}")
 
     # 5. 更新网站摘要（index.html 和 app.js）
     update_web_summary()
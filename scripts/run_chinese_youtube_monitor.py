@@ -14,6 +14,7 @@ from datetime import datetime
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
+import http_client
 from chinese_youtube_monitor import ChineseYouTubeMonitor, export_viral_report
 from feishu_output import export_to_feishu
 
@@ -81,6 +82,7 @@ def main():
 
     # 加载配置
     config = load_config()
+    http_client.configure_from_config(config)
     monitor_config = config.get("youtube_chinese", {})
 
     # 检查是否启用
@@ -0,0 +1,169 @@
+"""
+AI News Aggregator - Source Registry
+所有数据源的声明：内置源 + config.yaml 中的 custom_* 和 sources.feeds
+
+每个源声明自己的类型、URL、轮询间隔、超时、并发类别和条目上限，
+抓取引擎据此调度，新增源只需修改配置。
+"""
+
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Optional
+
+SOURCE_TYPES = ("rss", "youtube", "twitter", "reddit")
+
+YOUTUBE_FEED_URL = "https://www.youtube.com/feeds/videos.xml"
+
+
+@dataclass
+class SourceSpec:
+    """单个数据源声明"""
+    name: str
+    type: str                              # rss / youtube / twitter / reddit
+    url: str                               # feed URL；Twitter / Reddit 为主页 URL
+    poll_interval: int = 0                 # 最短轮询间隔（分钟），0 表示每次运行都抓取
+    timeout: Optional[float] = None        # 单源截止时间（秒），默认使用 sources.feed_timeout
+    concurrency_class: str = "default"     # 并发类别，对应 sources.concurrency_classes
+    item_limit: Optional[int] = None       # 每次最多返回的条目数
+
+    @property
+    def handle(self) -> str:
+        """Twitter 账户名 / Subreddit 名（URL 最后一段）"""
+        return self.url.rstrip("/").rsplit("/", 1)[-1]
+
+
+# 内置数据源
+BUILTIN_SOURCES: List[SourceSpec] = [
+    # RSS 新闻
+    SourceSpec("The Verge AI", "rss", "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml"),
+    SourceSpec("TechCrunch AI", "rss", "https://techcrunch.com/category/artificial-intelligence/feed/"),
+    SourceSpec(
+        "NYT AI", "rss",
+        "https://www.nytimes.com/svc/collections/v1/publish/https://www.nytimes.com/spotlight/artificial-intelligence/rss.xml",
+        concurrency_class="slow"
+    ),
+
+    # AI 相关频道的 RSS 订阅（使用 user 参数或正确的 channel_id）
+    SourceSpec("Google", "youtube", f"{YOUTUBE_FEED_URL}?user=Google", item_limit=10),
+    SourceSpec("Google for Developers", "youtube", f"{YOUTUBE_FEED_URL}?user=GoogleDevelopers", item_limit=10),
+    SourceSpec("MIT CSAIL", "youtube", f"{YOUTUBE_FEED_URL}?user=mitcsail", item_limit=10),
+    SourceSpec("TED", "youtube", f"{YOUTUBE_FEED_URL}?user=TED", item_limit=10),
+
+    # AI 博主频道
+    SourceSpec("Tina Huang", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UC2UXDak6o7rBm23k3Vv5dww", item_limit=10),
+    SourceSpec("The AI Advantage", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UC98re_9VsuVfXisV_AnU6Sg", item_limit=10),
+    SourceSpec("Liam Ottley", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UCui4jxDaMb53Gdh-AZUTPAg", item_limit=10),
+    SourceSpec("Andrej Karpathy", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UCPk8m_nTeFiPrnve3_pS7sg", item_limit=10),
+    SourceSpec("Dr Alex Young", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UCf_o982iSIn6A0O8O3_u2-g", item_limit=10),
+    SourceSpec("DeepLearningAI", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UCcIXc5mJsHVYTZR1maL5l9w", item_limit=10),
+    SourceSpec("Two Minute Papers", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UCbfYPyITQ-7l4upoX8nvctg", item_limit=10),
+    SourceSpec("AI Explained", "youtube", f"{YOUTUBE_FEED_URL}?channel_id=UCN9v4QG3nuX6Gml406j_uYg", item_limit=10),
+
+    # Twitter / X 账户
+    SourceSpec("OpenAI", "twitter", "https://twitter.com/OpenAI", item_limit=10),
+    SourceSpec("GoogleAI", "twitter", "https://twitter.com/GoogleAI", item_limit=10),
+
+    # Reddit
+    SourceSpec("r/artificial", "reddit", "https://www.reddit.com/r/artificial"),
+    SourceSpec("r/MachineLearning", "reddit", "https://www.reddit.com/r/MachineLearning"),
+    SourceSpec("r/singularity", "reddit", "https://www.reddit.com/r/singularity"),
+]
+
+
+def youtube_channel_source(channel: str, known: Optional[List[SourceSpec]] = None) -> SourceSpec:
+    """
+    将自定义频道转换为 YouTube feed 源
+
+    支持完整 RSS URL、频道 ID（UC 开头）、handle（@ 开头）或用户名
+    """
+    if channel.startswith('http'):
+        name = "Custom"
+        # 从 URL 中提取频道 ID，尝试从已知源中找到名称
+        if 'channel_id=' in channel:
+            channel_id = channel.split('channel_id=')[-1]
+            for spec in known or []:
+                if channel_id in spec.url:
+                    name = spec.name
+                    break
+        return SourceSpec(name, "youtube", channel, item_limit=10)
+
+    # 频道 ID 用 channel_id 参数，handle 和用户名用 user 参数
+    param = 'channel_id' if channel.startswith('UC') else 'user'
+    return SourceSpec(f"Channel {channel}", "youtube", f"{YOUTUBE_FEED_URL}?{param}={channel}", item_limit=10)
+
+
+def _custom_sources(custom: Dict[str, Any], known: List[SourceSpec]) -> List[SourceSpec]:
+    """config.yaml custom 段中的源"""
+    specs = []
+
+    for name, url in (custom.get("custom_rss") or {}).items():
+        specs.append(SourceSpec(name, "rss", url))
+
+    for channel in custom.get("custom_youtube_channels") or []:
+        specs.append(youtube_channel_source(channel, known))
+
+    for account in custom.get("custom_twitter_accounts") or []:
+        account = account.lstrip("@")
+        specs.append(SourceSpec(account, "twitter", f"https://twitter.com/{account}", item_limit=10))
+
+    for subreddit in custom.get("custom_subreddits") or []:
+        subreddit = subreddit.replace("r/", "")
+        specs.append(SourceSpec(f"r/{subreddit}", "reddit", f"https://www.reddit.com/r/{subreddit}"))
+
+    return specs
+
+
+def _declared_sources(feeds: List[Dict[str, Any]]) -> List[SourceSpec]:
+    """sources.feeds 中逐条声明的源"""
+    allowed = {f.name for f in fields(SourceSpec)}
+    specs = []
+    for feed in feeds or []:
+        if feed.get("type") not in SOURCE_TYPES or not feed.get("url"):
+            print(f"⚠️ 忽略无效的源声明: {feed}")
+            continue
+        spec = SourceSpec(**{k: v for k, v in feed.items() if k in allowed and k != "name"},
+                          name=feed.get("name") or feed["url"])
+        specs.append(spec)
+    return specs
+
+
+def load_sources(config: Dict[str, Any]) -> List[SourceSpec]:
+    """
+    加载所有源声明：内置源、custom_* 和 sources.feeds
+
+    同一 URL 只保留第一次声明（例如 custom_youtube_channels 里的 "Google"
+    与内置的 Google 频道重复时只抓一次）。
+
+    Args:
+        config: sources 配置段，custom 段以 "custom" 键传入
+
+    Returns:
+        按 内置 → custom → feeds 顺序排列的源列表
+    """
+    custom = config.get("custom") or {}
+    declared = _declared_sources(config.get("feeds"))
+    all_specs = BUILTIN_SOURCES + _custom_sources(custom, BUILTIN_SOURCES) + declared
+
+    seen_urls = set()
+    specs = []
+    for spec in all_specs:
+        key = spec.url.lower()
+        if key in seen_urls:
+            continue
+        seen_urls.add(key)
+        specs.append(spec)
+    return specs
+
+
+def load_config_sources(config: Dict[str, Any]) -> List[SourceSpec]:
+    """
+    按完整的 config.yaml 加载源声明（sources 段，加上顶层 custom 段中的 custom_*）
+
+    run_aggregator 与 generate_static 都用它生成源列表，保证两者抓取的源一致。
+    """
+    sources_config = dict(config.get("sources") or {}, custom=config.get("custom") or {})
+    return load_sources(sources_config)
+
+
+def sources_of_type(specs: List[SourceSpec], source_type: str) -> List[SourceSpec]:
+    """按类型筛选"""
+    return [spec for spec in specs if spec.type == source_type]
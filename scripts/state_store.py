@@ -0,0 +1,238 @@
+"""
+AI News Aggregator - 持久化状态存储
+跨运行保存抓取状态（feed 的 ETag / Last-Modified 校验值、增量水位、健康状况等）
+"""
+
+import json
+import statistics
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+# 状态文件目录（项目根目录下的 data/）
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+class JsonStateStore:
+    """
+    按 key 存储记录的 JSON 文件，线程安全
+
+    运行中的更新先用 stage() 暂存，commit() 时才生效并落盘；
+    被 discard() 的 key（如超时放弃的 feed）本次运行不再接受更新。
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        self._discarded: Set[str] = set()
+        self._load()
+
+    def _load(self):
+        try:
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ 无法加载状态文件 {self.path.name}: {e}")
+            self._data = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """读取已提交的记录"""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def stage(self, key: str, value: Any):
+        """暂存一条更新，commit() 后生效"""
+        with self._lock:
+            if key not in self._discarded:
+                self._pending[key] = value
+
+    def discard(self, key: str):
+        """丢弃 key 的暂存更新，并忽略本次运行中之后的更新"""
+        with self._lock:
+            self._pending.pop(key, None)
+            self._discarded.add(key)
+
+    def commit(self):
+        """提交暂存的更新并保存"""
+        with self._lock:
+            self._data.update(self._pending)
+            self._pending = {}
+        self.save()
+
+    def save(self):
+        """写回文件（先写临时文件再替换，避免中断时损坏）"""
+        with self._lock:
+            data = dict(self._data)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            print(f"⚠️ 无法保存状态文件 {self.path.name}: {e}")
+
+
+class FeedValidatorCache(JsonStateStore):
+    """
+    按 feed URL 缓存 HTTP 校验值，用于条件请求
+
+    下次请求时带上 If-None-Match / If-Modified-Since，
+    服务端返回 304 时说明 feed 未变化，可以直接跳过解析。
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        super().__init__(path or DATA_DIR / "feed_validators.json")
+
+    def validators(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """返回 (etag, last_modified)"""
+        record = self.get(url) or {}
+        return record.get("etag"), record.get("modified")
+
+    def update(self, url: str, etag: Optional[str], modified: Optional[str]):
+        """记录服务端返回的最新校验值"""
+        if etag or modified:
+            self.stage(url, {"etag": etag, "modified": modified})
+
+
+class WatermarkStore(JsonStateStore):
+    """
+    按 feed URL 记录已处理过的条目 ID（及其发布时间）
+
+    抓取时只放行没有处理过的条目，迟到的条目（发布时间早于已处理的条目，
+    例如延迟索引或编辑后重新发布）只要仍在时间窗口内就会被抓取。
+    只保留 retention_hours 内发布的条目，每个 feed 最多 MAX_IDS 个；
+    窗口之外的条目由抓取器按截止时间过滤，不需要记录。
+
+    本次看到的条目先暂存，调用 commit() 后才生效并落盘，保证只有成功的运行才会推进水位。
+    full_window=True 时不过滤（用于重建输出），但仍记录条目。
+    """
+
+    TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+    DEFAULT_RETENTION_HOURS = 168
+    MAX_IDS = 500
+
+    def __init__(self, path: Optional[Path] = None, full_window: bool = False, retention_hours: Optional[int] = None):
+        super().__init__(path or DATA_DIR / "watermarks.json")
+        self.full_window = full_window
+        self.retention_hours = retention_hours or self.DEFAULT_RETENTION_HOURS
+
+    @staticmethod
+    def _to_utc_naive(published: datetime) -> datetime:
+        if published.tzinfo is not None:
+            published = published.astimezone(timezone.utc).replace(tzinfo=None)
+        return published.replace(microsecond=0)
+
+    @staticmethod
+    def _seen(record: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """条目 ID → 发布时间；兼容旧格式 {"published", "ids"}"""
+        if not record:
+            return {}
+        if "seen" in record:
+            return record["seen"]
+        return {entry_id: record["published"] for entry_id in record.get("ids", [])}
+
+    def _prune(self, seen: Dict[str, str]) -> Dict[str, str]:
+        """去掉窗口之外的条目，数量超出上限时保留最新的"""
+        cutoff = (datetime.now(timezone.utc).replace(tzinfo=None)
+                  - timedelta(hours=self.retention_hours)).strftime(self.TIME_FORMAT)
+        kept = sorted(((stamp, entry_id) for entry_id, stamp in seen.items() if stamp >= cutoff), reverse=True)
+        return {entry_id: stamp for stamp, entry_id in kept[:self.MAX_IDS]}
+
+    def is_new(self, key: str, published: datetime, entry_id: str) -> bool:
+        """判断条目是否未在之前成功的运行中处理过"""
+        if self.full_window:
+            return True
+        return entry_id not in self._seen(self.get(key))
+
+    def observe(self, key: str, published: datetime, entry_id: str):
+        """记录本次处理的条目，commit() 后生效"""
+        stamp = self._to_utc_naive(published).strftime(self.TIME_FORMAT)
+
+        with self._lock:
+            if key in self._discarded:
+                return
+            seen = dict(self._seen(self._pending.get(key) or self._data.get(key)))
+            seen[entry_id] = stamp
+            self._pending[key] = {"seen": self._prune(seen)}
+
+
+class FeedHealthStore(JsonStateStore):
+    """
+    按 feed URL 记录健康状况，并实现熔断
+
+    记录连续失败次数、最近成功 / 失败时间和最近几次耗时。
+    连续失败达到阈值后熔断，在冷却期内跳过该源；
+    冷却时间随连续失败次数指数增长，成功一次即恢复。
+    """
+
+    FAILURE_THRESHOLD = 2          # 连续失败多少次后熔断
+    BASE_COOLDOWN_HOURS = 1        # 首次熔断的冷却时间
+    MAX_COOLDOWN_HOURS = 48        # 冷却时间上限
+    LATENCY_SAMPLES = 10           # 保留最近几次耗时
+
+    TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+    def __init__(self, path: Optional[Path] = None):
+        super().__init__(path or DATA_DIR / "feed_health.json")
+
+    def _current(self, key: str) -> Dict[str, Any]:
+        """读取本次运行中最新的记录（含未提交的更新）"""
+        with self._lock:
+            record = self._pending.get(key) or self._data.get(key) or {}
+        return dict(record, latencies=list(record.get("latencies", [])))
+
+    def allow(self, key: str) -> bool:
+        """熔断冷却期内返回 False"""
+        open_until = self.get(key, {}).get("open_until")
+        if not open_until:
+            return True
+        return datetime.now() >= datetime.strptime(open_until, self.TIME_FORMAT)
+
+    def is_due(self, key: str, poll_interval: int) -> bool:
+        """距上次成功抓取已超过 poll_interval 分钟时返回 True"""
+        last_success = self.get(key, {}).get("last_success")
+        if not poll_interval or not last_success:
+            return True
+        elapsed = datetime.now() - datetime.strptime(last_success, self.TIME_FORMAT)
+        return elapsed >= timedelta(minutes=poll_interval)
+
+    def record_success(self, key: str, name: str, latency: float):
+        record = self._current(key)
+        record.update({
+            "name": name,
+            "consecutive_failures": 0,
+            "last_success": datetime.now().strftime(self.TIME_FORMAT),
+            "open_until": None,
+            "latencies": (record["latencies"] + [round(latency, 3)])[-self.LATENCY_SAMPLES:],
+        })
+        self.stage(key, record)
+
+    def record_failure(self, key: str, name: str, latency: float, error: str = ""):
+        record = self._current(key)
+        failures = record.get("consecutive_failures", 0) + 1
+        open_until = None
+        if failures >= self.FAILURE_THRESHOLD:
+            cooldown = min(
+                self.BASE_COOLDOWN_HOURS * 2 ** (failures - self.FAILURE_THRESHOLD),
+                self.MAX_COOLDOWN_HOURS
+            )
+            open_until = (datetime.now() + timedelta(hours=cooldown)).strftime(self.TIME_FORMAT)
+        record.update({
+            "name": name,
+            "consecutive_failures": failures,
+            "last_failure": datetime.now().strftime(self.TIME_FORMAT),
+            "last_error": error[:200],
+            "open_until": open_until,
+            "latencies": (record["latencies"] + [round(latency, 3)])[-self.LATENCY_SAMPLES:],
+        })
+        self.stage(key, record)
+
+    def median_latency(self, key: str) -> Optional[float]:
+        """最近几次抓取耗时的中位数（秒）"""
+        latencies = self._current(key)["latencies"]
+        return statistics.median(latencies) if latencies else None
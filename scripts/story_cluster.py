@@ -0,0 +1,209 @@
+"""
+AI News Aggregator - 近似重复聚类
+把不同来源对同一事件的报道（标题措辞不同）归为一个故事簇
+
+对规范化后的标题 + 描述取词集合，计算 MinHash 签名并按 LSH 分段分桶，
+只比较落在同一个桶里的候选对，整体接近线性时间。
+每个簇只把代表条目交给 LLM，其余成员继承代表的处理结果。
+"""
+
+import hashlib
+import random
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+from dedupe import canonicalize_url
+
+# MinHash 签名长度 = BANDS * ROWS；阈值约为 (1 / BANDS) ** (1 / ROWS) ≈ 0.5
+BANDS = 16
+ROWS = 4
+NUM_HASHES = BANDS * ROWS
+
+DEFAULT_THRESHOLD = 0.5     # 词集合 Jaccard 相似度达到该值视为同一故事
+MIN_TOKENS = 3              # 词数太少的条目不参与聚类
+DESCRIPTION_CHARS = 300     # 描述只取开头部分，避免长正文稀释标题
+
+# 输出中的簇字段
+CLUSTER_KEY = "聚类"
+ALSO_COVERED_KEY = "同类报道"
+
+# 成员从代表继承的 LLM 处理结果
+INHERITED_FIELDS = ("标题", "分类", "价值评估")
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+_HASH_PARAMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_HASHES)]
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "of", "to", "in", "on", "for", "with", "at", "by",
+    "from", "as", "is", "are", "was", "were", "be", "been", "it", "its", "this", "that",
+    "these", "those", "has", "have", "had", "will", "can", "could", "would", "should",
+    "about", "into", "over", "after", "new", "says", "said", "how", "what", "why", "you",
+    "your", "we", "our", "they", "their", "he", "she", "his", "her", "not", "now", "just",
+    "more", "than", "up", "out", "all", "some", "here", "s",
+}
+
+
+def tokenize(text: str) -> Set[str]:
+    """小写英文词（去停用词）+ 中文二元组"""
+    text = _TAG_RE.sub(" ", text or "").lower()
+    tokens = {word for word in _WORD_RE.findall(text) if word not in STOPWORDS}
+    for run in _CJK_RE.findall(text):
+        if len(run) == 1:
+            tokens.add(run)
+        tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def item_tokens(item: Any) -> Set[str]:
+    """条目的特征词集合（标题 + 描述开头）"""
+    return tokenize(f"{item.get('标题', '')} {(item.get('内容') or '')[:DESCRIPTION_CHARS]}")
+
+
+def minhash(tokens: Iterable[str]) -> List[int]:
+    """MinHash 签名"""
+    hashed = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+    return [min((a * h + b) % _PRIME for h in hashed) for a, b in _HASH_PARAMS]
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class StoryCluster:
+    """一个故事簇，items[0] 为代表条目"""
+    id: str
+    items: List[Any] = field(default_factory=list)
+
+    @property
+    def representative(self) -> Any:
+        return self.items[0]
+
+    @property
+    def members(self) -> List[Any]:
+        return self.items[1:]
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # 以较早出现的条目为根，保证代表条目稳定
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def _cluster_id(item: Any) -> str:
+    return hashlib.md5(canonicalize_url(item.get("链接", "")).encode("utf-8")).hexdigest()[:10]
+
+
+def cluster_stories(items: Sequence[Any], threshold: float = DEFAULT_THRESHOLD) -> List[StoryCluster]:
+    """
+    将条目聚成故事簇
+
+    只在同一板块内聚类；候选对由 LSH 分桶产生，再用真实 Jaccard 相似度确认。
+    多成员簇的每个条目会写入 "聚类"（簇 ID）和 "同类报道"（其他成员的来源和链接）。
+
+    Args:
+        items: 内容项列表（已按链接去重）
+        threshold: Jaccard 相似度阈值
+
+    Returns:
+        簇列表，按代表条目在输入中的顺序排列；未聚类的条目自成一簇
+    """
+    token_sets = [item_tokens(item) for item in items]
+    uf = _UnionFind(len(items))
+
+    buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[int]] = {}
+    for index, tokens in enumerate(token_sets):
+        if len(tokens) < MIN_TOKENS:
+            continue
+        signature = minhash(tokens)
+        section = items[index].get("板块", "")
+        for band in range(BANDS):
+            key = (section, band, tuple(signature[band * ROWS:(band + 1) * ROWS]))
+            buckets.setdefault(key, []).append(index)
+
+    checked: Set[Tuple[int, int]] = set()
+    for candidates in buckets.values():
+        if len(candidates) < 2:
+            continue
+        for i, a in enumerate(candidates):
+            for b in candidates[i + 1:]:
+                if (a, b) in checked or uf.find(a) == uf.find(b):
+                    continue
+                checked.add((a, b))
+                if jaccard(token_sets[a], token_sets[b]) >= threshold:
+                    uf.union(a, b)
+
+    groups: Dict[int, List[Any]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(uf.find(index), []).append(item)
+
+    clusters = []
+    for root in sorted(groups):
+        members = groups[root]
+        cluster = StoryCluster(_cluster_id(members[0]), members)
+        if len(members) > 1:
+            for item in members:
+                item[CLUSTER_KEY] = cluster.id
+                item[ALSO_COVERED_KEY] = [
+                    {"来源": other.get("来源", ""), "链接": other.get("链接", "")}
+                    for other in members if other is not item
+                ]
+        clusters.append(cluster)
+    return clusters
+
+
+def expand_clusters(
+    processed: List[Any],
+    clusters: List[StoryCluster],
+    inherit: Sequence[str] = INHERITED_FIELDS
+) -> List[Any]:
+    """
+    把代表条目的处理结果扩展回簇成员
+
+    成员紧跟在代表条目之后输出，继承代表的 inherit 字段（翻译后的标题、分类、
+    价值评估），其余字段（来源、链接、日期等）保持自己的值；
+    代表被价值过滤掉时整个簇一起丢弃。
+
+    Args:
+        processed: process_batch 对代表条目的处理结果
+        clusters: cluster_stories() 的结果
+        inherit: 成员继承的字段
+
+    Returns:
+        包含全部成员的结果列表
+    """
+    by_id = {cluster.id: cluster for cluster in clusters if len(cluster.items) > 1}
+
+    results = []
+    for item in processed:
+        results.append(item)
+        cluster = by_id.pop(item.get(CLUSTER_KEY), None)
+        if cluster is None:
+            continue
+        for member in cluster.members:
+            member = member.copy()
+            for key in inherit:
+                if key in item:
+                    member[key] = item[key]
+            results.append(member)
+    return results
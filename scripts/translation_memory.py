@@ -0,0 +1,272 @@
+"""
+AI News Aggregator - 翻译记忆
+跨运行、跨模块共享的标题翻译缓存
+
+按规范化后的原标题（HTML 实体解码、引号统一、空白合并）保存每次 LLM 翻译结果，
+翻译前先查记忆；可选的模糊匹配（默认关闭）用于识别只改了标点、大小写或虚词的标题。
+记忆保存在 data/translation_memory.json，超过条目上限时淘汰最久未使用的记录。
+"""
+
+import difflib
+import html
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from state_store import DATA_DIR
+
+DEFAULT_PATH = DATA_DIR / "translation_memory.json"
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_FUZZY_CUTOFF = 0.92    # difflib 相似度不低于该值视为同一标题
+FUZZY_LENGTH_SLACK = 0.1       # 模糊匹配只比较长度相差 10% 以内的标题
+
+# 模糊匹配时忽略的虚词；否定词、动词、数字都必须一致
+# （"will release" 与 "will not release"、"launches" 与 "delays" 相似度都超过 0.92）
+STOPWORDS = frozenset({
+    "a", "an", "the", "of", "to", "in", "on", "at", "for", "by", "with", "from", "as",
+    "and", "or", "its", "it", "this", "that", "is", "are", "be",
+})
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _content_words(key: str) -> FrozenSet[str]:
+    """标题中的实词（小写，去掉虚词）"""
+    return frozenset(word for word in _WORD.findall(key.lower()) if word not in STOPWORDS)
+
+
+# 人工维护的标题翻译，首次使用时写入翻译记忆
+SEED_TRANSLATIONS = {
+    # The Verge - 精确匹配解码后的标题
+    "Google's annual revenue tops $400 billion for the first time": "Google 年收入首次突破 4000 亿美元",
+    "Sam Altman responds to Anthropic's 'funny' Super Bowl ads": "Sam Altman 回应 Anthropic 超级碗广告",
+    "OpenClaw's AI 'skill' extensions are a security nightmare": "OpenClaw AI 扩展存在严重安全问题",
+    "GitHub adds Claude and Codex AI coding agents": "GitHub 添加 Claude 和 Codex AI 编程助手",
+    "Anthropic says 'Claude will remain ad-free,' unlike ChatGPT": "Anthropic 承诺 Claude 将永远无广告",
+    "Sen. Warren wants to know what Google Gemini's built-in checkout means for user privacy": "参议员 Warren 质疑 Google Gemini 结账功能隐私问题",
+
+    # TechCrunch
+    "Sam Altman got exceptionally testy over Claude Super Bowl ads": "Sam Altman 对 Claude 超级碗广告反应强烈",
+    "Alphabet won't talk about the Google-Apple AI deal, even to investors": "Alphabet 拒绝谈论 Google-Apple AI 合作",
+    "Google's Gemini app has surpassed 750M monthly active users": "Google Gemini 月活用户超 7.5 亿",
+    "Meet Gizmo: A TikTok for interactive, vibe-coded mini apps": "Gizmo：类似 TikTok 的交互式应用平台",
+    "AI SRE Resolve AI confirms $125M raise, unicorn valuation": "Resolve AI 获 1.25 亿美元融资，估值达独角兽",
+    "Amazon to begin testing AI tools for film and TV production next month": "Amazon 将开始测试影视制作 AI 工具",
+    "A16z just raised $1.7B for AI infrastructure": "A16z 筹集 17 亿美元专注 AI 基础设施",
+    "ElevenLabs raises $500M from Sequoia at an $11 billion valuation": "ElevenLabs 融资 5 亿美元，估值达 110 亿美元",
+    "Alexa+, Amazon's AI assistant, is now available to everyone in the US": "Alexa+ AI 助手向全美开放",
+    "Tinder looks to AI to help fight 'swipe fatigue' and dating app burnout": "Tinder 使用 AI 对抗滑动疲劳",
+    "ChatGPT now lets you call the AI for free": "ChatGPT 现在支持免费语音通话",
+    "OpenAI in 'advanced talks' to host a data center with Oracle": "OpenAI 与 Oracle 洽谈建设数据中心",
+    "Former Character.AI founders launch a new educational AI startup": "Character.AI 联合创始人推出教育 AI 创业公司",
+
+    # NYT
+    "Google Plans to Double Spending Amid A.I. Race": "Google 计划在 AI 竞赛中加倍投入",
+    "Babies, Robots and Climate Change": "婴儿、机器人与气候变化",
+    "Why A.I. Fears Are Battering Stocks, Again": "AI 恐惧再次冲击股市",
+    "Bedrock, an A.I. Start-Up for Construction, Raises $270 Million": "Bedrock 机器人公司融资 2.7 亿美元",
+    "A.I. Loves Fake Images. But They've Been a Thing Since Photography Began.": "AI 与虚假图片的历史",
+}
+
+
+def normalize_quotes(text: str) -> str:
+    """将各种引号规范化为标准的直引号"""
+    # Curly quotes to straight quotes mapping
+    quote_map = {
+        '\u2018': "'",  # Left single quotation mark
+        '\u2019': "'",  # Right single quotation mark
+        '\u201c': '"',  # Left double quotation mark
+        '\u201d': '"',  # Right double quotation mark
+        '\u0060': "'",  # Grave accent
+        '\u00b4': "'",  # Acute accent
+        '\u201a': ',',  # Single low-9 quotation mark
+        '\u201b': "'",  # Single high-reversed-9 quotation mark
+        '\u201e': '"',  # Double low-9 quotation mark
+        '\u201f': '"',  # Double high-reversed-9 quotation mark
+    }
+    for curly, straight in quote_map.items():
+        text = text.replace(curly, straight)
+    return text
+
+
+def normalize_title(title: str) -> str:
+    """翻译记忆的键：HTML 实体解码、引号统一、合并空白"""
+    return " ".join(normalize_quotes(html.unescape(title or "")).split())
+
+
+class TranslationMemory:
+    """标题翻译记忆，线程安全，记录本次运行的命中情况"""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        fuzzy: bool = False,
+        fuzzy_cutoff: float = DEFAULT_FUZZY_CUTOFF,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True
+    ):
+        self.path = Path(path or DEFAULT_PATH)
+        self.fuzzy = fuzzy
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        # 模糊匹配的候选：实词集合 → 已有标题
+        self._by_words: Optional[Dict[FrozenSet[str], List[str]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            entries: Dict[str, Dict[str, Any]] = {}
+            try:
+                if self.path.exists():
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        entries = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 无法加载翻译记忆 {self.path.name}: {e}")
+                entries = {}
+            # 人工翻译优先于记忆中的 LLM 翻译
+            for title, translation in SEED_TRANSLATIONS.items():
+                key = normalize_title(title)
+                if entries.get(key, {}).get("译文") != translation:
+                    entries[key] = {"译文": translation, "used": time.time()}
+                    self._dirty = True
+            self._entries = entries
+        return self._entries
+
+    def lookup(self, title: str) -> Optional[str]:
+        """
+        查找标题的已有翻译
+
+        Args:
+            title: 原标题
+
+        Returns:
+            译文；没有记录时返回 None
+        """
+        if not self.enabled:
+            return None
+        key = normalize_title(title)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None and self.fuzzy:
+                match = self._fuzzy_key(key, entries)
+                if match is not None:
+                    entry = entries[match]
+                    self.fuzzy_hits += 1
+            elif entry is not None:
+                self.hits += 1
+            if entry is None:
+                self.misses += 1
+                return None
+            entry["used"] = time.time()
+            self._dirty = True
+            return entry["译文"]
+
+    def _fuzzy_key(self, key: str, entries: Dict[str, Dict[str, Any]]) -> Optional[str]:
+        """
+        实词集合完全相同、相似度最高的已有标题
+
+        只在实词相同的标题中比较相似度：否定词、动词或数字不同的标题即使字面相近，
+        意思也可能相反，不能复用译文。
+        """
+        if self._by_words is None:
+            self._by_words = {}
+            for other in entries:
+                self._by_words.setdefault(_content_words(other), []).append(other)
+        slack = max(2, int(len(key) * FUZZY_LENGTH_SLACK))
+        candidates = [
+            other for other in self._by_words.get(_content_words(key), ())
+            if other in entries and abs(len(other) - len(key)) <= slack
+        ]
+        best, best_ratio = None, self.fuzzy_cutoff
+        for other in candidates:
+            ratio = difflib.SequenceMatcher(None, key.lower(), other.lower()).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = other, ratio
+        return best
+
+    def store(self, title: str, translation: str):
+        """记录一次翻译（译文与原文相同时不记录）"""
+        if not self.enabled or not translation:
+            return
+        key = normalize_title(title)
+        translation = translation.strip()
+        if not key or translation == key:
+            return
+        with self._lock:
+            entries = self._load()
+            if key not in entries and self._by_words is not None:
+                self._by_words.setdefault(_content_words(key), []).append(key)
+            entries[key] = {"译文": translation, "used": time.time()}
+            self._dirty = True
+
+    def save(self):
+        """保存到磁盘（先写临时文件再替换），超出条目上限时淘汰最久未使用的记录"""
+        with self._lock:
+            if not self.enabled or not self._dirty or self._entries is None:
+                return
+            if len(self._entries) > self.max_entries:
+                keep = sorted(self._entries.items(), key=lambda pair: pair[1].get("used", 0), reverse=True)
+                self._entries = dict(keep[:self.max_entries])
+                self._by_words = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                tmp_path.replace(self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"⚠️ 无法保存翻译记忆 {self.path.name}: {e}")
+
+    def summary(self) -> str:
+        """本次运行的命中统计"""
+        if not self.enabled:
+            return "未启用"
+        return f"命中 {self.hits}，模糊命中 {self.fuzzy_hits}，未命中 {self.misses}"
+
+
+_memory: Optional[TranslationMemory] = None
+
+
+def configure(
+    enabled: bool = True,
+    fuzzy: bool = False,
+    fuzzy_cutoff: float = DEFAULT_FUZZY_CUTOFF,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    path: Optional[str] = None
+) -> TranslationMemory:
+    """替换进程内共享的翻译记忆"""
+    global _memory
+    _memory = TranslationMemory(path=path, fuzzy=fuzzy, fuzzy_cutoff=fuzzy_cutoff,
+                                max_entries=max_entries, enabled=enabled)
+    return _memory
+
+
+def configure_from_config(config: Dict[str, Any]) -> TranslationMemory:
+    """按 config.yaml 中的 llm.translation_memory 段配置"""
+    memory_config = (config.get("llm") or {}).get("translation_memory") or {}
+    return configure(
+        enabled=memory_config.get("enabled", True),
+        fuzzy=memory_config.get("fuzzy", False),
+        fuzzy_cutoff=memory_config.get("fuzzy_cutoff", DEFAULT_FUZZY_CUTOFF),
+        max_entries=memory_config.get("max_entries", DEFAULT_MAX_ENTRIES),
+        path=memory_config.get("path")
+    )
+
+
+def get_memory() -> TranslationMemory:
+    """进程内共享的翻译记忆（未配置时使用默认设置）"""
+    global _memory
+    if _memory is None:
+        _memory = TranslationMemory()
+    return _memory
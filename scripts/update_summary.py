@@ -13,6 +13,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 
+import enrich
+import llm_cache
+import lang_detect
+import llm_gateway
+import translation_memory
+from keyword_matcher import KeywordMatcher
+from translation_memory import normalize_quotes
+
 # DeepSeek API 配置
 def load_api_key():
     """从环境变量或配置文件加载 API Key"""
@@ -42,8 +50,11 @@ def load_api_key():
     return None, None
 
 DEEPSEEK_API_KEY, DEEPSEEK_BASE_URL = load_api_key()
-if DEEPSEEK_BASE_URL and not DEEPSEEK_BASE_URL.endswith("/v1"):
-    DEEPSEEK_BASE_URL = DEEPSEEK_BASE_URL + "/v1"
+llm_gateway.configure(api_key=DEEPSEEK_API_KEY, base_url=DEEPSEEK_BASE_URL)
+
+
+# 翻译前的语言检查（统计跳过的中文标题）
+TRANSLATION_GATE = lang_detect.TranslationGate()
 
 
 # 固定的中文摘要（用于 fallback）
@@ -53,60 +64,37 @@ FIXED_SUMMARIES = {
     "nyt": "亚马逊 2000 亿美元支出计划提升 AI 竞赛赌注；《梅拉尼娅》：看第一夫人在眼皮底下消失"
 }
 
-
-# 英文标题到中文的简单翻译映射
-# 注意：这里的 key 必须与 HTML 实体解码后的标题完全匹配
-TITLE_TRANSLATIONS = {
-    # The Verge - 精确匹配解码后的标题
-    "Google's annual revenue tops $400 billion for the first time": "Google 年收入首次突破 4000 亿美元",
-    "Sam Altman responds to Anthropic's 'funny' Super Bowl ads": "Sam Altman 回应 Anthropic 超级碗广告",
-    "OpenClaw's AI 'skill' extensions are a security nightmare": "OpenClaw AI 扩展存在严重安全问题",
-    "GitHub adds Claude and Codex AI coding agents": "GitHub 添加 Claude 和 Codex AI 编程助手",
-    "Anthropic says 'Claude will remain ad-free,' unlike ChatGPT": "Anthropic 承诺 Claude 将永远无广告",
-    "Sen. Warren wants to know what Google Gemini's built-in checkout means for user privacy": "参议员 Warren 质疑 Google Gemini 结账功能隐私问题",
-
-    # TechCrunch
-    "Sam Altman got exceptionally testy over Claude Super Bowl ads": "Sam Altman 对 Claude 超级碗广告反应强烈",
-    "Alphabet won't talk about the Google-Apple AI deal, even to investors": "Alphabet 拒绝谈论 Google-Apple AI 合作",
-    "Google's Gemini app has surpassed 750M monthly active users": "Google Gemini 月活用户超 7.5 亿",
-    "Meet Gizmo: A TikTok for interactive, vibe-coded mini apps": "Gizmo：类似 TikTok 的交互式应用平台",
-    "AI SRE Resolve AI confirms $125M raise, unicorn valuation": "Resolve AI 获 1.25 亿美元融资，估值达独角兽",
-    "Amazon to begin testing AI tools for film and TV production next month": "Amazon 将开始测试影视制作 AI 工具",
-    "A16z just raised $1.7B for AI infrastructure": "A16z 筹集 17 亿美元专注 AI 基础设施",
-    "ElevenLabs raises $500M from Sequoia at an $11 billion valuation": "ElevenLabs 融资 5 亿美元，估值达 110 亿美元",
-    "Alexa+, Amazon's AI assistant, is now available to everyone in the US": "Alexa+ AI 助手向全美开放",
-    "Tinder looks to AI to help fight 'swipe fatigue' and dating app burnout": "Tinder 使用 AI 对抗滑动疲劳",
-    "ChatGPT now lets you call the AI for free": "ChatGPT 现在支持免费语音通话",
-    "OpenAI in 'advanced talks' to host a data center with Oracle": "OpenAI 与 Oracle 洽谈建设数据中心",
-    "Former Character.AI founders launch a new educational AI startup": "Character.AI 联合创始人推出教育 AI 创业公司",
-
-    # NYT
-    "Google Plans to Double Spending Amid A.I. Race": "Google 计划在 AI 竞赛中加倍投入",
-    "Babies, Robots and Climate Change": "婴儿、机器人与气候变化",
-    "Why A.I. Fears Are Battering Stocks, Again": "AI 恐惧再次冲击股市",
-    "Bedrock, an A.I. Start-Up for Construction, Raises $270 Million": "Bedrock 机器人公司融资 2.7 亿美元",
-    "A.I. Loves Fake Images. But They've Been a Thing Since Photography Began.": "AI 与虚假图片的历史",
+# 标题简单翻译用的关键词（整词匹配，不区分大小写）
+TITLE_KEYWORDS = {
+    "Google": "谷歌", "OpenAI": "OpenAI", "Anthropic": "Anthropic",
+    "Claude": "Claude", "ChatGPT": "ChatGPT", "Gemini": "Gemini",
+    "AI": "AI", "raises": "融资", "raise": "融资", "investment": "投资",
+    "launch": "发布", "released": "发布", "revenue": "收入", "users": "用户",
+    "billion": "十亿", "million": "百万", "tops": "突破", "surpassed": "超过",
+    "monthly active": "月活跃", "app": "应用", "ads": "广告", "ad": "广告",
+    "extension": "扩展", "security": "安全", "nightmare": "噩梦",
+    "coding": "编程", "assistant": "助手", "available": "可用", "testing": "测试",
+    "tools": "工具", "production": "制作", "infrastructure": "基础设施",
+    "valuation": "估值", "plans": "计划", "spending": "投入", "race": "竞赛",
 }
 
+# YouTube 摘要展示的主题和公司（只看标题；enrich.py 中的主题名 → 展示名，实体名见 enrich.py）
+SUMMARY_TOPICS = {
+    "AI 商业与创业": "AI 商业与创业",
+    "AI 项目演示": "AI 项目演示",
+    "AI 理论与研究": "AI 理论与研究",
+    "AI 趋势与展望": "AI 趋势与展望",
+    "AI 教程与学习": "AI 教程学习",
+    "AI 编程与开发": "AI 编程开发",
+}
+SUMMARY_COMPANIES = {
+    "Google/Gemini": ("Google", "Gemini"),
+    "OpenAI": ("OpenAI", "ChatGPT"),
+    "Anthropic/Claude": ("Anthropic", "Claude"),
+    "DeepSeek": ("DeepSeek",),
+}
 
-def normalize_quotes(text: str) -> str:
-    """将各种引号规范化为标准的直引号"""
-    # Curly quotes to straight quotes mapping
-    quote_map = {
-        '\u2018': "'",  # Left single quotation mark
-        '\u2019': "'",  # Right single quotation mark
-        '\u201c': '"',  # Left double quotation mark
-        '\u201d': '"',  # Right double quotation mark
-        '\u0060': "'",  # Grave accent
-        '\u00b4': "'",  # Acute accent
-        '\u201a': ',',  # Single low-9 quotation mark
-        '\u201b': "'",  # Single high-reversed-9 quotation mark
-        '\u201e': '"',  # Double low-9 quotation mark
-        '\u201f': '"',  # Double high-reversed-9 quotation mark
-    }
-    for curly, straight in quote_map.items():
-        text = text.replace(curly, straight)
-    return text
+TITLE_KEYWORD_MATCHER = KeywordMatcher(TITLE_KEYWORDS, word_boundary=True)
 
 
 def translate_with_deepseek(title: str) -> str:
@@ -119,19 +107,16 @@ def translate_with_deepseek(title: str) -> str:
     Returns:
         中文翻译
     """
+    memory = translation_memory.get_memory()
+    remembered = memory.lookup(title)
+    if remembered:
+        return remembered
+
     if not DEEPSEEK_API_KEY:
         print("警告：未设置 DEEPSEEK_API_KEY 环境变量，使用简单翻译")
         return None
 
-    try:
-        from openai import OpenAI
-
-        client = OpenAI(
-            api_key=DEEPSEEK_API_KEY,
-            base_url=DEEPSEEK_BASE_URL
-        )
-
-        prompt = f"""请将以下新闻标题翻译成中文，要求简洁、准确、专业。标题：{title}
+    prompt = f"""请将以下新闻标题翻译成中文，要求简洁、准确、专业。标题：{title}
 
 注意：
 1. 只输出翻译后的中文标题，不要有任何解释或额外内容
@@ -139,21 +124,15 @@ def translate_with_deepseek(title: str) -> str:
 3. 公司名称可以保留英文或使用中文通译
 4. 翻译要简洁，符合中文新闻标题的习惯"""
 
-        response = client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=200
-        )
-
-        translated = response.choices[0].message.content.strip()
-        return translated
-
-    except ImportError:
+    if not llm_gateway.HAS_OPENAI:
         print("警告：未安装 openai 库，使用简单翻译")
         return None
+
+    try:
+        with llm_gateway.stage_scope("translate_title"):
+            translated = llm_gateway.complete(prompt, max_tokens=200).strip()
+        memory.store(title, translated)
+        return translated
     except Exception as e:
         print(f"DeepSeek API 调用失败: {e}")
         return None
@@ -175,33 +154,13 @@ def translate_title(title: str) -> str:
     # 规范化引号：将 curly quotes 转换为 straight quotes
     normalized_title = normalize_quotes(decoded_title)
 
-    # 先尝试完全匹配（使用规范化的标题）
-    if normalized_title in TITLE_TRANSLATIONS:
-        return TITLE_TRANSLATIONS[normalized_title]
-
-    # 移除多余空白
-    clean_title = ' '.join(normalized_title.split())
-
-    if clean_title in TITLE_TRANSLATIONS:
-        return TITLE_TRANSLATIONS[clean_title]
-
-    # 简单翻译：提取关键词
-    keywords = {
-        "Google": "谷歌", "OpenAI": "OpenAI", "Anthropic": "Anthropic",
-        "Claude": "Claude", "ChatGPT": "ChatGPT", "Gemini": "Gemini",
-        "AI": "AI", "raises": "融资", "raise": "融资", "investment": "投资",
-        "launch": "发布", "released": "发布", "revenue": "收入", "users": "用户",
-        "billion": "十亿", "million": "百万", "tops": "突破", "surpassed": "超过",
-        "monthly active": "月活跃", "app": "应用", "ads": "广告", "ad": "广告",
-        "extension": "扩展", "security": "安全", "nightmare": "噩梦",
-        "coding": "编程", "assistant": "助手", "available": "可用", "testing": "测试",
-        "tools": "工具", "production": "制作", "infrastructure": "基础设施",
-        "valuation": "估值", "plans": "计划", "spending": "投入", "race": "竞赛",
-    }
+    # 先查翻译记忆（包含人工维护的翻译和之前的 LLM 翻译）
+    remembered = translation_memory.get_memory().lookup(title)
+    if remembered:
+        return remembered
 
-    result = normalized_title
-    for en, zh in keywords.items():
-        result = re.sub(r'\b' + en + r'\b', zh, result, flags=re.IGNORECASE)
+    # 简单翻译：一次扫描替换关键词
+    result = TITLE_KEYWORD_MATCHER.replace(normalized_title)
 
     return result if result != normalized_title else normalized_title
 
@@ -240,6 +199,11 @@ def extract_key_news(items: List[Dict], source_filter: str = None, limit: int =
     for item in filtered[:limit]:
         title = item.get("标题", "")
 
+        # 已是中文的标题直接使用
+        if not TRANSLATION_GATE.needs_translation(title):
+            key_news.append(title)
+            continue
+
         # 优先使用 DeepSeek API 翻译
         translated = translate_with_deepseek(title)
         if not translated:
@@ -328,35 +292,10 @@ def generate_summary_html(items: List[Dict]) -> str:
         channel_count = len(channels)
         video_count = stats["youtube"]
 
-        # 提取主题
-        all_titles = " ".join([item.get("标题", "") for item in youtube_items])
-        topics = []
-
-        topic_keywords = {
-            "商业|创业|business|entrepreneur": "AI 商业与创业",
-            "演示|demo|project|showcase": "AI 项目演示",
-            "理论|研究|paper|research": "AI 理论与研究",
-            "趋势|展望|future|trend": "AI 趋势与展望",
-            "教程|tutorial|how to|guide": "AI 教程学习",
-            "编程|coding|programming": "AI 编程开发",
-        }
-
-        for pattern, topic in topic_keywords.items():
-            if re.search(pattern, all_titles, re.IGNORECASE):
-                topics.append(topic)
-
-        # 检测公司
-        companies = []
-        company_keywords = {
-            "google|gemini": "Google/Gemini",
-            "openai|chatgpt": "OpenAI",
-            "anthropic|claude": "Anthropic/Claude",
-            "deepseek": "DeepSeek",
-        }
-
-        for pattern, company in company_keywords.items():
-            if re.search(pattern, all_titles, re.IGNORECASE):
-                companies.append(company)
+        # 标题中的主题和公司（标注阶段的结果，旧数据缺少字段时现场标注）
+        detected = enrich.collect(youtube_items, enrich.TOPICS_KEY, where=enrich.TITLE)
+        topics = [label for topic, label in SUMMARY_TOPICS.items() if topic in detected]
+        companies = enrich.group_labels(enrich.collect(youtube_items, where=enrich.TITLE), SUMMARY_COMPANIES)
 
         topic_str = "、".join(topics[:4]) if topics else "AI 相关内容"
         company_str = "、".join(companies[:2]) if companies else "主流 AI"
@@ -434,7 +373,8 @@ def update_app_js(items: List[Dict], app_js_path: str = None):
                 escaped_value = escape_js_string(value)
                 js_lines.append(f'"{key}": "{escaped_value}",')
             else:
-                js_lines.append(f'"{key}": {value},')
+                # 数字、列表（如同类报道）按 JSON 输出
+                js_lines.append(f'"{key}": {json.dumps(value, ensure_ascii=False)},')
         # 移除最后一行的逗号
         js_lines[-1] = js_lines[-1].rstrip(',')
         js_lines.append('    },')
@@ -465,6 +405,14 @@ def main():
     project_root = Path(__file__).parent.parent
     news_json_path = project_root / "output" / "news.json"
 
+    config_path = project_root / "config.yaml"
+    if config_path.exists():
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+        llm_cache.configure_from_config(config)
+        llm_gateway.configure_from_config(config)
+        translation_memory.configure_from_config(config)
+
     # 读取新闻数据
     if not news_json_path.exists():
         print(f"❌ 未找到数据文件: {news_json_path}")
@@ -504,6 +452,12 @@ def main():
     update_index_html(summary_html, index_path)
 
     print(f"   - {index_path.name} (GitHub Pages)")
+    print(f"   LLM 调用: {llm_gateway.get_stats().summary()}")
+    print(f"   LLM 缓存: {llm_cache.get_cache().summary()}")
+    translation_memory.get_memory().save()
+    print(f"   翻译记忆: {translation_memory.get_memory().summary()}")
+    print(f"   语言检测: {TRANSLATION_GATE.summary()}")
+    llm_gateway.write_report(project_root / "output" / "run_report.json", "update_summary")
 
     print("\n✅ 全部更新完成！")
     print("\n📌 下一步：")
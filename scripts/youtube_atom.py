@@ -0,0 +1,123 @@
+"""
+AI News Aggregator - YouTube Atom Parser
+YouTube 频道 feed（videos.xml）的快速解析器
+
+基于增量 XML 解析，只提取标题、链接、发布时间、描述和 media:statistics，
+遇到早于截止时间的条目即停止。feed 结构不符合预期时返回 None，
+由调用方回退到 feedparser。
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+YT_NS = "{http://www.youtube.com/xml/schemas/2015}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+
+# 每次送入解析器的字节数
+CHUNK_SIZE = 8192
+
+
+def _parse_entry(entry: ET.Element) -> Optional[Dict[str, Any]]:
+    """提取单个 <entry> 的字段，缺少必要字段时返回 None"""
+    video_id = entry.findtext(f"{YT_NS}videoId")
+    published = entry.findtext(f"{ATOM_NS}published")
+
+    link = None
+    for link_el in entry.iter(f"{ATOM_NS}link"):
+        if link_el.get("rel", "alternate") == "alternate":
+            link = link_el.get("href")
+            break
+
+    if not (video_id and published and link):
+        return None
+
+    try:
+        published_at = datetime.fromisoformat(published.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if published_at.tzinfo is None:
+        return None
+
+    group = entry.find(f"{MEDIA_NS}group")
+    description = ""
+    view_count = 0
+    if group is not None:
+        description = group.findtext(f"{MEDIA_NS}description") or ""
+        stats = group.find(f"{MEDIA_NS}community/{MEDIA_NS}statistics")
+        if stats is not None:
+            try:
+                view_count = int(stats.get("views", 0))
+            except ValueError:
+                view_count = 0
+
+    return {
+        "id": f"yt:video:{video_id}",
+        "title": entry.findtext(f"{ATOM_NS}title") or "",
+        "link": link,
+        "published": published_at,
+        "description": description,
+        "view_count": view_count,
+    }
+
+
+def parse_youtube_feed(
+    content: bytes,
+    cutoff: Optional[datetime] = None,
+    limit: Optional[int] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    解析 YouTube 频道 Atom feed
+
+    Args:
+        content: feed 原始字节
+        cutoff: 带时区的截止时间，遇到更早的条目即停止解析
+        limit: 最多返回多少条
+
+    Returns:
+        条目列表（按 feed 顺序），每条包含 id、title、link、published（带时区）、
+        description、view_count；feed 看起来不对时返回 None
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    entries: List[Dict[str, Any]] = []
+    checked_root = False
+    last_published = None
+
+    try:
+        for offset in range(0, len(content), CHUNK_SIZE):
+            parser.feed(content[offset:offset + CHUNK_SIZE])
+            for event, element in parser.read_events():
+                if not checked_root:
+                    # 根节点必须是 Atom <feed>
+                    if event != "start" or element.tag != f"{ATOM_NS}feed":
+                        return None
+                    checked_root = True
+                    continue
+
+                if event != "end" or element.tag != f"{ATOM_NS}entry":
+                    continue
+
+                record = _parse_entry(element)
+                if record is None:
+                    return None
+                element.clear()
+
+                # YouTube feed 按发布时间倒序；顺序异常时交给 feedparser
+                if last_published is not None and record["published"] > last_published:
+                    return None
+                last_published = record["published"]
+
+                if cutoff is not None and record["published"] < cutoff:
+                    return entries
+
+                entries.append(record)
+                if limit is not None and len(entries) >= limit:
+                    return entries
+        parser.close()
+    except ET.ParseError:
+        return None
+
+    if not checked_root:
+        return None
+    return entries
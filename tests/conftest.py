@@ -0,0 +1,6 @@
+"""测试共用配置：脚本目录下的模块按平铺方式导入"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
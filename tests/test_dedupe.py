@@ -0,0 +1,90 @@
+"""链接规范化与去重"""
+
+import pytest
+
+from dedupe import canonicalize_url, dedupe_items
+
+VIDEO = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "http://youtube.com/watch?v=dQw4w9WgXcQ&t=42s&feature=share",
+    "https://www.youtube.com/watch?feature=youtu.be&v=dQw4w9WgXcQ&si=abc",
+    "https://youtu.be/dQw4w9WgXcQ?si=xyz",
+    "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://music.youtube.com/watch?v=dQw4w9WgXcQ&list=RD",
+    "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ?autoplay=1",
+    "https://www.youtube.com/live/dQw4w9WgXcQ",
+    "https://www.youtube.com/v/dQw4w9WgXcQ",
+    " https://www.youtube.com/watch?v=dQw4w9WgXcQ#comments ",
+])
+def test_youtube_forms(url):
+    assert canonicalize_url(url) == VIDEO
+
+
+def test_youtube_non_video_pages_keep_path():
+    assert canonicalize_url("https://www.youtube.com/@TED/videos?utm_source=x") == "https://youtube.com/@TED/videos"
+
+
+def test_tracking_params_removed_and_sorted():
+    url = "http://www.example.com:443/news//story/?utm_source=rss&b=2&fbclid=1&a=1#top"
+    assert canonicalize_url(url) == "https://example.com/news/story?a=1&b=2"
+    assert canonicalize_url("https://example.com/a?UTM_Medium=x&id=3") == "https://example.com/a?id=3"
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/article?source=123",
+    "https://example.com/article?ref=v2",
+    "https://example.com/article?partner=acme",
+    "https://example.com/article?feature=maps",
+])
+def test_site_specific_params_kept_elsewhere(url):
+    # 只在特定站点上是跟踪参数，其他站点上可能决定页面内容，不能合并
+    assert canonicalize_url(url) == url
+    assert canonicalize_url(url) != canonicalize_url("https://example.com/article")
+
+
+def test_site_specific_tracking_params_removed():
+    assert canonicalize_url("https://www.nytimes.com/2026/01/01/tech/ai.html?smid=url-share&partner=rss") == \
+        "https://nytimes.com/2026/01/01/tech/ai.html"
+    assert canonicalize_url("https://techcrunch.com/2026/01/01/ai/?guccounter=1") == "https://techcrunch.com/2026/01/01/ai"
+    assert canonicalize_url("https://www.youtube.com/@TED/videos?feature=share") == "https://youtube.com/@TED/videos"
+
+
+def test_non_default_port_kept():
+    assert canonicalize_url("https://example.com:8080/a") == "https://example.com:8080/a"
+
+
+@pytest.mark.parametrize("url", [
+    "https://x.com/OpenAI/status/123?s=20&t=abc",
+    "https://mobile.twitter.com/OpenAI/status/123",
+    "https://twitter.com/OpenAI/status/123/",
+])
+def test_twitter_host_aliases(url):
+    assert canonicalize_url(url) == "https://twitter.com/OpenAI/status/123"
+
+
+def test_reddit_host_alias():
+    assert canonicalize_url("https://old.reddit.com/r/artificial/comments/abc/") == \
+        "https://reddit.com/r/artificial/comments/abc"
+
+
+def test_unparsable_urls_returned_as_is():
+    assert canonicalize_url("  not a url ") == "not a url"
+    assert canonicalize_url(None) == ""
+
+
+def test_dedupe_merges_fields():
+    items = [
+        {"链接": "https://youtu.be/dQw4w9WgXcQ", "来源": "YouTube - A", "播放量": 10},
+        {"链接": VIDEO + "&feature=share", "来源": "YouTube - B", "播放量": 50, "内容": "desc"},
+        {"链接": "https://example.com/a", "来源": "RSS"},
+        {"来源": "no link"},
+    ]
+    kept, collapsed = dedupe_items(items)
+    assert [item["来源"] for item in kept] == ["YouTube - A", "RSS", "no link"]
+    assert kept[0]["播放量"] == 50
+    assert kept[0]["内容"] == "desc"
+    assert collapsed == {"YouTube - B": 1}
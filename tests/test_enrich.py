@@ -0,0 +1,58 @@
+"""实体与主题标注"""
+
+import pytest
+
+import enrich
+
+
+def _item(title, content=""):
+    return {"标题": title, "内容": content}
+
+
+@pytest.mark.parametrize("title", [
+    "How to make apple pie",
+    "The meta lesson",
+    "Artificial intelligence in schools",
+    "a mistral wind and a llama farm",
+])
+def test_common_words_are_not_entities(title):
+    assert enrich.entities(_item(title)) == {}
+
+
+@pytest.mark.parametrize("title, names", [
+    ("Meta and Apple sign deal", ["Apple", "Meta"]),
+    ("谷歌发布新模型，微软跟进", ["Google", "Microsoft"]),
+    ("deepseek and huggingface team up", ["DeepSeek", "Hugging Face"]),
+    ("Musk says xAI will ship Grok 5", ["xAI", "Grok", "Elon Musk"]),
+    ("Intel's new chips", ["Intel"]),
+])
+def test_entities(title, names):
+    assert list(enrich.entities(_item(title))) == names
+
+
+def test_title_hits_take_precedence_over_content():
+    item = enrich.enrich_item(_item("OpenAI ships an agent", "Built with Claude and OpenAI tools"))
+    assert item["实体"] == {"OpenAI": enrich.TITLE, "Claude": enrich.CONTENT}
+    assert item["主题"]["AI 智能体与自动化"] == enrich.TITLE
+
+
+def test_content_is_truncated():
+    item = enrich.enrich_item(_item("Weekly notes", "x " * enrich.CONTENT_CHARS + "OpenAI"))
+    assert item["实体"] == {}
+
+
+def test_enrich_items_skips_tagged_items():
+    tagged = {"标题": "OpenAI", "实体": {}, "主题": {}}
+    untagged = _item("OpenAI news")
+    assert enrich.enrich_items([tagged, untagged]) == 1
+    assert tagged["实体"] == {}
+    assert "OpenAI" in untagged["实体"]
+
+
+def test_collect_and_group_labels():
+    items = [_item("Gemini tutorial", "research paper by OpenAI"), _item("Claude demo")]
+    assert enrich.collect(items) == ["Gemini", "OpenAI", "Claude"]
+    assert enrich.collect(items, where=enrich.TITLE) == ["Gemini", "Claude"]
+    assert enrich.collect(items, enrich.TOPICS_KEY, where=enrich.TITLE) == ["AI 教程与学习", "大语言模型", "AI 项目演示"]
+    groups = {"Google/Gemini": ("Google", "Gemini"), "OpenAI": ("OpenAI",), "DeepSeek": ("DeepSeek",)}
+    assert enrich.group_labels(["OpenAI", "Gemini"], groups) == ["Google/Gemini", "OpenAI"]
@@ -0,0 +1,107 @@
+"""feed 健康记录：熔断、冷却与抓取时跳过"""
+
+from datetime import datetime, timedelta
+
+from fetchers import FetchStats, FetchTask, run_fetch_tasks
+from state_store import FeedHealthStore
+
+URL = "https://example.com/feed.xml"
+
+
+def _open_for_hours(store, key):
+    open_until = store.get(key, {}).get("open_until")
+    if not open_until:
+        return None
+    remaining = datetime.strptime(open_until, FeedHealthStore.TIME_FORMAT) - datetime.now()
+    return round(remaining / timedelta(hours=1))
+
+
+def test_breaker_opens_after_threshold(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    store.record_failure(URL, "feed", 1.0, "timeout")
+    store.commit()
+    assert store.allow(URL)
+    assert store.get(URL)["consecutive_failures"] == 1
+
+    store.record_failure(URL, "feed", 1.0, "timeout")
+    store.commit()
+    assert not store.allow(URL)
+    assert _open_for_hours(store, URL) == FeedHealthStore.BASE_COOLDOWN_HOURS
+
+
+def test_cooldown_grows_and_is_capped(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    cooldowns = []
+    for _ in range(10):
+        store.record_failure(URL, "feed", 1.0)
+        store.commit()
+        cooldowns.append(_open_for_hours(store, URL))
+    assert cooldowns[:5] == [None, 1, 2, 4, 8]
+    assert cooldowns[-1] == FeedHealthStore.MAX_COOLDOWN_HOURS
+
+
+def test_success_closes_breaker(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    for _ in range(3):
+        store.record_failure(URL, "feed", 1.0)
+    store.record_success(URL, "feed", 0.5)
+    store.commit()
+    record = store.get(URL)
+    assert store.allow(URL)
+    assert record["consecutive_failures"] == 0
+    assert record["open_until"] is None
+
+
+def test_expired_cooldown_allows_again(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    past = (datetime.now() - timedelta(minutes=1)).strftime(FeedHealthStore.TIME_FORMAT)
+    store.stage(URL, {"consecutive_failures": 2, "open_until": past})
+    store.commit()
+    assert store.allow(URL)
+
+
+def test_latency_median_keeps_recent_samples(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    assert store.median_latency(URL) is None
+    for latency in range(1, 15):
+        store.record_success(URL, "feed", float(latency))
+    assert store.get(URL) is None  # 提交前不生效
+    store.commit()
+    assert store.get(URL)["latencies"] == [float(value) for value in range(5, 15)]
+    assert store.median_latency(URL) == 9.5
+
+
+def test_is_due_respects_poll_interval(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    assert store.is_due(URL, 60)
+    store.record_success(URL, "feed", 0.1)
+    store.commit()
+    assert not store.is_due(URL, 60)
+    assert store.is_due(URL, 0)
+
+
+def test_run_fetch_tasks_skips_open_breaker_and_records_results(tmp_path):
+    store = FeedHealthStore(tmp_path / "health.json")
+    for _ in range(2):
+        store.record_failure("https://down", "down", 1.0)
+    store.commit()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    calls = []
+    tasks = [
+        FetchTask("RSS", "down", "https://down", lambda: calls.append("down") or []),
+        FetchTask("RSS", "ok", "https://ok", lambda: calls.append("ok") or ["item"]),
+        FetchTask("RSS", "bad", "https://bad", fail),
+    ]
+    stats = FetchStats()
+    assert run_fetch_tasks(tasks, stats=stats, health=store) == ["item"]
+    assert calls == ["ok"]
+    assert stats.skipped == ["RSS down"]
+    assert stats.completed == ["RSS ok"]
+    assert stats.failed == ["RSS bad"]
+
+    store.commit()
+    assert store.get("https://ok")["consecutive_failures"] == 0
+    assert store.get("https://bad")["consecutive_failures"] == 1
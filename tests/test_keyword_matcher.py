@@ -0,0 +1,82 @@
+"""KeywordMatcher 与原来逐个关键词循环的结果对比"""
+
+import re
+
+import pytest
+
+import update_summary
+from chinese_youtube_monitor import ChineseYouTubeMonitor
+from keyword_matcher import KeywordMatcher
+from llm_processor import ACTION_KEYWORDS, ACTION_MATCHER
+from translation_memory import SEED_TRANSLATIONS
+
+SAMPLES = list(SEED_TRANSLATIONS) + [
+    "OpenAI launches GPT-5 and updates ChatGPT",
+    "Google's Gemini beats Claude in coding tests",
+    "谷歌发布 AI工具，OpenAI跟进",
+    "AI教程：如何用 ChatGPT 写代码",
+    "Microsoft acquires startup in $2B merger",
+    "Intelligence community bans apps",
+    "",
+]
+
+
+def legacy_translate(title):
+    """原 translate_title：每个关键词依次 re.sub"""
+    result = title
+    for en, zh in update_summary.TITLE_KEYWORDS.items():
+        result = re.sub(r'\b' + en + r'\b', zh, result, flags=re.IGNORECASE)
+    return result
+
+
+def legacy_actions(text):
+    """原 _simple_chinese_summary 的动作检测：按表顺序子串匹配"""
+    text = text.lower()
+    return [label for stem, label in ACTION_KEYWORDS.items() if stem in text]
+
+
+@pytest.mark.parametrize("title", SAMPLES)
+def test_translate_matches_legacy(title):
+    assert update_summary.TITLE_KEYWORD_MATCHER.replace(title) == legacy_translate(title)
+
+
+@pytest.mark.parametrize("title", SAMPLES)
+def test_actions_match_legacy(title):
+    assert ACTION_MATCHER.labels(title) == list(dict.fromkeys(legacy_actions(title)))
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_youtube_monitor_matches_legacy(text):
+    ai_related = any(keyword.lower() in text.lower() for keyword in ChineseYouTubeMonitor.AI_KEYWORDS)
+    excluded = any(pattern in text for pattern in ChineseYouTubeMonitor.EXCLUDE_PATTERNS)
+    assert ChineseYouTubeMonitor.AI_MATCHER.search(text) == ai_related
+    assert ChineseYouTubeMonitor.EXCLUDE_MATCHER.search(text) == excluded
+
+
+def test_word_boundary_next_to_chinese():
+    matcher = KeywordMatcher({"ai": "AI", "谷歌": "Google"}, word_boundary=True)
+    assert matcher.labels("谷歌发布AI工具") == ["AI", "Google"]
+    assert matcher.labels("AI（人工智能）") == ["AI"]
+    assert matcher.labels("said in a paper") == []
+    assert matcher.labels("AI_agent") == []
+
+
+def test_overlapping_keywords():
+    matcher = KeywordMatcher(["data", "data center", "center", "ent"])
+    assert matcher.find("new data center") == {"data", "data center", "center", "ent"}
+
+    bounded = KeywordMatcher(["open", "openai", "ai"], word_boundary=True)
+    assert bounded.find("openai and ai") == {"openai", "ai"}
+    assert bounded.find("open ai") == {"open", "ai"}
+
+
+def test_labels_follow_table_order():
+    matcher = KeywordMatcher({"b": "B", "a|c": "A"})
+    assert matcher.labels("c b a") == ["B", "A"]
+
+
+def test_case_sensitive():
+    matcher = KeywordMatcher({"Apple": "Apple", "Meta": "Meta"}, word_boundary=True, case_sensitive=True)
+    assert matcher.labels("Apple and Meta") == ["Apple", "Meta"]
+    assert matcher.labels("how to make apple pie, the meta lesson") == []
+    assert matcher.replace("Apple apple", {"Apple": "苹果"}) == "苹果 apple"
@@ -0,0 +1,48 @@
+"""语言检测：中文标题判断与翻译前检查"""
+
+import pytest
+
+from lang_detect import TranslationGate, chinese_ratio, is_chinese
+
+
+@pytest.mark.parametrize("title", [
+    "OpenAI 发布 GPT-5",
+    "谷歌年收入首次突破 4000 亿美元",
+    "Sam Altman 回应 Anthropic 超级碗广告",
+    "ＡＩ 芯片需求激增",        # 全角字母
+    "人工智能",
+])
+def test_chinese_titles(title):
+    assert is_chinese(title)
+
+
+@pytest.mark.parametrize("title", [
+    "OpenAI launches GPT-5",
+    "Google Gemini app 超 7.5 亿 users in the US this month",
+    "AI 芯",                     # 汉字太少
+    "東京で AI の新サービスを発表",  # 日文
+    "삼성 AI 반도체 발표",         # 韩文
+    "",
+])
+def test_not_chinese_titles(title):
+    assert not is_chinese(title)
+
+
+def test_ratio_counts_words_not_letters():
+    # 2 个汉字对 2 个英文单词
+    assert chinese_ratio("OpenAI 发布 GPT5") == pytest.approx(2 / 4)
+    # 单独的数字不算单词
+    assert chinese_ratio("GPT-5 发布") == pytest.approx(2 / 3)
+
+
+def test_threshold_is_configurable():
+    title = "OpenAI and Google 发布新模型"
+    assert is_chinese(title, threshold=0.5)
+    assert not is_chinese(title, threshold=0.9)
+
+
+def test_gate_counts_skipped_titles():
+    gate = TranslationGate()
+    results = [gate.needs_translation(title) for title in ("OpenAI 发布 GPT-5", "OpenAI launches GPT-5")]
+    assert results == [False, True]
+    assert gate.summary() == "1/2 条标题已是中文，跳过翻译"
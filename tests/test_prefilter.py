@@ -0,0 +1,74 @@
+"""本地预筛选：打分特征与阈值分组"""
+
+import pytest
+
+import prefilter
+from prefilter import PREFILTER_ACCEPT_REASON, prefilter_items, score_item
+
+CONFIG = {"reject_below": 1.0, "accept_at": 4.0, "trusted_sources": ["TechCrunch AI", "YouTube - AI Explained"]}
+
+
+def _item(title, content="", source="NYT AI"):
+    return {"标题": title, "内容": content, "来源": source, "板块": "新闻"}
+
+
+@pytest.mark.parametrize("title", [
+    "How to make apple pie",
+    "The meta lesson of this season",
+    "Intelligence agencies and the new budget",
+    "The best Broadway musicals of the season",
+])
+def test_common_words_do_not_score(title):
+    assert score_item(_item(title))[0] == 0
+
+
+def test_feature_weights():
+    assert score_item(_item("OpenAI shows its roadmap"))[0] == prefilter.ENTITY_WEIGHT
+    assert score_item(_item("A new machine learning course"))[0] == prefilter.AI_TERM_WEIGHT
+    assert score_item(_item("Why A.I. fears are battering stocks"))[0] == prefilter.AI_TERM_WEIGHT
+    assert score_item(_item("The startup raised funding"))[0] == prefilter.INDUSTRY_WEIGHT
+    assert score_item(_item("Best recipes for the holidays"))[0] == prefilter.OFF_TOPIC_WEIGHT
+
+
+def test_content_hits_score_half():
+    score, hits = score_item(_item("A quiet week", content="OpenAI shipped a machine learning update"))
+    expected = (prefilter.ENTITY_WEIGHT + prefilter.AI_TERM_WEIGHT + prefilter.INDUSTRY_WEIGHT) * prefilter.CONTENT_FACTOR
+    assert score == expected
+    assert "OpenAI" in hits
+
+
+def test_acronyms_are_case_sensitive():
+    assert score_item(_item("Buying a GPU for gaming"))[0] == prefilter.ENTITY_WEIGHT
+    assert score_item(_item("The gpu of the ship"))[0] == 0
+
+
+def test_trusted_sources_match_exactly():
+    trusted = {"TechCrunch AI", "YouTube - Google for Developers"}
+    assert score_item(_item("Weekly recap", source="TechCrunch AI"), trusted)[0] == prefilter.TRUSTED_SOURCE_WEIGHT
+    assert score_item(_item("Weekly recap", source="TechCrunch"), trusted)[0] == 0
+    assert score_item(_item("Weekly recap", source="YouTube - Google"), trusted)[0] == 0
+
+
+def test_thresholds_split_items():
+    items = [
+        _item("The best Broadway musicals of the season"),                        # 0 → 丢弃
+        _item("OpenAI shows its roadmap"),                                        # 1.5 → LLM
+        _item("OpenAI launches a machine learning agent for Claude users"),      # ≥ 4 → 通过
+        _item("Weekly recap", source="TechCrunch AI"),                           # 来源加分 → LLM
+        _item("Best recipes for the holidays", source="TechCrunch AI"),          # 0 → 丢弃
+    ]
+    result = prefilter_items(items, CONFIG)
+    assert result.rejected == [items[0], items[4]]
+    assert result.ambiguous == [items[1], items[3]]
+    assert result.accepted == [items[2]]
+    assert items[2]["价值评估"].startswith(PREFILTER_ACCEPT_REASON)
+    assert "价值评估" not in items[1]
+    assert result.total == 5
+    assert "省去 60% 的价值评估调用" in result.summary()
+
+
+def test_boundaries_are_inclusive_for_accept_and_exclusive_for_reject():
+    item = _item("OpenAI shows its roadmap")   # 1.5
+    assert prefilter_items([item], {"reject_below": 1.5, "accept_at": 9}).ambiguous == [item]
+    assert prefilter_items([dict(item)], {"reject_below": 1.0, "accept_at": 1.5}).accepted
+    assert prefilter_items([dict(item)], {"reject_below": 1.6, "accept_at": 9}).rejected
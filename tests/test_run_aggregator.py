@@ -0,0 +1,48 @@
+"""合并上次结果：日期解析与按板块的时间窗口"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from run_aggregator import merge_previous_items, parse_item_date
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-10-18 08:30:00", datetime(2026, 10, 18, 8, 30)),
+    ("Sun Oct 18 08:30:00 +0800 2026", datetime(2026, 10, 18, 0, 30)),
+    ("2026-10-18T08:30:00Z", datetime(2026, 10, 18, 8, 30)),
+    ("2026-10-18T08:30:00.000+02:00", datetime(2026, 10, 18, 6, 30)),
+    ("", None),
+    ("yesterday", None),
+])
+def test_parse_item_date(value, expected):
+    assert parse_item_date(value) == expected
+
+
+def _item(link, section, hours_ago):
+    date = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return {"标题": link, "链接": link, "板块": section, "日期": date.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def test_merge_uses_each_section_window(tmp_path):
+    previous = [
+        _item("https://a/news-recent", "新闻", 10),
+        _item("https://a/news-old", "新闻", 30),
+        _item("https://a/video", "视频", 30),
+        _item("https://a/tweet", "社交媒体", 1),
+        _item("https://a/new", "新闻", 1),
+    ]
+    path = tmp_path / "news.json"
+    path.write_text(json.dumps(previous, ensure_ascii=False), encoding="utf-8")
+
+    new_items = [{"标题": "new", "链接": "https://a/new?utm_source=rss", "板块": "新闻"}]
+    merged = merge_previous_items(new_items, str(path), {"rss": 24, "youtube": 48})
+    # 推特未启用不再保留，同一链接以本次结果为准
+    assert [item["链接"] for item in merged] == [
+        "https://a/new?utm_source=rss", "https://a/news-recent", "https://a/video"
+    ]
+
+
+def test_merge_without_previous_file(tmp_path):
+    assert merge_previous_items([], str(tmp_path / "missing.json"), {"rss": 24}) == []
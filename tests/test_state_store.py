@@ -0,0 +1,124 @@
+"""持久化状态：暂存、提交、丢弃，条件请求校验值与增量水位"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from state_store import FeedValidatorCache, JsonStateStore, WatermarkStore
+
+URL = "https://example.com/feed.xml"
+
+
+def test_stage_takes_effect_on_commit(tmp_path):
+    path = tmp_path / "state.json"
+    store = JsonStateStore(path)
+    store.stage("a", 1)
+    assert store.get("a") is None
+    assert not path.exists()
+
+    store.commit()
+    assert store.get("a") == 1
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert JsonStateStore(path).get("a") == 1
+
+
+def test_discard_drops_pending_and_later_updates(tmp_path):
+    store = JsonStateStore(tmp_path / "state.json")
+    store.stage("a", 1)
+    store.stage("b", 1)
+    store.discard("a")
+    store.stage("a", 2)
+    store.commit()
+    assert store.get("a") is None
+    assert store.get("b") == 1
+
+
+def test_uncommitted_updates_are_not_saved(tmp_path):
+    path = tmp_path / "state.json"
+    store = JsonStateStore(path)
+    store.stage("a", 1)
+    store.commit()
+    store.stage("a", 2)
+    assert JsonStateStore(path).get("a") == 1
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert JsonStateStore(path).get("a") is None
+
+
+def test_validators_round_trip(tmp_path):
+    path = tmp_path / "validators.json"
+    cache = FeedValidatorCache(path)
+    assert cache.validators(URL) == (None, None)
+
+    cache.update(URL, '"etag-1"', "Sat, 17 Oct 2026 08:00:00 GMT")
+    assert cache.validators(URL) == (None, None)
+    cache.commit()
+    assert FeedValidatorCache(path).validators(URL) == ('"etag-1"', "Sat, 17 Oct 2026 08:00:00 GMT")
+
+
+def test_validators_without_values_are_not_recorded(tmp_path):
+    cache = FeedValidatorCache(tmp_path / "validators.json")
+    cache.update(URL, '"etag-1"', None)
+    cache.commit()
+    cache.update(URL, None, None)
+    cache.commit()
+    assert cache.validators(URL) == ('"etag-1"', None)
+
+
+def _hours_ago(hours):
+    return datetime.now(timezone.utc) - timedelta(hours=hours)
+
+
+def test_watermark_only_new_entries_after_commit(tmp_path):
+    path = tmp_path / "watermarks.json"
+    store = WatermarkStore(path)
+    assert store.is_new(URL, _hours_ago(1), "a")
+    store.observe(URL, _hours_ago(1), "a")
+    # 提交之前仍视为新条目（处理失败时下次重新抓取）
+    assert store.is_new(URL, _hours_ago(1), "a")
+    store.commit()
+
+    store = WatermarkStore(path)
+    assert not store.is_new(URL, _hours_ago(1), "a")
+    # 发布时间更早、但之前没有处理过的迟到条目仍会放行
+    assert store.is_new(URL, _hours_ago(5), "late")
+
+
+def test_watermark_full_window_ignores_seen(tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    store.observe(URL, _hours_ago(1), "a")
+    store.commit()
+    assert WatermarkStore(tmp_path / "watermarks.json", full_window=True).is_new(URL, _hours_ago(1), "a")
+
+
+def test_watermark_discarded_feed_not_advanced(tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.json")
+    store.observe(URL, _hours_ago(1), "a")
+    store.discard(URL)
+    store.observe(URL, _hours_ago(1), "b")
+    store.commit()
+    assert store.is_new(URL, _hours_ago(1), "a")
+    assert store.is_new(URL, _hours_ago(1), "b")
+
+
+def test_watermark_prunes_old_and_excess_ids(tmp_path, monkeypatch):
+    monkeypatch.setattr(WatermarkStore, "MAX_IDS", 3)
+    store = WatermarkStore(tmp_path / "watermarks.json", retention_hours=24)
+    store.observe(URL, _hours_ago(48), "old")
+    for index in range(5):
+        store.observe(URL, _hours_ago(index + 1), f"id{index}")
+    store.commit()
+    assert set(store.get(URL)["seen"]) == {"id0", "id1", "id2"}
+
+
+def test_watermark_reads_old_format(tmp_path):
+    path = tmp_path / "watermarks.json"
+    stamp = _hours_ago(1).strftime(WatermarkStore.TIME_FORMAT)
+    path.write_text(json.dumps({URL: {"published": stamp, "ids": ["a"]}}), encoding="utf-8")
+    store = WatermarkStore(path)
+    assert not store.is_new(URL, _hours_ago(1), "a")
+    store.observe(URL, _hours_ago(1), "b")
+    store.commit()
+    assert set(store.get(URL)["seen"]) == {"a", "b"}
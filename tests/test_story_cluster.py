@@ -0,0 +1,76 @@
+"""近似重复聚类：分词、MinHash 估计、聚类与结果扩展"""
+
+from story_cluster import (
+    ALSO_COVERED_KEY, CLUSTER_KEY, cluster_stories, expand_clusters, jaccard, minhash, tokenize,
+)
+
+
+def _item(title, link, source="S", section="新闻", content=""):
+    return {"标题": title, "链接": link, "来源": source, "板块": section, "内容": content}
+
+
+def test_tokenize_drops_stopwords_tags_and_splits_chinese():
+    assert tokenize("<b>The</b> OpenAI's new model") == {"openai's", "model"}
+    assert tokenize("谷歌发布") == {"谷歌", "歌发", "发布"}
+    assert tokenize("AI 芯") == {"ai", "芯"}
+
+
+def test_minhash_estimates_jaccard():
+    a = {f"w{i}" for i in range(100)}
+    b = {f"w{i}" for i in range(50, 150)}
+    sig_a, sig_b = minhash(a), minhash(b)
+    estimate = sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+    assert abs(estimate - jaccard(a, b)) < 0.15
+    assert minhash(a) == sig_a
+
+
+def test_same_story_from_different_sources_clusters():
+    items = [
+        _item("OpenAI releases GPT-5 model with better reasoning", "https://a/1", "The Verge AI"),
+        _item("Apple unveils new iPad lineup for schools", "https://a/2", "TechCrunch AI"),
+        _item("OpenAI releases GPT-5 model, promising better reasoning", "https://b/1", "TechCrunch AI"),
+    ]
+    clusters = cluster_stories(items)
+    assert [len(cluster.items) for cluster in clusters] == [2, 1]
+    story = clusters[0]
+    assert story.representative is items[0]
+    assert items[0][CLUSTER_KEY] == items[2][CLUSTER_KEY] == story.id
+    assert items[0][ALSO_COVERED_KEY] == [{"来源": "TechCrunch AI", "链接": "https://b/1"}]
+    assert CLUSTER_KEY not in items[1]
+
+
+def test_different_sections_and_short_titles_not_clustered():
+    items = [
+        _item("OpenAI releases GPT-5 model with better reasoning", "https://a/1", section="新闻"),
+        _item("OpenAI releases GPT-5 model with better reasoning", "https://a/2", section="视频"),
+        _item("AI news", "https://a/3"),
+        _item("AI news", "https://a/4"),
+    ]
+    assert [len(cluster.items) for cluster in cluster_stories(items)] == [1, 1, 1, 1]
+
+
+def test_unrelated_titles_with_shared_words_stay_apart():
+    items = [
+        _item("Google launches Gemini model for coding", "https://a/1"),
+        _item("Google cuts jobs in advertising division", "https://a/2"),
+    ]
+    assert len(cluster_stories(items)) == 2
+
+
+def test_expand_clusters_inherits_processed_fields():
+    items = [
+        _item("OpenAI releases GPT-5 model with better reasoning", "https://a/1", "Verge"),
+        _item("OpenAI releases GPT-5 model, promising better reasoning", "https://b/1", "TC"),
+        _item("Apple unveils new iPad lineup for schools", "https://a/2"),
+    ]
+    clusters = cluster_stories(items)
+    processed = [dict(clusters[0].representative, 标题="OpenAI 发布 GPT-5", 分类="产品发布")]
+    results = expand_clusters(processed, clusters)
+
+    assert [item["链接"] for item in results] == ["https://a/1", "https://b/1"]
+    member = results[1]
+    assert member["标题"] == "OpenAI 发布 GPT-5"
+    assert member["分类"] == "产品发布"
+    assert member["来源"] == "TC"
+    # 成员是副本，不修改原条目
+    assert items[1]["标题"].startswith("OpenAI releases")
@@ -0,0 +1,92 @@
+"""翻译记忆：精确与模糊查找、淘汰与保存"""
+
+import json
+
+import pytest
+
+from translation_memory import SEED_TRANSLATIONS, TranslationMemory, normalize_title
+
+TITLE = "Google will release Gemini to all users"
+TRANSLATION = "谷歌将向所有用户发布 Gemini"
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = TranslationMemory(path=tmp_path / "memory.json")
+    memory.store(TITLE, TRANSLATION)
+    return memory
+
+
+def test_normalize_title():
+    assert normalize_title("  It&#8217;s  “new” &amp; fast ") == 'It\'s "new" & fast'
+
+
+def test_exact_lookup_after_normalization(memory):
+    assert memory.lookup("Google  will release Gemini to all users ") == TRANSLATION
+    assert memory.hits == 1
+    assert memory.lookup("Something else entirely") is None
+    assert memory.misses == 1
+
+
+def test_seed_translations_available(tmp_path):
+    memory = TranslationMemory(path=tmp_path / "memory.json")
+    title, translation = next(iter(SEED_TRANSLATIONS.items()))
+    assert memory.lookup(title) == translation
+
+
+def test_untranslated_results_not_stored(memory):
+    memory.store("Same text", "Same text")
+    memory.store("Empty", "")
+    assert memory.lookup("Same text") is None
+    assert memory.lookup("Empty") is None
+
+
+def test_fuzzy_is_off_by_default(memory):
+    assert memory.lookup(TITLE + "!") is None
+
+
+@pytest.mark.parametrize("title", [
+    "Google will release Gemini to all users!",
+    "google will release gemini to all the users",
+])
+def test_fuzzy_matches_punctuation_case_and_stopwords(tmp_path, title):
+    memory = TranslationMemory(path=tmp_path / "memory.json", fuzzy=True)
+    memory.store(TITLE, TRANSLATION)
+    assert memory.lookup(title) == TRANSLATION
+    assert memory.fuzzy_hits == 1
+
+
+@pytest.mark.parametrize("title", [
+    "Google will not release Gemini to all users",
+    "Google will delay Gemini to all users",
+    "Google will release Gemini 2 to all users",
+])
+def test_fuzzy_requires_same_content_words(tmp_path, title):
+    memory = TranslationMemory(path=tmp_path / "memory.json", fuzzy=True)
+    memory.store(TITLE, TRANSLATION)
+    assert memory.lookup(title) is None
+
+
+def test_save_round_trip_and_eviction(tmp_path):
+    path = tmp_path / "memory.json"
+    memory = TranslationMemory(path=path, max_entries=len(SEED_TRANSLATIONS) + 1)
+    memory.store("Old title", "旧标题")
+    memory.store(TITLE, TRANSLATION)
+    memory.lookup(TITLE)
+    memory.save()
+
+    assert not path.with_suffix(".json.tmp").exists()
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert len(saved) == len(SEED_TRANSLATIONS) + 1
+    assert normalize_title(TITLE) in saved
+
+    reloaded = TranslationMemory(path=path)
+    assert reloaded.lookup(TITLE) == TRANSLATION
+
+
+def test_disabled_memory(tmp_path):
+    memory = TranslationMemory(path=tmp_path / "memory.json", enabled=False)
+    memory.store(TITLE, TRANSLATION)
+    assert memory.lookup(TITLE) is None
+    memory.save()
+    assert not (tmp_path / "memory.json").exists()
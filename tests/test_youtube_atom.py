@@ -0,0 +1,97 @@
+"""YouTube Atom 快速解析器：正常解析、截止时间与回退条件"""
+
+from datetime import datetime, timezone
+
+import feedparser
+
+from fetchers import _youtube_entries_from_feedparser
+from youtube_atom import CHUNK_SIZE, parse_youtube_feed
+
+HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+    'xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">'
+    '<title>Channel</title>'
+)
+
+
+def entry(video_id, published, views=1000, title=None, description="desc", link=True):
+    link_el = f'<link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>' if link else ""
+    return (
+        f"<entry><id>yt:video:{video_id}</id><yt:videoId>{video_id}</yt:videoId>"
+        f"<title>{title or 'Video ' + video_id}</title>{link_el}"
+        f"<published>{published}</published>"
+        f"<media:group><media:description>{description}</media:description>"
+        f'<media:community><media:statistics views="{views}"/></media:community></media:group>'
+        "</entry>"
+    )
+
+
+def feed(*entries):
+    return (HEADER + "".join(entries) + "</feed>").encode("utf-8")
+
+
+def test_parses_entries_in_order():
+    content = feed(
+        entry("aaa111", "2026-10-18T10:00:00+00:00", views=1500),
+        entry("bbb222", "2026-10-17T10:00:00+00:00"),
+    )
+    entries = parse_youtube_feed(content)
+    assert [e["id"] for e in entries] == ["yt:video:aaa111", "yt:video:bbb222"]
+    assert entries[0]["view_count"] == 1500
+    assert entries[0]["published"] == datetime(2026, 10, 18, 10, tzinfo=timezone.utc)
+    assert entries[0]["link"] == "https://www.youtube.com/watch?v=aaa111"
+
+
+def test_stops_at_cutoff_and_limit():
+    content = feed(
+        entry("aaa111", "2026-10-18T10:00:00+00:00"),
+        entry("bbb222", "2026-10-17T10:00:00+00:00"),
+        entry("ccc333", "2026-10-16T10:00:00+00:00"),
+    )
+    cutoff = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    assert len(parse_youtube_feed(content, cutoff=cutoff)) == 2
+    assert len(parse_youtube_feed(content, limit=1)) == 1
+
+
+def test_large_feed_across_chunks():
+    description = "x" * CHUNK_SIZE
+    content = feed(*(entry(f"vid{i:04d}", f"2026-10-{18 - i:02d}T10:00:00+00:00", description=description)
+                     for i in range(5)))
+    assert len(parse_youtube_feed(content)) == 5
+
+
+def test_empty_feed():
+    assert parse_youtube_feed(feed()) == []
+
+
+def test_fallback_conditions():
+    # 以下情况都返回 None，由调用方回退到 feedparser
+    assert parse_youtube_feed(b"<rss><channel></channel></rss>") is None
+    assert parse_youtube_feed(b"") is None
+    assert parse_youtube_feed(feed(entry("aaa111", "2026-10-18T10:00"))) is None           # 没有时区
+    assert parse_youtube_feed(feed(entry("aaa111", "not a date"))) is None
+    assert parse_youtube_feed(feed(entry("aaa111", "2026-10-18T10:00:00+00:00", link=False))) is None
+    assert parse_youtube_feed(feed(                                                          # 顺序异常
+        entry("aaa111", "2026-10-17T10:00:00+00:00"),
+        entry("bbb222", "2026-10-18T10:00:00+00:00"),
+    )) is None
+    assert parse_youtube_feed(HEADER.encode("utf-8") + b"<entry><title>broken") is None   # 截断
+
+
+def test_bad_view_count_is_zero():
+    content = feed(entry("aaa111", "2026-10-18T10:00:00+00:00", views="n/a"))
+    assert parse_youtube_feed(content)[0]["view_count"] == 0
+
+
+def test_feedparser_fallback_matches_fast_parser():
+    content = feed(
+        entry("aaa111", "2026-10-18T10:00:00+00:00", views=1500),
+        entry("bbb222", "2026-10-17T10:00:00+00:00", views=20),
+        entry("ccc333", "2026-10-15T10:00:00+00:00"),
+    )
+    cutoff = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    fast = parse_youtube_feed(content, cutoff=cutoff, limit=10)
+    slow = _youtube_entries_from_feedparser(feedparser.parse(content), cutoff, limit=10)
+    keys = ("id", "title", "link", "published", "view_count")
+    assert [[e[k] for k in keys] for e in slow] == [[e[k] for k in keys] for e in fast]